@@ -0,0 +1,199 @@
+########################
+# Async Calculator      #
+########################
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+import logging
+from typing import Any, Callable, List, Optional, TypeVar, Union
+
+from app.calculation import Calculation
+from app.calculator import CalculationResult, Calculator, Number
+from app.calculator_config import CalculatorConfig
+from app.exception import ConfigurationError
+from app.history import AsyncHistoryObserver, HistoryObserver
+from app.operations import Operation
+
+T = TypeVar('T')
+
+
+class AsyncCalculator:
+    """
+    asyncio facade for a Calculator.
+
+    Wraps a thread-safe Calculator for use inside an event loop. Calculations
+    and persistence run in an executor, so file I/O and blocking observers never
+    stall the loop. Coroutine observers (AsyncHistoryObserver) are awaited on
+    the loop after each calculation.
+
+    Concurrent save_history calls are coalesced: while a save is running, later
+    callers share a single follow-up save instead of queueing one each, and
+    calculations are not blocked while it writes.
+    """
+
+    def __init__(
+        self,
+        calculator: Optional[Calculator] = None,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the facade.
+
+        Args:
+            calculator (Optional[Calculator], optional): The calculator to wrap. Its
+                configuration must enable thread_safe. Defaults to a new thread-safe
+                Calculator.
+            executor (Optional[Executor], optional): Executor for blocking work. Defaults
+                to a thread pool owned (and shut down) by this facade.
+
+        Raises:
+            ConfigurationError: If the calculator is not thread-safe.
+        """
+        if calculator is None:
+            calculator = Calculator(CalculatorConfig(thread_safe=True))
+        if not calculator.config.thread_safe:
+            raise ConfigurationError("AsyncCalculator requires a thread_safe calculator")
+        self.calculator = calculator
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(thread_name_prefix="async-calculator")
+        self.observers: List[AsyncHistoryObserver] = []
+        # Save coalescing: the save currently writing and the one waiting behind it
+        self._running_save: Optional[asyncio.Future] = None
+        self._pending_save: Optional[asyncio.Future] = None
+
+    async def __aenter__(self) -> 'AsyncCalculator':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the executor if this facade created it."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking call in the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    def add_observer(self, observer: Union[HistoryObserver, AsyncHistoryObserver]) -> None:
+        """
+        Register an observer.
+
+        Coroutine observers are awaited by this facade; plain observers are
+        registered on the wrapped calculator and called from the executor.
+
+        Args:
+            observer (Union[HistoryObserver, AsyncHistoryObserver]): The observer to add.
+        """
+        if isinstance(observer, AsyncHistoryObserver):
+            self.observers = self.observers + [observer]
+            logging.info(f"Added async observer: {observer.__class__.__name__}")
+        else:
+            self.calculator.add_observer(observer)
+
+    def remove_observer(self, observer: Union[HistoryObserver, AsyncHistoryObserver]) -> None:
+        """
+        Remove an observer.
+
+        Args:
+            observer (Union[HistoryObserver, AsyncHistoryObserver]): The observer to remove.
+        """
+        if isinstance(observer, AsyncHistoryObserver):
+            observers = list(self.observers)
+            observers.remove(observer)
+            self.observers = observers
+            logging.info(f"Removed async observer: {observer.__class__.__name__}")
+        else:
+            self.calculator.remove_observer(observer)
+
+    async def notify_observers(self, calculation: Calculation) -> None:
+        """
+        Await every coroutine observer for a new calculation, concurrently.
+
+        Args:
+            calculation (Calculation): The latest calculation performed.
+        """
+        await asyncio.gather(*(observer.update(calculation) for observer in self.observers))
+
+    async def perform_operation(
+        self,
+        a: Union[str, Number],
+        b: Union[str, Number],
+        *,
+        operation: Optional[Union[str, Operation]] = None
+    ) -> CalculationResult:
+        """
+        Perform a calculation.
+
+        Takes the same arguments as Calculator.perform_operation: the operands,
+        computed with the current strategy unless an operation is passed.
+        Concurrent callers should pass the operation explicitly.
+
+        Returns:
+            CalculationResult: The result of the calculation.
+
+        Raises:
+            OperationError: If the operation is missing, unknown or fails.
+            ValidationError: If input validation fails.
+        """
+        calculation = await self._run(
+            partial(self.calculator.perform_calculation, operation=operation), a, b
+        )
+        if self.observers:
+            await self.notify_observers(calculation)
+        return calculation.result
+
+    async def save_history(self) -> None:
+        """
+        Save the calculation history without blocking the event loop.
+
+        Raises:
+            OperationError: If saving the history fails.
+        """
+        if self._pending_save is None:
+            self._pending_save = asyncio.ensure_future(self._save_after(self._running_save))
+        # Shield the shared save from the cancellation of one caller
+        await asyncio.shield(self._pending_save)
+
+    async def _save_after(self, previous: Optional[asyncio.Future]) -> None:
+        """Wait for the running save to finish, then take a fresh snapshot and save it."""
+        if previous is not None:
+            await asyncio.wait([previous])
+        # Callers arriving from now on need a save that starts after this snapshot
+        self._pending_save = None
+        running = self._running_save = asyncio.ensure_future(self._run(self.calculator.save_history))
+        try:
+            await running
+        finally:
+            if self._running_save is running:
+                self._running_save = None
+
+    async def load_history(self) -> None:
+        """
+        Load the calculation history without blocking the event loop.
+
+        Raises:
+            OperationError: If loading the history fails.
+        """
+        await self._run(self.calculator.load_history)
+
+    async def undo(self) -> bool:
+        """
+        Undo the last operation.
+
+        Returns:
+            bool: True if an operation was undone, False if there was nothing to undo.
+        """
+        return await self._run(self.calculator.undo)
+
+    async def redo(self) -> bool:
+        """
+        Redo the previously undone operation.
+
+        Returns:
+            bool: True if an operation was redone, False if there was nothing to redo.
+        """
+        return await self._run(self.calculator.redo)
@@ -0,0 +1,231 @@
+########################
+# Bulk CSV Computation  #
+########################
+
+from dataclasses import dataclass
+from decimal import Decimal, localcontext
+import csv
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from app.calculation import Calculation
+from app.calculator_config import CalculatorConfig
+from app.exception import ValidationError
+from app.input_validators import InputValidator
+from app.operations import OperationFactory
+
+# Columns read from the input file and written to the output file
+BULK_INPUT_COLUMNS = ['operation', 'operand1', 'operand2']
+BULK_OUTPUT_COLUMNS = BULK_INPUT_COLUMNS + ['result', 'error']
+
+# Per-row outcome: the result, or None and the error message
+RowOutcome = Tuple[Optional[Decimal], Optional[str]]
+
+
+@dataclass
+class BulkSummary:
+    """Row counts of a bulk computation."""
+
+    rows: int = 0
+    errors: int = 0
+
+
+def compute_rows(
+    rows: Sequence[Sequence[str]],
+    config: CalculatorConfig
+) -> List[RowOutcome]:
+    """
+    Compute a chunk of operation,operand1,operand2 rows.
+
+    Operation names are resolved in one OperationFactory.resolve_many pass,
+    rows are grouped by operation and each group is executed in one
+    execute_many pass, all in the configuration's Decimal context. Rows that
+    fail validation or execution get an error message instead of a result,
+    without affecting the other rows.
+
+    Args:
+        rows (Sequence[Sequence[str]]): Rows of operation name (e.g. 'add') and two operands.
+        config (CalculatorConfig): Configuration used to validate operands.
+
+    Returns:
+        List[RowOutcome]: One (result, error) pair per row, in input order.
+    """
+    with localcontext(config.decimal_context()):
+        return _compute(rows, config, record=False)[0]
+
+
+def compute_calculations(
+    rows: Sequence[Sequence[str]],
+    config: CalculatorConfig
+) -> Tuple[List[RowOutcome], List[Calculation]]:
+    """
+    Compute a chunk of rows and build a Calculation for every successful row.
+
+    Same as compute_rows, but also returns the calculations so they can be
+    recorded in a Calculator history.
+
+    Args:
+        rows (Sequence[Sequence[str]]): Rows of operation name (e.g. 'add') and two operands.
+        config (CalculatorConfig): Configuration used to validate operands.
+
+    Returns:
+        Tuple[List[RowOutcome], List[Calculation]]: One (result, error) pair per row and
+            the successful calculations, both in input order.
+    """
+    with localcontext(config.decimal_context()):
+        return _compute(rows, config, record=True)
+
+
+def _compute(
+    rows: Sequence[Sequence[str]],
+    config: CalculatorConfig,
+    record: bool
+) -> Tuple[List[RowOutcome], List[Calculation]]:
+    """Compute rows, building Calculation objects only when record is set."""
+    outcomes: List[RowOutcome] = [(None, None)] * len(rows)
+    calculations: List[Optional[Calculation]] = [None] * len(rows) if record else []
+    names = [row[0].strip() if row else '' for row in rows]
+    codes, operations = OperationFactory.resolve_many(names)
+
+    # Rows with the right shape and a known operation, whose operands are
+    # then validated a column at a time
+    candidates: List[int] = []
+    for i, (row, code) in enumerate(zip(rows, codes)):
+        if len(row) != len(BULK_INPUT_COLUMNS):
+            outcomes[i] = (None, f"Expected {len(BULK_INPUT_COLUMNS)} fields, got {len(row)}")
+        elif code < 0:
+            outcomes[i] = (None, f"Unknown operation: {names[i]}")
+        else:
+            candidates.append(i)
+    a_column = InputValidator.validate_many([rows[i][1] for i in candidates], config)
+    b_column = InputValidator.validate_many([rows[i][2] for i in candidates], config)
+
+    # Row indices and validated operands, grouped by operation code
+    groups: Dict[int, Tuple[List[int], List[Decimal], List[Decimal]]] = {}
+    for i, a, b, a_error, b_error in zip(
+        candidates, a_column.values, b_column.values, a_column.errors, b_column.errors
+    ):
+        if a_error is not None or b_error is not None:
+            outcomes[i] = (None, a_error or b_error)
+            continue
+        indices, a_values, b_values = groups.setdefault(codes[i], ([], [], []))
+        indices.append(i)
+        a_values.append(a)
+        b_values.append(b)
+
+    for code, (indices, a_values, b_values) in groups.items():
+        operation = operations[code]
+        results, errors = operation.execute_many(a_values, b_values)
+        for i, result, error in zip(indices, results, errors):
+            outcomes[i] = (result, error)
+        if record:
+            operation_name = str(operation)
+            for i, a, b, result, error in zip(indices, a_values, b_values, results, errors):
+                if error is None:
+                    calculations[i] = Calculation(
+                        operation=operation_name, operand1=a, operand2=b, result=result
+                    )
+    return outcomes, [calc for calc in calculations if calc is not None]
+
+
+def chunk_rows(rows: Iterable[Sequence[str]], chunk_size: int) -> Iterator[List[Sequence[str]]]:
+    """
+    Split rows into lists of at most chunk_size rows.
+
+    Args:
+        rows (Iterable[Sequence[str]]): The rows to split.
+        chunk_size (int): Maximum rows per chunk.
+
+    Yields:
+        List[Sequence[str]]: The next chunk.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_bulk_rows(source: TextIO) -> Iterator[List[str]]:
+    """
+    Read the rows of a bulk input CSV, skipping blank lines.
+
+    Args:
+        source (TextIO): Input CSV with an operation,operand1,operand2 header.
+
+    Returns:
+        Iterator[List[str]]: The rows after the header.
+
+    Raises:
+        ValidationError: If the input header does not have the expected columns.
+    """
+    reader = csv.reader(source)
+    header = [column.strip() for column in next(reader, [])]
+    if header != BULK_INPUT_COLUMNS:
+        raise ValidationError(
+            f"Expected CSV header {','.join(BULK_INPUT_COLUMNS)}, got: {','.join(header)}"
+        )
+    return filter(None, reader)
+
+
+def write_bulk_chunk(
+    writer: Any,
+    chunk: Sequence[Sequence[str]],
+    outcomes: Sequence[RowOutcome],
+    summary: BulkSummary
+) -> None:
+    """
+    Write a computed chunk to the bulk output CSV and count it in the summary.
+
+    Args:
+        writer (Any): csv.writer for the output stream.
+        chunk (Sequence[Sequence[str]]): The input rows.
+        outcomes (Sequence[RowOutcome]): One (result, error) pair per row.
+        summary (BulkSummary): Running totals to update.
+    """
+    writer.writerows(
+        list(row) + ['' if result is None else str(result), error or '']
+        for row, (result, error) in zip(chunk, outcomes)
+    )
+    summary.rows += len(chunk)
+    summary.errors += sum(1 for _, error in outcomes if error is not None)
+
+
+def compute_csv(
+    source: TextIO,
+    destination: TextIO,
+    config: Optional[CalculatorConfig] = None,
+    chunk_size: Optional[int] = None
+) -> BulkSummary:
+    """
+    Compute a CSV file of operation,operand1,operand2 rows.
+
+    The input is read, computed and written chunk by chunk, so memory use
+    depends on the chunk size and not on the file size. The output repeats the
+    input columns and adds a result column and an error column. Failed rows
+    have an empty result and the ValidationError or OperationError message
+    as their error.
+
+    Args:
+        source (TextIO): Input CSV with an operation,operand1,operand2 header.
+        destination (TextIO): Output CSV stream.
+        config (Optional[CalculatorConfig], optional): Configuration used to validate
+            operands. Defaults to a new CalculatorConfig.
+        chunk_size (Optional[int], optional): Rows per chunk. Defaults to the
+            bulk_chunk_size configuration setting.
+
+    Returns:
+        BulkSummary: Number of rows computed and number of failed rows.
+
+    Raises:
+        ValidationError: If the input header does not have the expected columns.
+    """
+    config = config or CalculatorConfig()
+    rows = read_bulk_rows(source)
+    writer = csv.writer(destination)
+    writer.writerow(BULK_OUTPUT_COLUMNS)
+    summary = BulkSummary()
+    for chunk in chunk_rows(rows, chunk_size or config.bulk_chunk_size):
+        write_bulk_chunk(writer, chunk, compute_rows(chunk, config), summary)
+    return summary
@@ -6,13 +6,17 @@ from dataclasses import dataclass, field
 import datetime
 from decimal import Decimal, InvalidOperation
 import logging
-from typing import Any, Dict
+from fractions import Fraction
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
-from app.exception import OperationError
+from app.exception import OperationError, ValidationError
+from app.operations import OperationFactory
 
+if TYPE_CHECKING:
+    from app.result_cache import ResultCache
 
 
-@dataclass
+@dataclass(slots=True)
 class Calculation:
     """
     Value Object representing a single calculation.
@@ -21,6 +25,9 @@ class Calculation:
     operation performed, operands involved, the result, and the timestamp of the
     calculation. It provides methods for performing the calculation, serializing
     the data for storage, and deserializing data to recreate a Calculation instance.
+
+    Instances use __slots__ instead of a per-instance __dict__ to keep large
+    histories small in memory.
     """
 
     # Required fields
@@ -29,7 +36,7 @@ class Calculation:
     operand2: Decimal       # The second operand in the calculation
 
     # Fields with default values
-    result: Decimal = field(init=False)  # The result of the calculation, computed post-initialization
+    result: Optional[Decimal] = None  # The result of the calculation, computed post-initialization unless precomputed
     timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)  # Time when the calculation was performed
 
     def __post_init__(self):
@@ -37,17 +44,24 @@ class Calculation:
         Post-initialization processing.
 
         Automatically calculates the result of the operation after the Calculation
-        instance is created.
+        instance is created, unless a precomputed result was supplied (e.g. by
+        the Operation strategy that already executed it).
         """
-        self.result = self.calculate()
+        if self.result is None:
+            self.result = self.calculate()
 
-    def calculate(self) -> Decimal:
+    def calculate(self, cache: Optional['ResultCache'] = None) -> Decimal:
         """
         Execute calculation using the specified operation.
 
-        Utilizes a dictionary to map operation names to their corresponding
-        lambda functions, enabling dynamic execution of operations based on
-        the operation name.
+        Runs the shared Operation instance registered under the operation's
+        class name (including plugins added through
+        OperationFactory.register_operation), so operands are checked exactly
+        as Operation.execute checks them.
+
+        Args:
+            cache (Optional[ResultCache], optional): Result cache to consult before
+                computing and to fill afterwards. Defaults to None.
 
         Returns:
             Decimal: The result of the calculation.
@@ -55,71 +69,30 @@ class Calculation:
         Raises:
             OperationError: If the operation is unknown or the calculation fails.
         """
-        # Mapping of operation names to their corresponding functions
-        operations = {
-            "Addition": lambda x, y: x + y,
-            "Subtraction": lambda x, y: x - y,
-            "Multiplication": lambda x, y: x * y,
-            "Division": lambda x, y: x / y if y != 0 else self._raise_div_zero(),
-            "Power": lambda x, y: Decimal(pow(float(x), float(y))) if y >= 0 else self._raise_neg_power(),
-            "Root": lambda x, y: (
-                Decimal(pow(float(x), 1 / float(y))) 
-                if x >= 0 and y != 0 
-                else self._raise_invalid_root(x, y)
-            ),
-            "Modulus": lambda x, y: x % y if y != 0 else self._raise_div_zero(),
-            "Int_Division": lambda x, y: x // y if y != 0 else self._raise_div_zero(),
-            "Percent": lambda x, y: (x / y) * Decimal(100) if y != 0 else self._raise_div_zero(),
-            "AbsoluteDifference": lambda x, y: abs(x - y),
-        }
+        if cache is not None:
+            cached = cache.get(self.operation, self.operand1, self.operand2)
+            if cached is not None:
+                return cached
 
-        # Retrieve the operation function based on the operation name
-        op = operations.get(self.operation)
-        if not op:
+        # Retrieve the operation based on the operation name
+        try:
+            operation = OperationFactory.operation_for(self.operation)
+        except ValueError:
             raise OperationError(f"Unknown operation: {self.operation}")
 
         try:
             # Execute the operation with the provided operands
-            return op(self.operand1, self.operand2)
+            result = operation.execute(self.operand1, self.operand2)
+        except ValidationError as e:
+            # Invalid operands, reported with the operation's own message
+            raise OperationError(str(e)) from e
         except (InvalidOperation, ValueError, ArithmeticError) as e:
             # Handle any errors that occur during calculation
             raise OperationError(f"Calculation failed: {str(e)}")
 
-    @staticmethod
-    def _raise_div_zero():  # pragma: no cover
-        """
-        Helper method to raise division by zero error.
-
-        This method is called when a division by zero is attempted.
-        """
-        raise OperationError("Division by zero is not allowed")
-
-    @staticmethod
-    def _raise_neg_power():  # pragma: no cover
-        """
-        Helper method to raise negative power error.
-
-        This method is called when a negative exponent is used in a power operation.
-        """
-        raise OperationError("Negative exponents are not supported")
-
-    @staticmethod
-    def _raise_invalid_root(x: Decimal, y: Decimal):  # pragma: no cover
-        """
-        Helper method to raise invalid root error.
-
-        This method is called when an invalid root operation is attempted, such as
-        taking the root of a negative number or using zero as the root degree.
-
-        Args:
-            x (Decimal): The number from which the root is taken.
-            y (Decimal): The degree of the root.
-        """
-        if y == 0:
-            raise OperationError("Zero root is undefined")
-        if x < 0:
-            raise OperationError("Cannot calculate root of negative number")
-        raise OperationError("Invalid root operation")
+        if cache is not None:
+            cache.put(self.operation, self.operand1, self.operand2, result)
+        return result
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -140,15 +113,32 @@ class Calculation:
         }
 
     @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'Calculation':
+    def from_dict(
+        data: Dict[str, Any],
+        lazy: bool = False,
+        parse: Callable[[str], Any] = Decimal,
+        cache: Optional['ResultCache'] = None
+    ) -> 'Calculation':
         """
         Create calculation from dictionary.
 
         This method reconstructs a Calculation instance from a dictionary, ensuring
         that all required fields are present and correctly formatted.
 
+        By default the result is recomputed and compared with the saved one. In lazy
+        mode the saved result is trusted as-is, so rehydrating history costs no
+        arithmetic; call verify() to recompute it on demand. A result cache, when
+        given, is used for the recomputation, so repeated calculations in the
+        history are computed once and the cache is warmed as a side effect.
+
         Args:
             data (Dict[str, Any]): Dictionary containing calculation data.
+            lazy (bool, optional): Trust the persisted result instead of recomputing it.
+                Defaults to False.
+            parse (Callable[[str], Any], optional): Converts persisted numbers, e.g. the
+                parse method of a numeric backend. Defaults to Decimal.
+            cache (Optional[ResultCache], optional): Result cache used to recompute the
+                result; ignored in lazy mode. Defaults to None.
 
         Returns:
             Calculation: A new instance of Calculation with data populated from the dictionary.
@@ -157,18 +147,30 @@ class Calculation:
             OperationError: If data is invalid or missing required fields.
         """
         try:
-            # Create the calculation object with the original operands
+            saved_result = parse(data['result'])
+
+            if lazy:
+                # Trust the persisted result; it is only recomputed by verify()
+                return Calculation(
+                    operation=data['operation'],
+                    operand1=parse(data['operand1']),
+                    operand2=parse(data['operand2']),
+                    result=saved_result,
+                    timestamp=datetime.datetime.fromisoformat(data['timestamp'])
+                )
+
+            # Create the calculation object with the original operands and
+            # the saved data, then recompute its result through the cache
             calc = Calculation(
                 operation=data['operation'],
-                operand1=Decimal(data['operand1']),
-                operand2=Decimal(data['operand2'])
+                operand1=parse(data['operand1']),
+                operand2=parse(data['operand2']),
+                result=saved_result,
+                timestamp=datetime.datetime.fromisoformat(data['timestamp'])
             )
-
-            # Set the timestamp from the saved data
-            calc.timestamp = datetime.datetime.fromisoformat(data['timestamp'])
+            calc.result = calc.calculate(cache)
 
             # Verify the result matches (helps catch data corruption)
-            saved_result = Decimal(data['result'])
             if calc.result != saved_result:
                 logging.warning(
                     f"Loaded calculation result {saved_result} "
@@ -180,6 +182,29 @@ class Calculation:
         except (KeyError, InvalidOperation, ValueError) as e:
             raise OperationError(f"Invalid calculation data: {str(e)}")
 
+    def verify(self) -> bool:
+        """
+        Recompute the result and check it against the stored one.
+
+        Used to validate calculations loaded lazily, whose result was taken from
+        persisted data without being recomputed.
+
+        Returns:
+            bool: True if the recomputed result matches, False otherwise.
+        """
+        try:
+            computed = self.calculate()
+        except OperationError as e:
+            logging.warning(f"Could not verify calculation {self.operation}: {e}")
+            return False
+        if computed != self.result:
+            logging.warning(
+                f"Loaded calculation result {self.result} "
+                f"differs from computed result {computed}"
+            )
+            return False
+        return True
+
     def __str__(self) -> str:
         """
         Return string representation of calculation.
@@ -245,9 +270,14 @@ class Calculation:
         Returns:
             str: Formatted string representation of the result.
         """
+        result = self.result
+        if isinstance(result, Fraction):
+            result = Decimal(result.numerator) / Decimal(result.denominator)
+        elif not isinstance(result, Decimal):
+            result = Decimal(str(result))
         try:
             # Remove trailing zeros and format to specified precision
-            return str(self.result.normalize().quantize(
+            return str(result.normalize().quantize(
                 Decimal('0.' + '0' * precision)
             ).normalize())
         except InvalidOperation:  # pragma: no cover
@@ -2,27 +2,102 @@
 # Calculator Class      #
 ########################
 
-from decimal import Decimal
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass
+from decimal import Decimal, localcontext
+import csv
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-import pandas as pd
+import random
+import threading
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, Iterable, List, Optional, Sequence, Union
 
 from app.calculation import Calculation
 from app.calculator_config import CalculatorConfig
 from app.calculator_memento import CalculatorMemento
 from app.exception import OperationError, ValidationError
-from app.history import HistoryObserver
+from app.history import CalculationHistory, ColumnarHistory, HistoryObserver
+from app.history_store import HistoryChange, SQLiteHistoryStore
 from app.input_validators import InputValidator
-from app.operations import Operation
+from app.numeric_backend import get_backend
+from app.operations import Operation, OperationFactory
+from app.result_cache import ResultCache
+
+if TYPE_CHECKING:
+    # pandas takes a third of a second to import, so it is only loaded by the
+    # code paths that need it
+    import pandas as pd
+
+# Column layout of the history CSV file
+HISTORY_COLUMNS = ['operation', 'operand1', 'operand2', 'result', 'timestamp']
+
+# History files up to this size are read with the csv module; larger ones use
+# pandas, whose C parser outweighs its import cost from about 10 MB
+CSV_MODULE_MAX_BYTES = 8 * 1024 * 1024
 
 # Type aliases for better readability
 Number = Union[int, float, Decimal]
 CalculationResult = Union[Number, str]
 
 
+def setup_environment(config: CalculatorConfig) -> None:
+    """
+    Create the log and history directories and configure logging.
+
+    Sets up logging to the configured log file with a specified format and log
+    level, replacing any existing logging configuration.
+
+    Args:
+        config (CalculatorConfig): Configuration giving the directories and log file.
+    """
+    try:
+        # Ensure the log directory exists
+        os.makedirs(config.log_dir, exist_ok=True)
+        log_file = config.log_file.resolve()
+
+        # Configure the basic logging settings
+        logging.basicConfig(
+            filename=str(log_file),
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            force=True  # Overwrite any existing logging configuration
+        )
+        logging.info(f"Logging initialized at: {log_file}")
+    except Exception as e:
+        # Print an error message and re-raise the exception if logging setup fails
+        print(f"Error setting up logging: {e}")
+        raise
+
+    # Create required directories for history management
+    config.history_dir.mkdir(parents=True, exist_ok=True)
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of a batch calculation.
+
+    Holds one entry per input row. Failed rows have a None result, a True
+    error mask entry and the error message that caused the failure.
+    """
+
+    results: List[Optional[Decimal]]  # Result per row, None where the row failed
+    error_mask: List[bool]            # True where the row failed
+    errors: List[Optional[str]]       # Error message per row, None where the row succeeded
+
+    @property
+    def error_count(self) -> int:
+        """
+        Number of rows that failed.
+
+        Returns:
+            int: Count of True entries in the error mask.
+        """
+        return sum(self.error_mask)
+
+
 class Calculator:
     """
     Main calculator class implementing multiple design patterns.
@@ -31,15 +106,31 @@ class Calculator:
     calculation history, observers, configuration settings, and data persistence.
     It integrates various design patterns to enhance flexibility, maintainability, and
     scalability.
+
+    With the thread_safe configuration setting, one instance can be shared by many
+    threads. History, undo and redo state is guarded by a state lock that is only
+    held while that state changes: validation, arithmetic, file I/O and observer
+    notifications run outside it. Persistence is serialized by a separate I/O lock,
+    which is always taken before the state lock. Threads should pass the operation
+    to perform_operation(a, b, operation=...) rather than share set_operation state.
     """
 
-    def __init__(self, config: Optional[CalculatorConfig] = None):
+    def __init__(
+        self,
+        config: Optional[CalculatorConfig] = None,
+        load_existing: bool = True,
+        setup: bool = True
+    ):
         """
         Initialize calculator with configuration.
 
         Args:
             config (Optional[CalculatorConfig], optional): Configuration settings for the calculator.
                 If not provided, default settings are loaded based on environment variables.
+            load_existing (bool, optional): Load the persisted history on start. Defaults to True.
+            setup (bool, optional): Run setup_environment for the configuration. Applications
+                creating many calculators from one configuration run it once and pass False.
+                Defaults to True.
         """
         if config is None:
             # Determine the project root directory if no configuration is provided
@@ -51,14 +142,28 @@ class Calculator:
         self.config = config
         self.config.validate()
 
-        # Ensure that the log directory exists
-        os.makedirs(self.config.log_dir, exist_ok=True)
-
-        # Set up the logging system
-        self._setup_logging()
-
-        # Initialize calculation history and operation strategy
-        self.history: List[Calculation] = []
+        if setup:
+            # Create the log and history directories and set up the logging system
+            setup_environment(self.config)
+
+        # Decimal context of this calculator's arithmetic, applied as a local
+        # (thread-local) context so calculators with different settings
+        # never share the global one
+        self.decimal_context = self.config.decimal_context()
+
+        # Locks for thread-safe mode; without it they are no-op context managers
+        self._state_lock: ContextManager[Any] = (
+            threading.RLock() if self.config.thread_safe else nullcontext()
+        )
+        self._io_lock: ContextManager[Any] = (
+            threading.RLock() if self.config.thread_safe else nullcontext()
+        )
+        self._observers_lock: ContextManager[Any] = (
+            threading.Lock() if self.config.thread_safe else nullcontext()
+        )
+
+        # Initialize bounded calculation history and operation strategy
+        self.history = self._new_history()
         self.operation_strategy: Optional[Operation] = None
 
         # Initialize observer list for the Observer pattern
@@ -68,50 +173,62 @@ class Calculator:
         self.undo_stack: List[CalculatorMemento] = []
         self.redo_stack: List[CalculatorMemento] = []
 
-        # Create required directories for history management
-        self._setup_directories()
-
-        try:
-            # Attempt to load existing calculation history from file
-            self.load_history()
-        except Exception as e:
-            # Log a warning if history could not be loaded
-            logging.warning(f"Could not load existing history: {e}")
+        # Optional LRU cache of operation results
+        self.result_cache: Optional[ResultCache] = (
+            ResultCache(
+                self.config.result_cache_size,
+                # The integrity check of lazily loaded history warms it from a thread
+                thread_safe=self.config.thread_safe or self.config.lazy_load
+            )
+            if self.config.result_cache_size > 0 else None
+        )
+
+        # Background integrity check for lazily loaded history
+        self._integrity_thread: Optional[threading.Thread] = None
+
+        # Append-mode bookkeeping: rows appended since the file was last
+        # rewritten, and whether the file no longer matches the history
+        self._rows_since_compaction = 0
+        self._history_file_stale = False
+
+        # SQLite backend: the database holds the full history and receives
+        # the journal of changes made since the last save
+        self._history_store: Optional[SQLiteHistoryStore] = None
+        self._journal: List[HistoryChange] = []
+        self._journal_lock = threading.Lock()
+        if self.config.history_backend == 'sqlite':
+            self._history_store = SQLiteHistoryStore(self.config.history_db_file)
+
+        if load_existing:
+            try:
+                # Attempt to load existing calculation history from file
+                self.load_history()
+            except Exception as e:
+                # Log a warning if history could not be loaded
+                logging.warning(f"Could not load existing history: {e}")
 
         # Log the successful initialization of the calculator
         logging.info("Calculator initialized with configuration")
 
-    def _setup_logging(self) -> None:
+    def _new_history(
+        self,
+        calculations: Iterable[Calculation] = ()
+    ) -> Union[CalculationHistory, ColumnarHistory]:
         """
-        Configure the logging system.
+        Create an empty or pre-filled history container.
 
-        Sets up logging to a file with a specified format and log level.
-        """
-        try:
-            # Ensure the log directory exists
-            os.makedirs(self.config.log_dir, exist_ok=True)
-            log_file = self.config.log_file.resolve()
-
-            # Configure the basic logging settings
-            logging.basicConfig(
-                filename=str(log_file),
-                level=logging.INFO,
-                format='%(asctime)s - %(levelname)s - %(message)s',
-                force=True  # Overwrite any existing logging configuration
-            )
-            logging.info(f"Logging initialized at: {log_file}")
-        except Exception as e:
-            # Print an error message and re-raise the exception if logging setup fails
-            print(f"Error setting up logging: {e}")
-            raise
+        Uses the compact ColumnarHistory when history_storage is 'columnar' and
+        CalculationHistory otherwise.
 
-    def _setup_directories(self) -> None:
-        """
-        Create required directories.
+        Args:
+            calculations (Iterable[Calculation], optional): Initial entries. Defaults to ().
 
-        Ensures that all necessary directories for history management exist.
+        Returns:
+            Union[CalculationHistory, ColumnarHistory]: The bounded history.
         """
-        self.config.history_dir.mkdir(parents=True, exist_ok=True)
+        if self.config.history_storage == 'columnar':
+            return ColumnarHistory(self.config.max_history_size, calculations)
+        return CalculationHistory(self.config.max_history_size, calculations)
 
     def add_observer(self, observer: HistoryObserver) -> None:
         """
@@ -123,7 +240,9 @@ class Calculator:
         Args:
             observer (HistoryObserver): The observer to be added.
         """
-        self.observers.append(observer)
+        with self._observers_lock:
+            # Copy on write, so notifications can iterate without the lock
+            self.observers = self.observers + [observer]
         logging.info(f"Added observer: {observer.__class__.__name__}")
 
     def remove_observer(self, observer: HistoryObserver) -> None:
@@ -135,7 +254,10 @@ class Calculator:
         Args:
             observer (HistoryObserver): The observer to be removed.
         """
-        self.observers.remove(observer)
+        with self._observers_lock:
+            observers = list(self.observers)
+            observers.remove(observer)
+            self.observers = observers
         logging.info(f"Removed observer: {observer.__class__.__name__}")
 
     def notify_observers(self, calculation: Calculation) -> None:
@@ -151,6 +273,19 @@ class Calculator:
         for observer in self.observers:
             observer.update(calculation)
 
+    def notify_observers_batch(self, calculations: List[Calculation]) -> None:
+        """
+        Notify all observers of a batch of new calculations.
+
+        Each observer is called once with the whole batch rather than once per
+        calculation.
+
+        Args:
+            calculations (List[Calculation]): The calculations performed in the batch.
+        """
+        for observer in self.observers:
+            observer.update_batch(calculations)
+
     def set_operation(self, operation: Operation) -> None:
         """
         Set the current operation strategy.
@@ -168,60 +303,111 @@ class Calculator:
     def perform_operation(
         self,
         a: Union[str, Number],
-        b: Union[str, Number]
+        b: Union[str, Number],
+        *,
+        operation: Optional[Union[str, Operation]] = None
     ) -> CalculationResult:
         """
-        Perform calculation with the current operation.
+        Perform a calculation.
+
+        Uses the current operation strategy set by set_operation, unless an
+        operation is passed (an Operation or a factory name such as 'add'), which
+        is then used for this call only and leaves the strategy untouched, so
+        concurrent callers cannot change each other's operation.
 
-        Validates and sanitizes user inputs, executes the calculation using the
-        current operation strategy, updates the history, and notifies observers.
+        Validates and sanitizes user inputs, executes the calculation, updates the
+        history, and notifies observers. The history, undo and redo updates happen
+        as one atomic step. When the result cache is enabled, a repeated operation
+        and operands reuse the cached result instead of executing again.
 
         Args:
             a (Union[str, Number]): The first operand, can be a string or a numeric type.
             b (Union[str, Number]): The second operand, can be a string or a numeric type.
+            operation (Optional[Union[str, Operation]], optional): The operation to perform
+                instead of the current strategy. Defaults to None.
 
         Returns:
             CalculationResult: The result of the calculation.
 
         Raises:
-            OperationError: If no operation is set or if the operation fails.
+            OperationError: If no operation is set, the operation is unknown or fails.
             ValidationError: If input validation fails.
         """
-        if not self.operation_strategy:
-            raise OperationError("No operation set")
+        return self.perform_calculation(a, b, operation=operation).result
 
-        try:
-            # Validate and convert inputs to Decimal
-            validated_a = InputValidator.validate_number(a, self.config)
-            validated_b = InputValidator.validate_number(b, self.config)
+    def perform_calculation(
+        self,
+        a: Union[str, Number],
+        b: Union[str, Number],
+        *,
+        operation: Optional[Union[str, Operation]] = None
+    ) -> Calculation:
+        """
+        Perform a calculation and return the recorded Calculation.
+
+        Same as perform_operation, which takes the same arguments, but returns the
+        Calculation added to the history instead of only its result.
 
-            # Execute the operation strategy
-            result = self.operation_strategy.execute(validated_a, validated_b)
+        Returns:
+            Calculation: The recorded calculation.
+
+        Raises:
+            OperationError: If no operation is set, the operation is unknown or fails.
+            ValidationError: If input validation fails.
+        """
+        if operation is not None:
+            operation = self._resolve_operation(operation)
+        else:
+            # Read the shared strategy once
+            operation = self.operation_strategy
+            if not operation:
+                raise OperationError("No operation set")
 
-            # Create a new Calculation instance with the operation details
+        try:
+            with localcontext(self.decimal_context):
+                # Validate and convert inputs to Decimal
+                validated_a = InputValidator.validate_number(a, self.config)
+                validated_b = InputValidator.validate_number(b, self.config)
+
+                # Execute the operation strategy, unless its result is cached
+                operation_name = str(operation)
+                cache = self.result_cache
+                result = None
+                if cache is not None:
+                    result = cache.get(operation_name, validated_a, validated_b)
+                if result is None:
+                    result = operation.execute(validated_a, validated_b)
+                    if cache is not None:
+                        cache.put(operation_name, validated_a, validated_b, result)
+
+            # Create a new Calculation instance with the operation details,
+            # storing the strategy's result instead of computing it again
             calculation = Calculation(
-                operation=str(self.operation_strategy),
+                operation=operation_name,
                 operand1=validated_a,
-                operand2=validated_b
+                operand2=validated_b,
+                result=result
             )
 
-            # Save the current state to the undo stack before making changes
-            self.undo_stack.append(CalculatorMemento(self.history.copy()))
-
-            # Clear the redo stack since new operation invalidates the redo history
-            self.redo_stack.clear()
+            with self._state_lock:
+                # Append the new calculation to the history; once the history is
+                # full the oldest entry is evicted in constant time
+                evicted = self.history.append(calculation)
+                self._record_change('append', [calculation])
 
-            # Append the new calculation to the history
-            self.history.append(calculation)
+                # Record the change on the undo stack
+                self.undo_stack.append(CalculatorMemento(
+                    appended_count=1,
+                    evicted=(evicted,) if evicted is not None else ()
+                ))
 
-            # Ensure the history does not exceed the maximum size
-            if len(self.history) > self.config.max_history_size:
-                self.history.pop(0)
+                # Clear the redo stack since new operation invalidates the redo history
+                self.redo_stack.clear()
 
             # Notify all observers about the new calculation
             self.notify_observers(calculation)
 
-            return result
+            return calculation
 
         except ValidationError as e:
             # Log and re-raise validation errors
@@ -232,97 +418,517 @@ class Calculator:
             logging.error(f"Operation failed: {str(e)}")
             raise OperationError(f"Operation failed: {str(e)}")
 
+    @staticmethod
+    def _resolve_operation(operation: Union[str, Operation]) -> Operation:
+        """
+        Get an Operation instance for an operation or a factory name.
+
+        Args:
+            operation (Union[str, Operation]): Operation instance or factory name (e.g. 'add').
+
+        Returns:
+            Operation: The operation instance.
+
+        Raises:
+            OperationError: If the operation name is unknown.
+        """
+        if isinstance(operation, str):
+            try:
+                return OperationFactory.create_operation(operation)
+            except ValueError as e:
+                raise OperationError(str(e))
+        return operation
+
+    def perform_batch(
+        self,
+        operation: Union[str, Operation],
+        a_values: Sequence[Union[str, Number]],
+        b_values: Sequence[Union[str, Number]]
+    ) -> BatchResult:
+        """
+        Perform one operation over whole columns of operands.
+
+        Validates every row, executes the operation over the valid rows, records all
+        successful calculations as a single undo step and notifies observers once.
+        Rows that fail validation or execution are reported through the error mask
+        instead of aborting the batch.
+
+        Args:
+            operation (Union[str, Operation]): Operation instance or factory name (e.g. 'add').
+            a_values (Sequence[Union[str, Number]]): First operands, a sequence or NumPy array.
+            b_values (Sequence[Union[str, Number]]): Second operands, a sequence or NumPy array.
+
+        Returns:
+            BatchResult: Per-row results, error mask and error messages.
+
+        Raises:
+            OperationError: If the operation name is unknown.
+            ValidationError: If the operand columns differ in length.
+        """
+        operation = self._resolve_operation(operation)
+
+        a_values = list(a_values)
+        b_values = list(b_values)
+        if len(a_values) != len(b_values):
+            raise ValidationError(
+                f"Operand columns differ in length: {len(a_values)} != {len(b_values)}"
+            )
+
+        size = len(a_values)
+        results: List[Optional[Decimal]] = [None] * size
+        errors: List[Optional[str]] = [None] * size
+
+        valid_rows: List[int] = []
+        valid_a: List[Decimal] = []
+        valid_b: List[Decimal] = []
+        with localcontext(self.decimal_context):
+            # Validate both columns, keeping track of the rows that survive
+            a_column = InputValidator.validate_many(a_values, self.config)
+            b_column = InputValidator.validate_many(b_values, self.config)
+            for i, (a, b, a_error, b_error) in enumerate(zip(
+                a_column.values, b_column.values, a_column.errors, b_column.errors
+            )):
+                if a_error is not None or b_error is not None:
+                    errors[i] = a_error or b_error
+                    continue
+                valid_rows.append(i)
+                valid_a.append(a)
+                valid_b.append(b)
+
+            # Execute the operation over the valid rows in one pass
+            column_results, column_errors = operation.execute_many(valid_a, valid_b)
+
+        operation_name = str(operation)
+        calculations: List[Calculation] = []
+        for i, a, b, result, error in zip(valid_rows, valid_a, valid_b, column_results, column_errors):
+            if error is not None:
+                errors[i] = error
+                continue
+            calculations.append(
+                Calculation(operation=operation_name, operand1=a, operand2=b, result=result)
+            )
+            results[i] = result
+
+        self._record_batch(calculations)
+
+        error_mask = [error is not None for error in errors]
+        logging.info(
+            f"Batch {operation_name}: {size - sum(error_mask)} succeeded, {sum(error_mask)} failed"
+        )
+        return BatchResult(results=results, error_mask=error_mask, errors=errors)
+
+    def perform_bulk(
+        self,
+        rows: Iterable[Sequence[str]],
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None
+    ) -> BatchResult:
+        """
+        Compute mixed operation,operand1,operand2 rows in worker processes.
+
+        Chunks of rows are evaluated in parallel by a ProcessPoolEngine and merged
+        back in input order. All successful calculations are then recorded like
+        perform_batch: as a single undo step with one observer notification.
+
+        Args:
+            rows (Iterable[Sequence[str]]): Rows of operation name (e.g. 'add') and two operands.
+            workers (Optional[int], optional): Worker processes. Defaults to the
+                bulk_workers configuration setting.
+            chunk_size (Optional[int], optional): Rows per worker task. Defaults to the
+                bulk_chunk_size configuration setting.
+
+        Returns:
+            BatchResult: Per-row results, error mask and error messages.
+        """
+        # Only bulk work needs the process pool machinery
+        from app.parallel_engine import ProcessPoolEngine
+
+        results: List[Optional[Decimal]] = []
+        errors: List[Optional[str]] = []
+        calculations: List[Calculation] = []
+        with ProcessPoolEngine(self.config, workers, chunk_size) as engine:
+            for _, outcomes, chunk_calculations in engine.map_chunks(rows):
+                for result, error in outcomes:
+                    results.append(result)
+                    errors.append(error)
+                calculations.extend(chunk_calculations)
+
+        self._record_batch(calculations)
+
+        error_mask = [error is not None for error in errors]
+        logging.info(
+            f"Bulk computation: {len(calculations)} succeeded, {sum(error_mask)} failed"
+        )
+        return BatchResult(results=results, error_mask=error_mask, errors=errors)
+
+    def _record_batch(self, calculations: List[Calculation]) -> None:
+        """
+        Add the calculations of a batch to the history as a single undo step.
+
+        Args:
+            calculations (List[Calculation]): The successful calculations, in order.
+        """
+        if not calculations:
+            return
+        with self._state_lock:
+            evicted = self.history.extend(calculations)
+            self._record_change('append', calculations)
+            self.undo_stack.append(CalculatorMemento(appended_count=len(calculations), evicted=evicted))
+            self.redo_stack.clear()
+
+        self.notify_observers_batch(calculations)
+
+    def _record_change(self, kind: str, payload: Any) -> None:
+        """
+        Journal a history change for the SQLite backend.
+
+        Args:
+            kind (str): 'append', 'drop' or 'clear'.
+            payload (Any): The appended calculations, or the number of dropped ones.
+        """
+        if self._history_store is None:
+            return
+        with self._journal_lock:
+            if kind == 'clear':
+                # Nothing recorded before a clear needs to reach the database
+                self._journal.clear()
+            self._journal.append((kind, payload))
+
+    def _flush_journal(self) -> None:
+        """
+        Write journaled changes to the SQLite backend in one transaction.
+
+        Raises:
+            OperationError: If writing to the database fails.
+        """
+        # Concurrent flushes must reach the database in journal order
+        with self._io_lock:
+            with self._journal_lock:
+                changes, self._journal = self._journal, []
+            try:
+                self._history_store.apply(changes)
+                logging.info(f"History saved successfully to {self.config.history_db_file}")
+            except Exception as e:
+                # Keep the changes so the next save retries them
+                with self._journal_lock:
+                    self._journal[:0] = changes
+                logging.error(f"Failed to save history: {e}")
+                raise OperationError(f"Failed to save history: {e}")
+
     def save_history(self) -> None:
         """
-        Save calculation history to a CSV file using pandas.
+        Save calculation history to a CSV file.
 
         Serializes the history of calculations and writes them to a CSV file for
-        persistent storage. Utilizes pandas DataFrames for efficient data handling.
+        persistent storage. The file is written with the csv module, so saving
+        does not need pandas. With the 'sqlite' backend, the changes made since the last save are written
+        to the database in a single transaction instead.
 
         Raises:
             OperationError: If saving the history fails.
         """
-        try:
-            # Ensure the history directory exists
-            self.config.history_dir.mkdir(parents=True, exist_ok=True)
-
-            history_data = []
-            for calc in self.history:
-                # Serialize each Calculation instance to a dictionary
-                history_data.append({
-                    'operation': str(calc.operation),
-                    'operand1': str(calc.operand1),
-                    'operand2': str(calc.operand2),
-                    'result': str(calc.result),
-                    'timestamp': calc.timestamp.isoformat()
-                })
-
-            if history_data:
-                # Create a pandas DataFrame from the history data
-                df = pd.DataFrame(history_data)
-                # Write the DataFrame to a CSV file without the index
-                df.to_csv(self.config.history_file, index=False)
-                logging.info(f"History saved successfully to {self.config.history_file}")
-            else:
-                # If history is empty, create an empty CSV with headers
-                pd.DataFrame(columns=['operation', 'operand1', 'operand2', 'result', 'timestamp']
-                           ).to_csv(self.config.history_file, index=False)
-                logging.info("Empty history saved")
+        with self._io_lock:
+            if self._history_store is not None:
+                self._flush_journal()
+                return
+
+            try:
+                # Ensure the history directory exists
+                self.config.history_dir.mkdir(parents=True, exist_ok=True)
+
+                # Iterate over a snapshot: a write-behind flusher may save while
+                # calculations are still being added
+                with self._state_lock:
+                    calculations = self.history.copy()
+                    # The file will mirror this snapshot; later undo, redo or
+                    # clear calls mark it stale again
+                    self._rows_since_compaction = 0
+                    self._history_file_stale = False
+                with open(self.config.history_file, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f, lineterminator='\n')
+                    # An empty history still gets a header row
+                    writer.writerow(HISTORY_COLUMNS)
+                    writer.writerows(self._history_rows(calculations))
+
+                if calculations:
+                    logging.info(f"History saved successfully to {self.config.history_file}")
+                else:
+                    logging.info("Empty history saved")
 
-        except Exception as e:
-            # Log and raise an OperationError if saving fails
-            logging.error(f"Failed to save history: {e}")
-            raise OperationError(f"Failed to save history: {e}")
+            except Exception as e:
+                # The file may be incomplete, so the next append rewrites it
+                self._history_file_stale = True
+                # Log and raise an OperationError if saving fails
+                logging.error(f"Failed to save history: {e}")
+                raise OperationError(f"Failed to save history: {e}")
+
+    def append_history(self, calculations: List[Calculation]) -> None:
+        """
+        Append new calculations to the CSV history file.
+
+        Writes only the given rows instead of rewriting the whole file, so each
+        auto-save costs O(1) I/O. The file is periodically compacted with a full
+        save_history: after compaction_interval appended rows (which drops rows
+        evicted from the in-memory history), and whenever undo, redo or clear has
+        made the file diverge from the history. The file keeps the same layout
+        as save_history, so load_history reads it unchanged.
+
+        Args:
+            calculations (List[Calculation]): The new calculations, oldest first.
+
+        Raises:
+            OperationError: If writing the history fails.
+        """
+        with self._io_lock:
+            if self._history_store is not None:
+                # The journal already holds these calculations
+                self._flush_journal()
+                return
+
+            if (
+                self._history_file_stale
+                or not self.config.history_file.exists()
+                or self._rows_since_compaction + len(calculations) > self.config.compaction_interval
+            ):
+                self.save_history()
+                return
+
+            try:
+                # Match the encoding used by save_history when the file was written
+                with open(self.config.history_file, 'a', newline='', encoding='utf-8') as f:
+                    csv.writer(f, lineterminator='\n').writerows(self._history_rows(calculations))
+                self._rows_since_compaction += len(calculations)
+                logging.info(f"Appended {len(calculations)} calculations to {self.config.history_file}")
+            except Exception as e:
+                logging.error(f"Failed to append history: {e}")
+                raise OperationError(f"Failed to append history: {e}")
+
+    @staticmethod
+    def _history_rows(calculations: Iterable[Calculation]) -> Iterable[List[str]]:
+        """Serialize calculations into history CSV rows."""
+        return (
+            [
+                str(calc.operation),
+                str(calc.operand1),
+                str(calc.operand2),
+                str(calc.result),
+                calc.timestamp.isoformat()
+            ]
+            for calc in calculations
+        )
 
     def load_history(self) -> None:
         """
-        Load calculation history from a CSV file using pandas.
+        Load calculation history from a CSV file.
 
         Reads the calculation history from a CSV file and reconstructs the
-        Calculation instances, restoring the calculator's history.
+        Calculation instances, restoring the calculator's history. Small files
+        are read with the csv module so that startup does not import pandas;
+        files over CSV_MODULE_MAX_BYTES use pandas' faster parser. With the
+        'sqlite' backend, only the newest max_history_size calculations are
+        read from the database.
 
         Raises:
             OperationError: If loading the history fails.
         """
-        try:
-            if self.config.history_file.exists():
-                # Read the CSV file into a pandas DataFrame
-                df = pd.read_csv(self.config.history_file)
-                if not df.empty:
-                    # Deserialize each row into a Calculation instance
-                    self.history = [
-                        Calculation.from_dict({
-                            'operation': row['operation'],
-                            'operand1': row['operand1'],
-                            'operand2': row['operand2'],
-                            'result': row['result'],
-                            'timestamp': row['timestamp']
-                        })
-                        for _, row in df.iterrows()
-                    ]
-                    logging.info(f"Loaded {len(self.history)} calculations from history")
+        with self._io_lock:
+            try:
+                if self._history_store is not None:
+                    with self._journal_lock:
+                        self._journal.clear()
+                    rows = self._history_store.tail(self.config.max_history_size)
+                    if rows:
+                        self._set_loaded_history(rows)
+                    else:
+                        logging.info("Loaded empty history database")
+                elif self.config.history_file.exists():
+                    if self.config.history_file.stat().st_size <= CSV_MODULE_MAX_BYTES:
+                        rows = self._read_history_csv()
+                    else:
+                        rows = self._read_history_pandas()
+                    if rows:
+                        self._set_loaded_history(rows)
+                    else:
+                        logging.info("Loaded empty history file")
                 else:
-                    logging.info("Loaded empty history file")
-            else:
-                # If no history file exists, start with an empty history
-                logging.info("No history file found - starting with empty history")
-        except Exception as e:
-            # Log and raise an OperationError if loading fails
-            logging.error(f"Failed to load history: {e}")
-            raise OperationError(f"Failed to load history: {e}")
+                    # If no history file exists, start with an empty history
+                    logging.info("No history file found - starting with empty history")
+            except Exception as e:
+                # Log and raise an OperationError if loading fails
+                logging.error(f"Failed to load history: {e}")
+                raise OperationError(f"Failed to load history: {e}")
+
+    def _read_history_csv(self) -> Sequence[Dict[str, Any]]:
+        """
+        Read the newest max_history_size rows of the history file with the csv module.
+
+        Returns:
+            Sequence[Dict[str, Any]]: The rows, oldest first.
+        """
+        with open(self.config.history_file, newline='', encoding='utf-8') as f:
+            # Rows beyond the history size would be evicted immediately
+            return deque(csv.DictReader(f), maxlen=self.config.max_history_size)
+
+    def _read_history_pandas(self) -> Sequence[Dict[str, Any]]:
+        """
+        Read the newest max_history_size rows of the history file with pandas.
+
+        Returns:
+            Sequence[Dict[str, Any]]: The rows, oldest first.
+        """
+        import pandas as pd
+
+        # Keep every column as text so operands are not round-tripped through float
+        df = pd.read_csv(self.config.history_file, dtype=str)
+        df = df.tail(self.config.max_history_size)
+        # Walk the five columns as plain lists instead of building a pandas
+        # Series per row
+        columns = [df[column].tolist() for column in HISTORY_COLUMNS]
+        return [dict(zip(HISTORY_COLUMNS, values)) for values in zip(*columns)]
 
-    def get_history_dataframe(self) -> pd.DataFrame:
+    def _set_loaded_history(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Replace the history with calculations rebuilt from persisted rows.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): Persisted rows, oldest first.
+        """
+        lazy = self.config.lazy_load
+        parse = get_backend(self.config.numeric_backend).parse
+        # Results are recomputed (unless lazy) in this calculator's context,
+        # through the result cache when it is warmed from history
+        cache = self.result_cache if self.config.result_cache_warm else None
+        with localcontext(self.decimal_context):
+            history = self._new_history(
+                Calculation.from_dict(row, lazy=lazy, parse=parse, cache=cache) for row in rows
+            )
+        with self._state_lock:
+            self.history = history
+            # Recorded changes no longer apply to the replaced history
+            self.undo_stack.clear()
+            self.redo_stack.clear()
+            self._rows_since_compaction = 0
+            self._history_file_stale = False
+        logging.info(f"Loaded {len(history)} calculations from history")
+        # Lazily loaded results are only cached once verify_history recomputes them
+        if lazy:
+            self._start_integrity_check()
+
+    def warm_result_cache(self, calculations: Optional[Iterable[Calculation]] = None) -> int:
+        """
+        Fill the result cache from calculations, by default the calculation history.
+
+        The most recent calculations are kept when there are more than the cache
+        holds. Results are cached as given for this calculator's precision and
+        rounding, so they must have been computed with them. Loading history
+        already warms the cache through the recomputed results; history loaded
+        with lazy_load is warmed by verify_history instead.
+
+        Args:
+            calculations (Optional[Iterable[Calculation]], optional): Calculations,
+                oldest first. Defaults to the history.
+
+        Returns:
+            int: Number of cached results afterwards, 0 when the cache is disabled.
+        """
+        if self.result_cache is None:
+            return 0
+        if calculations is None:
+            with self._state_lock:
+                calculations = list(self.history)
+        with localcontext(self.decimal_context):
+            size = self.result_cache.warm(calculations)
+        logging.info(f"Warmed result cache with {size} results")
+        return size
+
+    def verify_history(self, sample_size: Optional[int] = None) -> List[Calculation]:
+        """
+        Recompute stored results and report the ones that disagree.
+
+        When the result cache is warmed from history, the verified results are
+        added to it.
+
+        Args:
+            sample_size (Optional[int], optional): Verify a random sample of this many
+                entries instead of the whole history. Defaults to None.
+
+        Returns:
+            List[Calculation]: The calculations whose stored result is wrong.
+        """
+        with self._state_lock:
+            calculations = self.history.copy()
+        if sample_size is not None and sample_size < len(calculations):
+            calculations = random.sample(calculations, sample_size)
+        with localcontext(self.decimal_context):
+            verified = [calc.verify() for calc in calculations]
+        mismatches = [calc for calc, ok in zip(calculations, verified) if not ok]
+        if self.result_cache is not None and self.config.result_cache_warm:
+            self.warm_result_cache(calc for calc, ok in zip(calculations, verified) if ok)
+        logging.info(
+            f"Integrity check verified {len(calculations)} calculations, "
+            f"{len(mismatches)} mismatched"
+        )
+        return mismatches
+
+    def _start_integrity_check(self) -> None:
+        """
+        Verify lazily loaded history in a background thread.
+
+        Keeps the recomputation off the startup path. The check is sampled or
+        full depending on the integrity_check configuration setting.
+        """
+        if self.config.integrity_check == 'off':
+            return
+        sample_size = (
+            self.config.integrity_sample_size
+            if self.config.integrity_check == 'sample' else None
+        )
+        self._integrity_thread = threading.Thread(
+            target=self.verify_history,
+            args=(sample_size,),
+            name="history-integrity-check",
+            daemon=True
+        )
+        self._integrity_thread.start()
+
+    def get_history_dataframe(self, operation: Optional[str] = None) -> 'pd.DataFrame':
         """
         Get calculation history as a pandas DataFrame.
 
         Converts the list of Calculation instances into a pandas DataFrame for
         advanced data manipulation or analysis.
 
+        With the 'sqlite' backend, pending changes are saved first and the complete
+        stored history is read from the database page by page, optionally filtered
+        by operation.
+
+        Args:
+            operation (Optional[str], optional): Only include this operation (e.g.
+                'Addition'). Defaults to None.
+
         Returns:
             pd.DataFrame: DataFrame containing the calculation history.
         """
+        import pandas as pd
+
+        if self._history_store is not None:
+            self._flush_journal()
+            frames = [
+                pd.DataFrame(page)
+                for page in self._history_store.iter_pages(operation=operation)
+            ]
+            if not frames:
+                return pd.DataFrame(columns=HISTORY_COLUMNS)
+            df = pd.concat(frames, ignore_index=True)
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            return df
+
+        with self._state_lock:
+            calculations = self.history.copy()
         history_data = []
-        for calc in self.history:
+        for calc in calculations:
+            if operation is not None and calc.operation != operation:
+                continue
             history_data.append({
                 'operation': str(calc.operation),
                 'operand1': str(calc.operand1),
@@ -336,14 +942,17 @@ class Calculator:
         """
         Get formatted history of calculations.
 
-        Returns a list of human-readable strings representing each calculation.
+        Returns a list of human-readable strings representing each calculation
+        in the in-memory history (the newest max_history_size calculations).
 
         Returns:
             List[str]: List of formatted calculation history entries.
         """
+        with self._state_lock:
+            calculations = self.history.copy()
         return [
             f"{calc.operation}({calc.operand1}, {calc.operand2}) = {calc.result}"
-            for calc in self.history
+            for calc in calculations
         ]
 
     def clear_history(self) -> None:
@@ -352,9 +961,12 @@ class Calculator:
 
         Empties the calculation history and clears the undo and redo stacks.
         """
-        self.history.clear()
-        self.undo_stack.clear()
-        self.redo_stack.clear()
+        with self._state_lock:
+            self.history.clear()
+            self.undo_stack.clear()
+            self.redo_stack.clear()
+            self._history_file_stale = True
+            self._record_change('clear', None)
         logging.info("History cleared")
 
     def undo(self) -> bool:
@@ -367,15 +979,19 @@ class Calculator:
         Returns:
             bool: True if an operation was undone, False if there was nothing to undo.
         """
-        if not self.undo_stack:
-            return False
-        # Pop the last state from the undo stack
-        memento = self.undo_stack.pop()
-        # Push the current state onto the redo stack
-        self.redo_stack.append(CalculatorMemento(self.history.copy()))
-        # Restore the history from the memento
-        self.history = memento.history.copy()
-        return True
+        with self._state_lock:
+            if not self.undo_stack:
+                return False
+            # Pop the last change from the undo stack
+            memento = self.undo_stack.pop()
+            # Reverse the change on the history
+            memento.revert(self.history)
+            self._history_file_stale = True
+            # A batch larger than the history inserted more rows than it left in memory
+            self._record_change('drop', memento.appended_count)
+            # Push the change onto the redo stack
+            self.redo_stack.append(memento)
+            return True
 
     def redo(self) -> bool:
         """
@@ -386,12 +1002,15 @@ class Calculator:
         Returns:
             bool: True if an operation was redone, False if there was nothing to redo.
         """
-        if not self.redo_stack:
-            return False
-        # Pop the last state from the redo stack
-        memento = self.redo_stack.pop()
-        # Push the current state onto the undo stack
-        self.undo_stack.append(CalculatorMemento(self.history.copy()))
-        # Restore the history from the memento
-        self.history = memento.history.copy()
-        return True
+        with self._state_lock:
+            if not self.redo_stack:
+                return False
+            # Pop the last undone change from the redo stack
+            memento = self.redo_stack.pop()
+            # Re-apply the change to the history
+            appended = memento.apply(self.history)
+            self._history_file_stale = True
+            self._record_change('append', appended)
+            # Push the change back onto the undo stack
+            self.undo_stack.append(memento)
+            return True
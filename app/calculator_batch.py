@@ -0,0 +1,74 @@
+########################
+# Calculator Batch Mode #
+########################
+
+import logging
+import sys
+from typing import Iterable, Optional, TextIO
+
+from app.calculator import Calculator
+from app.exception import OperationError, ValidationError
+from app.history import LoggingObserver
+from app.numeric_backend import format_number
+from app.operations import OperationFactory
+
+
+def calculator_batch(
+    lines: Iterable[str],
+    output: TextIO = sys.stdout,
+    calculator: Optional[Calculator] = None
+) -> int:
+    """
+    Non-interactive interface for the calculator.
+
+    Reads one calculation per line, such as ``add 2 3``, and writes one result
+    line per calculation. Blank lines and lines starting with '#' are skipped.
+    A calculation that fails writes ``Error: <message>`` in place of its result,
+    so output lines stay aligned with the input. There are no prompts or color
+    codes, and output is only flushed at the end, so the batch runs at full
+    speed inside a pipeline.
+
+    Calculations go through the same Calculator and OperationFactory path as
+    the REPL. When auto-save is enabled, the history is saved once at the end
+    instead of after every calculation.
+
+    Args:
+        lines (Iterable[str]): Input lines, e.g. an open file or sys.stdin.
+        output (TextIO, optional): Stream for the results. Defaults to sys.stdout.
+        calculator (Optional[Calculator], optional): Calculator to use. Defaults to
+            a new Calculator.
+
+    Returns:
+        int: Exit status, 0 if every calculation succeeded and 1 otherwise.
+    """
+    calc = calculator or Calculator()
+    calc.add_observer(LoggingObserver())
+    failed = 0
+
+    for line_number, line in enumerate(lines, 1):
+        fields = line.split()
+        if not fields or fields[0].startswith('#'):
+            continue
+        try:
+            if len(fields) != 3:
+                raise ValidationError(f"Expected '<command> <a> <b>', got: {line.strip()}")
+            command, a, b = fields
+            try:
+                # The factory hands out one shared instance per command
+                operation = OperationFactory.create_operation(command)
+            except ValueError as e:
+                raise OperationError(str(e))
+
+            calc.set_operation(operation)
+            result = calc.perform_operation(a, b)
+
+            output.write(f"{format_number(result)}\n")
+        except (ValidationError, OperationError) as e:
+            failed += 1
+            logging.error(f"Batch line {line_number} failed: {e}")
+            output.write(f"Error: {e}\n")
+
+    output.flush()
+    if calc.config.auto_save:
+        calc.save_history()
+    return 1 if failed else 0
@@ -3,7 +3,8 @@
 ########################
 
 from dataclasses import dataclass
-from decimal import Decimal
+import decimal
+from decimal import Context, Decimal
 from numbers import Number
 from pathlib import Path
 import os
@@ -16,6 +17,12 @@ from app.exception import ConfigurationError
 # Load environment variables from a .env file into the program's environment
 load_dotenv()
 
+# Rounding modes accepted by the rounding setting
+DECIMAL_ROUNDINGS = (
+    decimal.ROUND_CEILING, decimal.ROUND_DOWN, decimal.ROUND_FLOOR, decimal.ROUND_HALF_DOWN,
+    decimal.ROUND_HALF_EVEN, decimal.ROUND_HALF_UP, decimal.ROUND_UP, decimal.ROUND_05UP,
+)
+
 
 def get_project_root() -> Path:
     """
@@ -53,7 +60,25 @@ class CalculatorConfig:
         auto_save: Optional[bool] = None,
         precision: Optional[int] = None,
         max_input_value: Optional[Number] = None,
-        default_encoding: Optional[str] = None
+        default_encoding: Optional[str] = None,
+        lazy_load: Optional[bool] = None,
+        integrity_check: Optional[str] = None,
+        integrity_sample_size: Optional[int] = None,
+        history_write_mode: Optional[str] = None,
+        compaction_interval: Optional[int] = None,
+        durability: Optional[str] = None,
+        flush_interval: Optional[float] = None,
+        max_dirty_count: Optional[int] = None,
+        history_backend: Optional[str] = None,
+        history_storage: Optional[str] = None,
+        bulk_chunk_size: Optional[int] = None,
+        bulk_workers: Optional[int] = None,
+        thread_safe: Optional[bool] = None,
+        session_idle_timeout: Optional[float] = None,
+        result_cache_size: Optional[int] = None,
+        result_cache_warm: Optional[bool] = None,
+        numeric_backend: Optional[str] = None,
+        rounding: Optional[str] = None
     ):
         """
         Initialize configuration with environment variables and defaults.
@@ -62,9 +87,43 @@ class CalculatorConfig:
             base_dir (Optional[Path], optional): Base directory for the calculator. Defaults to None.
             max_history_size (Optional[int], optional): Maximum number of history entries. Defaults to None.
             auto_save (Optional[bool], optional): Whether to auto-save history. Defaults to None.
-            precision (Optional[int], optional): Number of decimal places for calculations. Defaults to None.
+            precision (Optional[int], optional): Significant digits of Decimal arithmetic. Defaults to None.
             max_input_value (Optional[Number], optional): Maximum allowed input value. Defaults to None.
             default_encoding (Optional[str], optional): Default encoding for file operations. Defaults to None.
+            lazy_load (Optional[bool], optional): Trust persisted results when loading history. Defaults to None.
+            integrity_check (Optional[str], optional): Background check of lazily loaded history:
+                'off', 'sample' or 'full'. Defaults to None.
+            integrity_sample_size (Optional[int], optional): Entries verified by a sampled check. Defaults to None.
+            history_write_mode (Optional[str], optional): How auto-save writes history: 'full' rewrites
+                the file, 'append' writes only new rows. Defaults to None.
+            compaction_interval (Optional[int], optional): Rows appended before the history file is
+                rewritten in append mode. Defaults to None.
+            durability (Optional[str], optional): 'sync' saves inside each calculation, 'write_behind'
+                saves from a background thread, trading durability for latency. Defaults to None.
+            flush_interval (Optional[float], optional): Seconds between write-behind flushes. Defaults to None.
+            max_dirty_count (Optional[int], optional): Pending calculations that trigger an early
+                write-behind flush. Defaults to None.
+            history_backend (Optional[str], optional): History storage backend, 'csv' or 'sqlite'.
+                Defaults to None.
+            history_storage (Optional[str], optional): In-memory history layout, 'objects' or the
+                compact 'columnar' store. Defaults to None.
+            bulk_chunk_size (Optional[int], optional): Rows read, computed and written at a time
+                by bulk CSV computation, and per worker task in parallel bulk computation.
+                Defaults to None.
+            bulk_workers (Optional[int], optional): Worker processes used by parallel bulk
+                computation. Defaults to None.
+            thread_safe (Optional[bool], optional): Guard calculator state with locks so one
+                instance can be shared by many threads. Defaults to None.
+            session_idle_timeout (Optional[float], optional): Seconds after which an unused
+                calculator server session is evicted. Defaults to None.
+            result_cache_size (Optional[int], optional): Operation results kept in the LRU
+                result cache, 0 to disable it. Defaults to None.
+            result_cache_warm (Optional[bool], optional): Fill the result cache from the
+                loaded history. Defaults to None.
+            numeric_backend (Optional[str], optional): Number type of operands and results:
+                'decimal', 'float' (fastest) or 'fraction' (exact rationals). Defaults to None.
+            rounding (Optional[str], optional): Rounding mode of Decimal arithmetic, a decimal
+                module constant such as 'ROUND_HALF_EVEN'. Defaults to None.
         """
         # Set base directory to project root by default
         project_root = get_project_root()
@@ -83,7 +142,7 @@ class CalculatorConfig:
             auto_save_env == 'true' or auto_save_env == '1'
         )
 
-        # Calculation precision
+        # Significant digits of Decimal arithmetic
         self.precision = precision or int(
             os.getenv('CALCULATOR_PRECISION', '10')
         )
@@ -98,6 +157,99 @@ class CalculatorConfig:
             'CALCULATOR_DEFAULT_ENCODING', 'utf-8'
         )
 
+        # Lazy history loading: trust persisted results instead of recomputing them
+        lazy_load_env = os.getenv('CALCULATOR_LAZY_LOAD', 'false').lower()
+        self.lazy_load = lazy_load if lazy_load is not None else (
+            lazy_load_env == 'true' or lazy_load_env == '1'
+        )
+
+        # Integrity check run in the background after a lazy load
+        self.integrity_check = (integrity_check or os.getenv(
+            'CALCULATOR_INTEGRITY_CHECK', 'sample'
+        )).lower()
+
+        # Number of entries verified by a sampled integrity check
+        self.integrity_sample_size = integrity_sample_size or int(
+            os.getenv('CALCULATOR_INTEGRITY_SAMPLE_SIZE', '100')
+        )
+
+        # History write mode used by auto-save
+        self.history_write_mode = (history_write_mode or os.getenv(
+            'CALCULATOR_HISTORY_WRITE_MODE', 'full'
+        )).lower()
+
+        # Appended rows between full rewrites (compactions) of the history file
+        self.compaction_interval = compaction_interval or int(
+            os.getenv('CALCULATOR_COMPACTION_INTERVAL', '100')
+        )
+
+        # Durability/latency trade-off for auto-save
+        self.durability = (durability or os.getenv(
+            'CALCULATOR_DURABILITY', 'sync'
+        )).lower()
+
+        # Seconds between background flushes in write-behind mode
+        self.flush_interval = flush_interval or float(
+            os.getenv('CALCULATOR_FLUSH_INTERVAL', '1.0')
+        )
+
+        # Pending calculations that trigger an early flush in write-behind mode
+        self.max_dirty_count = max_dirty_count or int(
+            os.getenv('CALCULATOR_MAX_DIRTY_COUNT', '50')
+        )
+
+        # Storage backend for calculation history
+        self.history_backend = (history_backend or os.getenv(
+            'CALCULATOR_HISTORY_BACKEND', 'csv'
+        )).lower()
+
+        # In-memory layout of the calculation history
+        self.history_storage = (history_storage or os.getenv(
+            'CALCULATOR_HISTORY_STORAGE', 'objects'
+        )).lower()
+
+        # Rows held in memory at a time by bulk CSV computation
+        self.bulk_chunk_size = bulk_chunk_size or int(
+            os.getenv('CALCULATOR_BULK_CHUNK_SIZE', '10000')
+        )
+
+        # Worker processes for parallel bulk computation, one per CPU by default
+        self.bulk_workers = bulk_workers or int(
+            os.getenv('CALCULATOR_BULK_WORKERS', str(os.cpu_count() or 1))
+        )
+
+        # Lock calculator state for use from multiple threads
+        thread_safe_env = os.getenv('CALCULATOR_THREAD_SAFE', 'false').lower()
+        self.thread_safe = thread_safe if thread_safe is not None else (
+            thread_safe_env == 'true' or thread_safe_env == '1'
+        )
+
+        # Idle time before the calculator server drops a session
+        self.session_idle_timeout = session_idle_timeout or float(
+            os.getenv('CALCULATOR_SESSION_IDLE_TIMEOUT', '300')
+        )
+
+        # Size of the LRU cache of operation results; 0 disables it
+        self.result_cache_size = result_cache_size if result_cache_size is not None else int(
+            os.getenv('CALCULATOR_RESULT_CACHE_SIZE', '0')
+        )
+
+        # Warm the result cache from the history loaded at startup
+        result_cache_warm_env = os.getenv('CALCULATOR_RESULT_CACHE_WARM', 'true').lower()
+        self.result_cache_warm = result_cache_warm if result_cache_warm is not None else (
+            result_cache_warm_env == 'true' or result_cache_warm_env == '1'
+        )
+
+        # Number type used for operands, results and persisted history
+        self.numeric_backend = (numeric_backend or os.getenv(
+            'CALCULATOR_NUMERIC_BACKEND', 'decimal'
+        )).lower()
+
+        # Rounding mode of the Decimal context
+        self.rounding = (rounding or os.getenv(
+            'CALCULATOR_ROUNDING', decimal.ROUND_HALF_EVEN
+        )).upper()
+
     @property
     def log_dir(self) -> Path:
         """
@@ -143,6 +295,22 @@ class CalculatorConfig:
             str(self.history_dir / "calculator_history.csv")
         )).resolve()
 
+    @property
+    def history_db_file(self) -> Path:
+        """
+        Get history database path.
+
+        Determines the file path of the SQLite database used by the 'sqlite'
+        history backend.
+
+        Returns:
+            Path: The history database path.
+        """
+        return Path(os.getenv(
+            'CALCULATOR_HISTORY_DB_FILE',
+            str(self.history_dir / "calculator_history.db")
+        )).resolve()
+
     @property
     def log_file(self) -> Path:
         """
@@ -174,3 +342,52 @@ class CalculatorConfig:
             raise ConfigurationError("precision must be positive")
         if self.max_input_value <= 0:
             raise ConfigurationError("max_input_value must be positive")
+        if self.integrity_check not in ('off', 'sample', 'full'):
+            raise ConfigurationError("integrity_check must be 'off', 'sample' or 'full'")
+        if self.integrity_sample_size <= 0:
+            raise ConfigurationError("integrity_sample_size must be positive")
+        if self.history_write_mode not in ('full', 'append'):
+            raise ConfigurationError("history_write_mode must be 'full' or 'append'")
+        if self.compaction_interval <= 0:
+            raise ConfigurationError("compaction_interval must be positive")
+        if self.durability not in ('sync', 'write_behind'):
+            raise ConfigurationError("durability must be 'sync' or 'write_behind'")
+        if self.flush_interval <= 0:
+            raise ConfigurationError("flush_interval must be positive")
+        if self.max_dirty_count <= 0:
+            raise ConfigurationError("max_dirty_count must be positive")
+        if self.history_backend not in ('csv', 'sqlite'):
+            raise ConfigurationError("history_backend must be 'csv' or 'sqlite'")
+        if self.history_storage not in ('objects', 'columnar'):
+            raise ConfigurationError("history_storage must be 'objects' or 'columnar'")
+        if self.bulk_chunk_size <= 0:
+            raise ConfigurationError("bulk_chunk_size must be positive")
+        if self.bulk_workers <= 0:
+            raise ConfigurationError("bulk_workers must be positive")
+        if self.session_idle_timeout <= 0:
+            raise ConfigurationError("session_idle_timeout must be positive")
+        if self.result_cache_size < 0:
+            raise ConfigurationError("result_cache_size must not be negative")
+        if self.numeric_backend not in ('decimal', 'float', 'fraction'):
+            raise ConfigurationError("numeric_backend must be 'decimal', 'float' or 'fraction'")
+        if self.rounding not in DECIMAL_ROUNDINGS:
+            raise ConfigurationError(
+                f"rounding must be one of {', '.join(DECIMAL_ROUNDINGS)}"
+            )
+
+    def decimal_context(self) -> Context:
+        """
+        Build the Decimal context for calculations with this configuration.
+
+        Arithmetic is rounded to precision significant digits with the
+        configured rounding mode. Invalid operations, division by zero and
+        overflow raise, as in the default context.
+
+        Returns:
+            Context: A new context.
+        """
+        return Context(
+            prec=self.precision,
+            rounding=self.rounding,
+            traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow]
+        )
@@ -1,21 +1,67 @@
 from dataclasses import dataclass, field
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 
 from app.calculation import Calculation
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculatorMemento:
     """
-    the calculator memento class stores the state of the calculator for undo/redo functionality.
+    the calculator memento class stores a change to the calculator history for undo/redo functionality.
 
-    The mememento pattern allows the calculator to save its current state (history) which allows 
-    undo and redo features.
+    The mememento pattern allows the calculator to record each change to its state (history)
+    which allows undo and redo features. Rather than a full copy of the history, a memento
+    holds only the delta: the number of calculations appended to the end of the history and
+    the ones evicted from its front (a cleared history evicts every entry). Undoing or redoing
+    a step therefore costs time and memory proportional to the change, not to the history size.
+
+    The appended calculations are still in the history while the change is applied, so the
+    memento only counts them; undoing the change moves them into the memento until it is redone.
     """
 
-    history: List[Calculation]  #lists calculations instances in history
+    appended: Sequence[Calculation] = ()  #calculations added to the end of history, held while the change is undone
+    evicted: Sequence[Calculation] = ()  #calculations removed from the front of history, oldest first
     timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)  #timestamp of memento creation
+    appended_count: int = 0  #number of calculations added to the end of history
+
+    def __post_init__(self):
+        """Count the appended calculations when they are given."""
+        if self.appended and not self.appended_count:
+            self.appended_count = len(self.appended)
+
+    def apply(self, history: Any) -> List[Calculation]:
+        """
+        Re-apply the change to a history (redo).
+
+        Args:
+            history (CalculationHistory): The history to update.
+
+        Returns:
+            List[Calculation]: The calculations appended again, which the history holds from now on.
+        """
+        for _ in self.evicted:
+            history.popleft()
+        appended = list(self.appended)
+        history.extend(appended)
+        # Only the calculations the history kept are appended again
+        self.appended = ()
+        self.appended_count = len(appended)
+        return appended
+
+    def revert(self, history: Any) -> None:
+        """
+        Reverse the change on a history (undo).
+
+        Args:
+            history (CalculationHistory): The history to update.
+        """
+        # A batch larger than the history keeps only its newest entries
+        appended = [history.pop() for _ in range(min(self.appended_count, len(history)))]
+        appended.reverse()
+        self.appended = appended
+        for calculation in reversed(self.evicted):
+            history.appendleft(calculation)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -28,8 +74,10 @@ class CalculatorMemento:
             Dict[str, Any]: A dictionary containing the serialized state of the memento.
         """
         return {
-            'history': [calc.to_dict() for calc in self.history],
-            'timestamp': self.timestamp.isoformat()
+            'appended': [calc.to_dict() for calc in self.appended],
+            'evicted': [calc.to_dict() for calc in self.evicted],
+            'timestamp': self.timestamp.isoformat(),
+            'appended_count': self.appended_count
         }
 
     @classmethod
@@ -38,7 +86,7 @@ class CalculatorMemento:
         Create memento from dictionary.
 
         This class method deserializes a dictionary to recreate a CalculatorMemento
-        instance, restoring the calculator's history and timestamp.
+        instance, restoring the recorded change and timestamp.
 
         Args:
             data (Dict[str, Any]): Dictionary containing serialized memento data.
@@ -47,6 +95,8 @@ class CalculatorMemento:
             CalculatorMemento: A new instance of CalculatorMemento with restored state.
         """
         return cls(
-            history=[Calculation.from_dict(calc) for calc in data['history']],
-            timestamp=datetime.datetime.fromisoformat(data['timestamp'])
+            appended=[Calculation.from_dict(calc) for calc in data['appended']],
+            evicted=[Calculation.from_dict(calc) for calc in data['evicted']],
+            timestamp=datetime.datetime.fromisoformat(data['timestamp']),
+            appended_count=data.get('appended_count', 0)
         )
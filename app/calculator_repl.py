@@ -2,15 +2,39 @@
 # Calculator REPL       #
 ########################
 
-from decimal import Decimal
 import logging
+import sys
+from typing import Any, Tuple
 
 from app.calculator import Calculator
 from app.exception import OperationError, ValidationError
 from app.history import AutoSaveObserver, LoggingObserver
+from app.numeric_backend import format_number
 from app.operations import OperationFactory
 
-from colorama import Fore, Back, Style
+
+class _NoColor:
+    """Stand-in for colorama's Fore, Back and Style that renders every code as ''."""
+
+    def __getattr__(self, name: str) -> str:
+        return ''
+
+
+def _load_colors() -> Tuple[Any, Any, Any]:
+    """
+    Get the color codes used by the REPL.
+
+    colorama is only imported when stdout is a terminal. Piped or redirected
+    output gets plain text and skips the import.
+
+    Returns:
+        Tuple[Any, Any, Any]: colorama's Fore, Back and Style, or blank stand-ins.
+    """
+    if not sys.stdout.isatty():
+        plain = _NoColor()
+        return plain, plain, plain
+    from colorama import Fore, Back, Style
+    return Fore, Back, Style
 
 
 def calculator_repl():
@@ -20,13 +44,15 @@ def calculator_repl():
     Implements a Read-Eval-Print Loop (REPL) that continuously prompts the user
     for commands, processes arithmetic operations, and manages calculation history.
     """
+    Fore, Back, Style = _load_colors()
     try:
         # Initialize the Calculator instance
         calc = Calculator()
 
         # Register observers for logging and auto-saving history
+        auto_saver = AutoSaveObserver(calc)
         calc.add_observer(LoggingObserver())
-        calc.add_observer(AutoSaveObserver(calc))
+        calc.add_observer(auto_saver)
 
         print("Calculator started. Type 'help' for commands.")
 
@@ -54,6 +80,8 @@ def calculator_repl():
                 if command == 'exit':
                     # Attempt to save history before exiting
                     try:
+                        # Flush write-behind saves first so nothing lands after the final save
+                        auto_saver.close()
                         calc.save_history()
                         print(Style.BRIGHT+ Fore.CYAN +"History saved successfully.")
                     except Exception as e:
@@ -133,11 +161,7 @@ def calculator_repl():
                         # Perform the calculation
                         result = calc.perform_operation(a, b)
 
-                        # Normalize the result if it's a Decimal
-                        if isinstance(result, Decimal):
-                            result = result.normalize()
-
-                        print(Style.BRIGHT + Back.GREEN + f"\nResult: {result}")
+                        print(Style.BRIGHT + Back.GREEN + f"\nResult: {format_number(result)}")
                     except (ValidationError, OperationError) as e:
                         # Handle known exceptions related to validation or operation errors
                         print(Style.BRIGHT+ Fore.RED + f"Error: {e}")
@@ -157,6 +181,11 @@ def calculator_repl():
             except EOFError:
                 # Handle end-of-file (e.g., Ctrl+D) gracefully
                 print(Style.BRIGHT+ Fore.RED +"\nInput terminated. Exiting...")
+                try:
+                    # Flush any write-behind saves that are still pending
+                    auto_saver.close()
+                except Exception as e:
+                    print(Style.BRIGHT+ Fore.RED +f"Warning: Could not save history: {e}")
                 break
             except Exception as e:
                 # Handle any other unexpected exceptions
@@ -0,0 +1,376 @@
+########################
+# Calculator Server     #
+########################
+
+import asyncio
+import copy
+from dataclasses import dataclass, field
+import itertools
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.calculation import Calculation
+from app.calculator import Calculator, setup_environment
+from app.calculator_config import CalculatorConfig
+from app.exception import OperationError, ValidationError
+from app.history import HistoryObserver
+from app.history_store import SQLiteHistoryStore
+from app.numeric_backend import format_number
+
+# Longest accepted request line, in bytes
+MAX_REQUEST_SIZE = 64 * 1024
+
+
+@dataclass
+class Session:
+    """A client session: its own calculator and the time it was last used."""
+
+    calculator: Calculator
+    last_used: float
+    # Runs the session's requests one at a time, as its calculator is not thread-safe
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class _SessionRecorder(HistoryObserver):
+    """Observer that queues a session's calculations for the shared history store."""
+
+    def __init__(self, queue: Callable[[List[Calculation]], None]):
+        self.queue = queue
+
+    def update(self, calculation: Calculation) -> None:
+        self.queue([calculation])
+
+    def update_batch(self, calculations: List[Calculation]) -> None:
+        self.queue(calculations)
+
+
+class CalculatorServer:
+    """
+    asyncio calculator server speaking newline-delimited JSON.
+
+    Each request is one JSON object per line, for example
+    ``{"id": 1, "session": "alice", "command": "add", "a": "2", "b": "3"}``,
+    and gets one response line, ``{"id": 1, "ok": true, "result": "5"}`` or
+    ``{"id": 1, "ok": false, "error": "..."}``. The command is an operation
+    name or one of undo, redo, history and clear.
+
+    Every session has its own Calculator, and so its own in-memory history and
+    undo/redo stacks. A request without a session uses a session private to its
+    connection, which other connections cannot name, dropped on disconnect.
+    Named sessions are shared by all connections and evicted after
+    session_idle_timeout seconds without use.
+
+    Clients may pipeline requests: they are answered in order on each
+    connection. When a client stops reading responses, the server stops
+    reading its requests (backpressure) instead of buffering without bound.
+    Requests run in an executor thread, so a slow calculation does not
+    stall the event loop; requests to the same session run one at a time.
+
+    Every calculation from every session is appended to one shared SQLite
+    history store, written behind in batches from an executor thread. Undo,
+    redo and clear only change the session's in-memory history.
+    """
+
+    def __init__(self, config: Optional[CalculatorConfig] = None):
+        """
+        Initialize the server.
+
+        Args:
+            config (Optional[CalculatorConfig], optional): Configuration for the sessions and
+                the shared history store. Defaults to a new CalculatorConfig.
+        """
+        self.config = config or CalculatorConfig()
+        self.config.validate()
+        # Sessions only keep history in memory; the server owns persistence
+        self._session_config = copy.copy(self.config)
+        self._session_config.auto_save = False
+        self._session_config.history_backend = 'csv'
+        self._session_config.thread_safe = False
+        # Logging and directories are set up once, not per session calculator
+        setup_environment(self._session_config)
+
+        self.sessions: Dict[str, Session] = {}
+        # Sessions private to a connection, keyed by connection id
+        self.connection_sessions: Dict[int, Session] = {}
+        self._store = SQLiteHistoryStore(self.config.history_db_file)
+        # Calculations waiting for the store, queued from executor threads
+        self._pending: List[Calculation] = []
+        self._pending_lock = threading.Lock()
+        self._wake_flusher = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._connection_ids = itertools.count(1)
+        self._servers: List[asyncio.AbstractServer] = []
+        self._tasks: List[asyncio.Task] = []
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = 0) -> asyncio.AbstractServer:
+        """
+        Listen on a TCP address.
+
+        Args:
+            host (str, optional): Interface to bind. Defaults to '127.0.0.1'.
+            port (int, optional): Port to bind, 0 for any free port. Defaults to 0.
+
+        Returns:
+            asyncio.AbstractServer: The listening server.
+        """
+        server = await asyncio.start_server(
+            self._handle_connection, host, port, limit=MAX_REQUEST_SIZE
+        )
+        return self._started(server)
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """
+        Listen on a Unix domain socket.
+
+        Args:
+            path (str): Socket file path.
+
+        Returns:
+            asyncio.AbstractServer: The listening server.
+        """
+        server = await asyncio.start_unix_server(
+            self._handle_connection, path, limit=MAX_REQUEST_SIZE
+        )
+        return self._started(server)
+
+    def _started(self, server: asyncio.AbstractServer) -> asyncio.AbstractServer:
+        """Record a listening server and start the background tasks once."""
+        self._servers.append(server)
+        self._loop = asyncio.get_running_loop()
+        if not self._tasks:
+            self._tasks = [
+                asyncio.ensure_future(self._evict_idle_sessions()),
+                asyncio.ensure_future(self._flush_store()),
+            ]
+        logging.info(f"Calculator server listening on {server.sockets[0].getsockname()}")
+        return server
+
+    async def close(self) -> None:
+        """Stop listening, stop the background tasks and write the pending history."""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self._write_pending()
+        self._store.close()
+
+    def session(self, name: str) -> Session:
+        """
+        Get a named session, creating it on first use.
+
+        Args:
+            name (str): Session name.
+
+        Returns:
+            Session: The session.
+        """
+        return self._get_session(self.sessions, name)
+
+    def connection_session(self, connection_id: int) -> Session:
+        """
+        Get the session private to a connection, creating it on first use.
+
+        Args:
+            connection_id (int): Id of the connection.
+
+        Returns:
+            Session: The session.
+        """
+        return self._get_session(self.connection_sessions, connection_id)
+
+    def _get_session(self, sessions: Dict[Any, Session], key: Any) -> Session:
+        """Get a session from a session map, creating it on first use."""
+        session = sessions.get(key)
+        if session is None:
+            calculator = Calculator(self._session_config, load_existing=False, setup=False)
+            calculator.add_observer(_SessionRecorder(self.queue_for_store))
+            session = sessions[key] = Session(calculator, time.monotonic())
+        else:
+            session.last_used = time.monotonic()
+        return session
+
+    async def handle_request(self, request: Any, connection_id: int) -> Dict[str, Any]:
+        """
+        Execute one request.
+
+        The command runs in an executor thread, holding the session's lock.
+
+        Args:
+            request (Any): The decoded JSON request.
+            connection_id (int): Connection whose private session is used when the
+                request names none.
+
+        Returns:
+            Dict[str, Any]: The response object.
+        """
+        request_id = request.get('id') if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict):
+                raise ValidationError("Request must be a JSON object")
+            command = str(request.get('command', '')).lower()
+            name = request.get('session')
+            session = self.session(str(name)) if name else self.connection_session(connection_id)
+            loop = asyncio.get_running_loop()
+            async with session.lock:
+                result = await loop.run_in_executor(
+                    None, self._run_command, session.calculator, command, request
+                )
+        except (ValidationError, OperationError) as e:
+            return {'id': request_id, 'ok': False, 'error': str(e)}
+        return {'id': request_id, 'ok': True, 'result': result}
+
+    @staticmethod
+    def _run_command(calculator: Calculator, command: str, request: Dict[str, Any]) -> Any:
+        """Run a request's command on a session calculator, returning the result to send."""
+        if command == 'undo':
+            return calculator.undo()
+        if command == 'redo':
+            return calculator.redo()
+        if command == 'history':
+            return calculator.show_history()
+        if command == 'clear':
+            calculator.clear_history()
+            return True
+        value = calculator.perform_operation(request.get('a'), request.get('b'), operation=command)
+        return format_number(value)
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client connection until it closes."""
+        connection_id = next(self._connection_ids)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line exceeded MAX_REQUEST_SIZE; the stream cannot resync
+                    writer.write(self._encode({
+                        'id': None, 'ok': False, 'error': "Request too large"
+                    }))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    response = {'id': None, 'ok': False, 'error': f"Invalid JSON: {e}"}
+                else:
+                    response = await self.handle_request(request, connection_id)
+                writer.write(self._encode(response))
+                # Only waits when the client is not reading its responses
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connection_sessions.pop(connection_id, None)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    def _encode(response: Dict[str, Any]) -> bytes:
+        """Serialize a response as one JSON line."""
+        return json.dumps(response, separators=(',', ':')).encode('utf-8') + b'\n'
+
+    async def _evict_idle_sessions(self) -> None:
+        """Periodically drop sessions unused for longer than session_idle_timeout."""
+        timeout = self.config.session_idle_timeout
+        while True:
+            await asyncio.sleep(min(timeout / 2, 60))
+            cutoff = time.monotonic() - timeout
+            idle = [name for name, session in self.sessions.items() if session.last_used < cutoff]
+            for name in idle:
+                del self.sessions[name]
+            if idle:
+                logging.info(f"Evicted {len(idle)} idle sessions")
+
+    def queue_for_store(self, calculations: List[Calculation]) -> None:
+        """
+        Queue calculations for the shared store, waking the flusher when enough are dirty.
+
+        Safe to call from the executor threads that run session requests.
+
+        Args:
+            calculations (List[Calculation]): Calculations to append to the store.
+        """
+        with self._pending_lock:
+            self._pending.extend(calculations)
+            wake = len(self._pending) >= self.config.max_dirty_count
+        if wake and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wake_flusher.set)
+
+    async def _flush_store(self) -> None:
+        """Write queued calculations every flush_interval, or sooner when woken."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake_flusher.wait(), self.config.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake_flusher.clear()
+            try:
+                await self._write_pending()
+            except Exception as e:
+                logging.error(f"Background history flush failed: {e}")
+
+    async def _write_pending(self) -> None:
+        """Append the queued calculations to the store in an executor thread."""
+        with self._pending_lock:
+            calculations, self._pending = self._pending, []
+        if not calculations:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._store.apply, [('append', calculations)])
+        except Exception:
+            # Keep the calculations so the next flush retries them
+            with self._pending_lock:
+                self._pending[:0] = calculations
+            raise
+
+
+def run_server(
+    host: str = '127.0.0.1',
+    port: int = 8765,
+    unix_path: Optional[str] = None,
+    config: Optional[CalculatorConfig] = None
+) -> None:
+    """
+    Run a calculator server until interrupted.
+
+    Args:
+        host (str, optional): TCP interface to bind. Defaults to '127.0.0.1'.
+        port (int, optional): TCP port to bind. Defaults to 8765.
+        unix_path (Optional[str], optional): Listen on this Unix domain socket instead
+            of TCP. Defaults to None.
+        config (Optional[CalculatorConfig], optional): Server configuration. Defaults to a
+            new CalculatorConfig.
+    """
+    async def serve() -> None:
+        server = CalculatorServer(config)
+        listener = (
+            await server.start_unix(unix_path) if unix_path is not None
+            else await server.start_tcp(host, port)
+        )
+        print(f"Calculator server listening on {listener.sockets[0].getsockname()}", flush=True)
+        try:
+            await listener.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,221 @@
+########################
+# Decimal Math          #
+########################
+
+from decimal import Context, Decimal, getcontext
+from typing import Optional, Tuple
+
+# Extra digits carried by intermediate results before the final rounding
+GUARD_DIGITS = 5
+
+# Largest exact coefficient power, in bits, computed with Python integers.
+# Beyond it, integral powers use rounded Decimal arithmetic at guard precision.
+EXACT_BITS = 4096
+
+# Fractional exponents p/q with a larger q use Decimal exp/ln instead of
+# taking the qth root of a^p
+MAX_ROOT_DEGREE = 1000
+
+# Upper bound on Newton iterations; a float seed converges in a handful
+MAX_NEWTON_STEPS = 64
+
+
+def _guard_context(context: Context) -> Context:
+    """Copy a context with GUARD_DIGITS more precision."""
+    guard = context.copy()
+    guard.prec += GUARD_DIGITS
+    return guard
+
+
+def _exact_power(value: Decimal, n: int, context: Context) -> Optional[Decimal]:
+    """
+    Raise value to a non-negative integral power with one rounding.
+
+    With value = c * 10^e, the power c^n * 10^(e n) is computed with Python
+    integers and rounded once to the context, so the result is correctly
+    rounded (and exact when it fits). Returns None when c^n would exceed
+    EXACT_BITS or the exponent the context range.
+    """
+    sign, digits, exponent = value.as_tuple()
+    # log2(10) < 10/3 bits per digit
+    if len(digits) * n * 10 // 3 > EXACT_BITS or abs(exponent * n) > context.Emax:
+        return None
+    coefficient = int(Decimal((sign, digits, 0)))
+    return Decimal(coefficient ** n).scaleb(exponent * n, context)
+
+
+def _significant_digits(value: Decimal) -> Tuple[Tuple[int, ...], int]:
+    """Split a finite Decimal into its digits without trailing zeros and the matching exponent."""
+    _, digits, exponent = value.as_tuple()
+    end = len(digits)
+    while end > 1 and digits[end - 1] == 0:
+        end -= 1
+    return digits[:end], exponent + len(digits) - end
+
+
+def _is_exact_root(root: Decimal, n: int, a: Decimal) -> bool:
+    """Check root ** n == a exactly, rejecting on exponent or digit count before any power."""
+    digits, exponent = _significant_digits(root)
+    a_digits, a_exponent = _significant_digits(a)
+    if exponent * n != a_exponent:
+        return False
+    # An integer of d digits raised to n has between (d - 1) n + 1 and d n digits
+    if not (len(digits) - 1) * n < len(a_digits) <= len(digits) * n:
+        return False
+    coefficient = int(''.join(map(str, digits)))
+    return coefficient ** n == int(''.join(map(str, a_digits)))
+
+
+def _newton_root(a: Decimal, n: int, context: Context) -> Decimal:
+    """Approximate the nth root of a positive a by Newton iteration in the given context."""
+    # Seed from float, after moving a multiple of n out of the exponent so
+    # a^(1/n) = (a / 10^(kn))^(1/n) * 10^k stays within the float range
+    k = a.adjusted() // n
+    mantissa = float(a.scaleb(-k * n))
+    if mantissa < float('inf'):
+        x = Decimal(mantissa ** (1.0 / n)).scaleb(k)
+    else:
+        # Degrees above ~300: seed from a low precision exp/ln instead
+        rough = Context(prec=17)
+        x = rough.exp(rough.divide(rough.ln(a), n))
+
+    # x' = ((n - 1) x + a / x^(n - 1)) / n converges quadratically, and after
+    # the first step decreases towards the root; stop once rounding stalls it
+    for i in range(MAX_NEWTON_STEPS):
+        step = context.divide(
+            context.add(
+                context.multiply(n - 1, x),
+                context.divide(a, context.power(x, n - 1))
+            ),
+            n
+        )
+        if step == x or (i > 0 and step > x):
+            break
+        x = step
+    return x
+
+
+def _nth_root(a: Decimal, n: int, context: Context) -> Decimal:
+    """Take the nth root (n >= 2) of a non-negative a, correctly rounded or exact."""
+    if a == 0:
+        return Decimal(0)
+    if n == 2:
+        return a.sqrt(context)
+
+    # Float fast path: perfect powers of small integers, verified exactly
+    if a < 2 ** 53 and a == a.to_integral_value():
+        candidate = round(float(a) ** (1.0 / n))
+        if candidate ** n == int(a):
+            return Decimal(candidate)
+
+    result = context.plus(_newton_root(a, n, _guard_context(context)))
+    # Drop trailing zeros when the rounded root is exact, e.g. 3.375 ** (1/3)
+    if _is_exact_root(result, n, a):
+        return result.normalize(context)
+    return result
+
+
+def _exp_ln_power(a: Decimal, numerator: int, denominator: int, context: Context) -> Decimal:
+    """Raise a positive a to the power numerator/denominator through Decimal exp/ln."""
+    guard = _guard_context(context)
+    # The error in the exponent is scaled by ln(a), up to ln(10) * Emax for a
+    # representable result, so the exponent carries that many more digits
+    exponent = Context(prec=guard.prec + len(str(guard.Emax))).divide(numerator, denominator)
+    return context.plus(guard.power(a, exponent))
+
+
+def _rational_power(a: Decimal, numerator: int, denominator: int, context: Context) -> Decimal:
+    """Raise a to the power numerator/denominator (denominator > 0) in the context."""
+    if numerator == 0:
+        return Decimal(1)
+    if a == 0:
+        if numerator < 0:
+            raise ZeroDivisionError("Zero cannot be raised to a negative power")
+        return Decimal(0)
+    if numerator < 0:
+        inverse = _rational_power(a, -numerator, denominator, _guard_context(context))
+        return context.divide(1, inverse)
+
+    if denominator == 1:
+        if numerator == 1:
+            return context.plus(a)
+        exact = _exact_power(a, numerator, context)
+        if exact is not None:
+            return exact
+        # libmpdec raises integral powers by repeated squaring
+        return context.plus(_guard_context(context).power(a, numerator))
+
+    # a^p lies between 10^(p adjusted) and 10^(p (adjusted + 1)); when that can
+    # leave the exponent range, a^p over- or underflows even if a^(p/q) fits
+    adjusted = a.adjusted()
+    if (denominator > MAX_ROOT_DEGREE or (adjusted + 1) * numerator > context.Emax
+            or adjusted * numerator < context.Emin):
+        return _exp_ln_power(a, numerator, denominator, context)
+    # a^(p/q) is the qth root of a^p
+    return _nth_root(_rational_power(a, numerator, 1, _guard_context(context)), denominator, context)
+
+
+def decimal_power(a: Decimal, b: Decimal, context: Optional[Context] = None) -> Decimal:
+    """
+    Raise a to the power of b in Decimal arithmetic.
+
+    A finite Decimal exponent is an exact fraction p/q. Integral exponents
+    are computed with Python integers when small enough, so the result is
+    exact when it fits the precision and correctly rounded otherwise, and by
+    Decimal exponentiation by squaring at guard precision when not. Other
+    exponents take the qth root of a^p (see decimal_root), or use Decimal
+    exp/ln for large q and when a^p alone would overflow or underflow. No
+    float conversion limits the range or precision.
+
+    Args:
+        a (Decimal): Base number.
+        b (Decimal): Exponent.
+        context (Optional[Context], optional): Context giving the result precision.
+            Defaults to the current context.
+
+    Returns:
+        Decimal: a raised to the power of b, rounded to the context precision.
+
+    Raises:
+        ArithmeticError: If the result overflows or is undefined (zero raised to a
+            negative power, a negative base with a fractional exponent).
+    """
+    context = context or getcontext()
+    numerator, denominator = b.as_integer_ratio()
+    if a < 0 and denominator != 1:
+        # Let Decimal signal the undefined result
+        return context.power(a, b)
+    return _rational_power(a, numerator, denominator, context)
+
+
+def decimal_root(a: Decimal, b: Decimal, context: Optional[Context] = None) -> Decimal:
+    """
+    Take the bth root of a in Decimal arithmetic.
+
+    Square roots use Decimal.sqrt, which is correctly rounded. Other degrees
+    first try a float estimate rounded to an integer, returned only when it is
+    verified to be the exact root, then Newton iteration at guard precision
+    seeded from float. Exact roots are returned without trailing zeros. A
+    fractional degree p/q is the pth root of a^q.
+
+    Args:
+        a (Decimal): Number from which the root is taken, not negative.
+        b (Decimal): Degree of the root, not zero.
+        context (Optional[Context], optional): Context giving the result precision.
+            Defaults to the current context.
+
+    Returns:
+        Decimal: The bth root of a, rounded to the context precision.
+
+    Raises:
+        ArithmeticError: If the root is undefined (a zero degree, zero with a
+            negative degree).
+    """
+    context = context or getcontext()
+    numerator, denominator = b.as_integer_ratio()
+    if numerator == 0:
+        raise ZeroDivisionError("Zero root is undefined")
+    # The bth root is the power 1/b = denominator/numerator
+    if numerator < 0:
+        return _rational_power(a, -denominator, -numerator, context)
+    return _rational_power(a, denominator, numerator, context)
@@ -3,10 +3,460 @@
 ########################
 
 from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+import datetime
+from decimal import Decimal
+from itertools import islice
 import logging
-from typing import Any
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from app.calculation import Calculation
 
+# Sentinels marking a value kept in ColumnarHistory's overflow table
+_OVERFLOW_EXPONENT = -2 ** 31
+_OVERFLOW_TIMESTAMP = -2 ** 63
+
+# Sentinel exponent marking a Python int stored as the coefficient
+_INT_EXPONENT = 2 ** 31 - 1
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+class CalculationHistory:
+    """
+    Bounded calculation history backed by a ring buffer.
+
+    Stores at most max_size calculations. Appending to a full history evicts the
+    oldest entry in constant time, unlike list.pop(0) which shifts every element.
+    Supports len(), iteration, integer indexing (including negative indices) and
+    slicing, so it can be used wherever a list of calculations was used before.
+    """
+
+    def __init__(self, max_size: int, calculations: Iterable[Calculation] = ()):
+        """
+        Initialize the history.
+
+        Args:
+            max_size (int): Maximum number of calculations kept.
+            calculations (Iterable[Calculation], optional): Initial entries. Only the
+                newest max_size entries are kept. Defaults to ().
+
+        Raises:
+            ValueError: If max_size is not positive.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self._items: deque = deque(calculations, maxlen=max_size)
+
+    @property
+    def max_size(self) -> int:
+        """
+        Maximum number of calculations kept.
+
+        Returns:
+            int: The history capacity.
+        """
+        return self._items.maxlen
+
+    def append(self, calculation: Calculation) -> Optional[Calculation]:
+        """
+        Add a calculation, evicting the oldest one if the history is full.
+
+        Args:
+            calculation (Calculation): The calculation to add.
+
+        Returns:
+            Optional[Calculation]: The evicted calculation, or None if nothing was evicted.
+        """
+        evicted = self._items[0] if len(self._items) == self._items.maxlen else None
+        self._items.append(calculation)
+        return evicted
+
+    def extend(self, calculations: Iterable[Calculation]) -> List[Calculation]:
+        """
+        Add several calculations, evicting the oldest ones as needed.
+
+        Args:
+            calculations (Iterable[Calculation]): The calculations to add, oldest first.
+
+        Returns:
+            List[Calculation]: The evicted calculations that were stored before the call,
+                oldest first. Added calculations pushed out again by later ones in a
+                batch larger than the history are not included.
+        """
+        existing = len(self)
+        evicted = []
+        for calculation in calculations:
+            dropped = self.append(calculation)
+            if dropped is not None and len(evicted) < existing:
+                evicted.append(dropped)
+        return evicted
+
+    def pop(self) -> Calculation:
+        """
+        Remove and return the newest calculation.
+
+        Returns:
+            Calculation: The removed calculation.
+        """
+        return self._items.pop()
+
+    def popleft(self) -> Calculation:
+        """
+        Remove and return the oldest calculation.
+
+        Returns:
+            Calculation: The removed calculation.
+        """
+        return self._items.popleft()
+
+    def appendleft(self, calculation: Calculation) -> None:
+        """
+        Put a calculation back in front of the oldest one.
+
+        Used to restore evicted entries when undoing a change.
+
+        Args:
+            calculation (Calculation): The calculation to restore.
+
+        Raises:
+            IndexError: If the history is full.
+        """
+        if len(self._items) == self._items.maxlen:
+            raise IndexError("Cannot restore into a full history")
+        self._items.appendleft(calculation)
+
+    def clear(self) -> None:
+        """Remove every calculation."""
+        self._items.clear()
+
+    def copy(self) -> List[Calculation]:
+        """
+        Take a snapshot of the history.
+
+        Returns:
+            List[Calculation]: The calculations, oldest first.
+        """
+        return list(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Calculation]:
+        return iter(self._items)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Calculation, List[Calculation]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._items))
+            if step == 1:
+                return list(islice(self._items, start, max(start, stop)))
+            return [self._items[i] for i in range(start, stop, step)]
+        return self._items[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CalculationHistory):
+            return self._items == other._items
+        if isinstance(other, list):
+            return list(self._items) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CalculationHistory(max_size={self.max_size}, size={len(self._items)})"
+
+
+class ColumnarHistory:
+    """
+    Compact bounded calculation history stored as columns.
+
+    Drop-in replacement for CalculationHistory for very large histories. Rather
+    than one Calculation object per entry, each field lives in its own typed
+    array: interned operation codes, timestamps as int64 nanoseconds since the
+    epoch, and each Decimal as an int64 coefficient plus an int32 exponent
+    (ints from the integer fast path as the coefficient alone). That is about
+    46 bytes per entry. Values that do not fit (very long
+    coefficients, special values, aware timestamps) go to a small overflow
+    table. Reading an entry builds a lightweight Calculation view from the
+    columns, without recomputing its result.
+
+    The columns form a ring buffer that grows on demand up to max_size, so
+    eviction of the oldest entry is constant-time.
+    """
+
+    _DECIMAL_FIELDS = ('operand1', 'operand2', 'result')
+
+    def __init__(self, max_size: int, calculations: Iterable[Calculation] = ()):
+        """
+        Initialize the history.
+
+        Args:
+            max_size (int): Maximum number of calculations kept.
+            calculations (Iterable[Calculation], optional): Initial entries. Only the
+                newest max_size entries are kept. Defaults to ().
+
+        Raises:
+            ValueError: If max_size is not positive.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self._max_size = max_size
+        self._operation_names: List[str] = []
+        self._operation_codes: Dict[str, int] = {}
+        self._reset()
+        self.extend(calculations)
+
+    def _reset(self) -> None:
+        """Drop every entry and release the column storage."""
+        self._start = 0
+        self._size = 0
+        self._operations = array('H')
+        self._timestamps = array('q')
+        self._coefficients = [array('q') for _ in self._DECIMAL_FIELDS]
+        self._exponents = [array('i') for _ in self._DECIMAL_FIELDS]
+        self._overflow: Dict[Tuple[int, int], Any] = {}
+
+    @property
+    def max_size(self) -> int:
+        """
+        Maximum number of calculations kept.
+
+        Returns:
+            int: The history capacity.
+        """
+        return self._max_size
+
+    def _intern(self, operation: str) -> int:
+        """Return the code for an operation name, assigning one if needed."""
+        code = self._operation_codes.get(operation)
+        if code is None:
+            code = len(self._operation_names)
+            self._operation_names.append(operation)
+            self._operation_codes[operation] = code
+        return code
+
+    def _grow(self) -> None:
+        """Double the allocated slots (up to max_size), unwrapping the ring."""
+        allocated = len(self._operations)
+        order = [(self._start + i) % allocated for i in range(self._size)] if allocated else []
+        extra = min(self._max_size, max(allocated * 2, 8)) - self._size
+
+        def relayout(column: array) -> array:
+            new_column = array(column.typecode, (column[i] for i in order))
+            new_column.extend([0] * extra)
+            return new_column
+
+        self._operations = relayout(self._operations)
+        self._timestamps = relayout(self._timestamps)
+        self._coefficients = [relayout(column) for column in self._coefficients]
+        self._exponents = [relayout(column) for column in self._exponents]
+        remap = {old: new for new, old in enumerate(order)}
+        self._overflow = {(field, remap[slot]): value for (field, slot), value in self._overflow.items()}
+        self._start = 0
+
+    def _write(self, slot: int, calculation: Calculation) -> None:
+        """Store a calculation's fields in a physical slot."""
+        self._operations[slot] = self._intern(calculation.operation)
+
+        timestamp = calculation.timestamp
+        self._overflow.pop((3, slot), None)
+        nanoseconds = (
+            (timestamp - _EPOCH) // _ONE_MICROSECOND * 1000
+            if timestamp.tzinfo is None else None
+        )
+        if nanoseconds is not None and _OVERFLOW_TIMESTAMP < nanoseconds < 2 ** 63:
+            self._timestamps[slot] = nanoseconds
+        else:
+            self._timestamps[slot] = _OVERFLOW_TIMESTAMP
+            self._overflow[(3, slot)] = timestamp
+
+        for field, name in enumerate(self._DECIMAL_FIELDS):
+            value = getattr(calculation, name)
+            self._overflow.pop((field, slot), None)
+            if type(value) is int and -2 ** 63 <= value < 2 ** 63:
+                self._coefficients[field][slot] = value
+                self._exponents[field][slot] = _INT_EXPONENT
+                continue
+            sign, digits, exponent = (
+                value.as_tuple() if isinstance(value, Decimal) else (0, (), None)
+            )
+            # Exact int64 coefficient / int32 exponent when possible; -0,
+            # special values (NaN, Infinity) and non-Decimals keep the original object
+            if (
+                digits
+                and isinstance(exponent, int)
+                and len(digits) <= 18
+                and _OVERFLOW_EXPONENT < exponent < _INT_EXPONENT
+                and (not sign or any(digits))
+            ):
+                coefficient = int(''.join(map(str, digits)))
+                self._coefficients[field][slot] = -coefficient if sign else coefficient
+                self._exponents[field][slot] = exponent
+            else:
+                self._exponents[field][slot] = _OVERFLOW_EXPONENT
+                self._overflow[(field, slot)] = value
+
+    def _read(self, slot: int) -> Calculation:
+        """Build a Calculation view from a physical slot."""
+        values = []
+        for field in range(len(self._DECIMAL_FIELDS)):
+            exponent = self._exponents[field][slot]
+            if exponent == _OVERFLOW_EXPONENT:
+                values.append(self._overflow[(field, slot)])
+            elif exponent == _INT_EXPONENT:
+                values.append(self._coefficients[field][slot])
+            else:
+                values.append(Decimal(f"{self._coefficients[field][slot]}E{exponent}"))
+
+        nanoseconds = self._timestamps[slot]
+        if nanoseconds == _OVERFLOW_TIMESTAMP:
+            timestamp = self._overflow[(3, slot)]
+        else:
+            timestamp = _EPOCH + datetime.timedelta(microseconds=nanoseconds // 1000)
+
+        return Calculation(
+            operation=self._operation_names[self._operations[slot]],
+            operand1=values[0],
+            operand2=values[1],
+            result=values[2],
+            timestamp=timestamp
+        )
+
+    def _slot(self, index: int) -> int:
+        """Map a logical index (oldest first) to a physical slot."""
+        return (self._start + index) % len(self._operations)
+
+    def append(self, calculation: Calculation) -> Optional[Calculation]:
+        """
+        Add a calculation, evicting the oldest one if the history is full.
+
+        Args:
+            calculation (Calculation): The calculation to add.
+
+        Returns:
+            Optional[Calculation]: The evicted calculation, or None if nothing was evicted.
+        """
+        if self._size == self._max_size:
+            evicted = self._read(self._start)
+            self._write(self._start, calculation)
+            self._start = (self._start + 1) % len(self._operations)
+            return evicted
+        if self._size == len(self._operations):
+            self._grow()
+        self._write(self._slot(self._size), calculation)
+        self._size += 1
+        return None
+
+    def extend(self, calculations: Iterable[Calculation]) -> List[Calculation]:
+        """
+        Add several calculations, evicting the oldest ones as needed.
+
+        Args:
+            calculations (Iterable[Calculation]): The calculations to add, oldest first.
+
+        Returns:
+            List[Calculation]: The evicted calculations that were stored before the call,
+                oldest first. Added calculations pushed out again by later ones in a
+                batch larger than the history are not included.
+        """
+        existing = len(self)
+        evicted = []
+        for calculation in calculations:
+            dropped = self.append(calculation)
+            if dropped is not None and len(evicted) < existing:
+                evicted.append(dropped)
+        return evicted
+
+    def pop(self) -> Calculation:
+        """
+        Remove and return the newest calculation.
+
+        Returns:
+            Calculation: The removed calculation.
+
+        Raises:
+            IndexError: If the history is empty.
+        """
+        if not self._size:
+            raise IndexError("pop from an empty history")
+        calculation = self._read(self._slot(self._size - 1))
+        self._size -= 1
+        return calculation
+
+    def popleft(self) -> Calculation:
+        """
+        Remove and return the oldest calculation.
+
+        Returns:
+            Calculation: The removed calculation.
+
+        Raises:
+            IndexError: If the history is empty.
+        """
+        if not self._size:
+            raise IndexError("pop from an empty history")
+        calculation = self._read(self._start)
+        self._start = self._slot(1)
+        self._size -= 1
+        return calculation
+
+    def appendleft(self, calculation: Calculation) -> None:
+        """
+        Put a calculation back in front of the oldest one.
+
+        Used to restore evicted entries when undoing a change.
+
+        Args:
+            calculation (Calculation): The calculation to restore.
+
+        Raises:
+            IndexError: If the history is full.
+        """
+        if self._size == self._max_size:
+            raise IndexError("Cannot restore into a full history")
+        if self._size == len(self._operations):
+            self._grow()
+        self._start = (self._start - 1) % len(self._operations)
+        self._write(self._start, calculation)
+        self._size += 1
+
+    def clear(self) -> None:
+        """Remove every calculation."""
+        self._reset()
+
+    def copy(self) -> List[Calculation]:
+        """
+        Take a snapshot of the history.
+
+        Returns:
+            List[Calculation]: The calculations, oldest first.
+        """
+        return list(self)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Calculation]:
+        for index in range(self._size):
+            yield self._read(self._slot(index))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Calculation, List[Calculation]]:
+        if isinstance(index, slice):
+            return [self._read(self._slot(i)) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("history index out of range")
+        return self._read(self._slot(index))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (CalculationHistory, ColumnarHistory, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ColumnarHistory(max_size={self._max_size}, size={self._size})"
+
 
 class HistoryObserver(ABC):
     """
@@ -27,6 +477,51 @@ class HistoryObserver(ABC):
         """
         pass  # pragma: no cover
 
+    def update_batch(self, calculations: List[Calculation]) -> None:
+        """
+        Handle a batch of new calculations.
+
+        The default implementation forwards each calculation to update. Observers
+        with a per-event cost (such as saving) can override it to react once.
+
+        Args:
+            calculations (List[Calculation]): The calculations that were performed.
+        """
+        for calculation in calculations:
+            self.update(calculation)
+
+
+class AsyncHistoryObserver(ABC):
+    """
+    Abstract base class for coroutine observers.
+
+    Counterpart of HistoryObserver for observers registered on an
+    AsyncCalculator. Their update methods are awaited on the event loop, so
+    they can do asynchronous I/O without blocking it.
+    """
+
+    @abstractmethod
+    async def update(self, calculation: Calculation) -> None:
+        """
+        Handle new calculation event.
+
+        Args:
+            calculation (Calculation): The calculation that was performed.
+        """
+        pass  # pragma: no cover
+
+    async def update_batch(self, calculations: List[Calculation]) -> None:
+        """
+        Handle a batch of new calculations.
+
+        The default implementation awaits update for each calculation in order.
+
+        Args:
+            calculations (List[Calculation]): The calculations that were performed.
+        """
+        for calculation in calculations:
+            await self.update(calculation)
+
 
 class LoggingObserver(HistoryObserver):
     """
@@ -62,6 +557,12 @@ class AutoSaveObserver(HistoryObserver):
     Implements the Observer pattern by listening for new calculations and
     triggering an automatic save of the calculation history if the auto-save
     feature is enabled in the configuration.
+
+    With the 'write_behind' durability setting, calculations are queued and a
+    background thread writes them out every flush_interval seconds, or sooner
+    once max_dirty_count calculations are pending. This keeps disk I/O off the
+    calculation path at the cost of losing unflushed calculations on a crash.
+    Call close() before exiting to flush whatever is still pending.
     """
 
     def __init__(self, calculator: Any):
@@ -79,18 +580,113 @@ class AutoSaveObserver(HistoryObserver):
             raise TypeError("Calculator must have 'config' and 'save_history' attributes")
         self.calculator = calculator
 
+        # Write-behind state: pending calculations and the flusher thread
+        self._pending: List[Calculation] = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if calculator.config.durability == 'write_behind':
+            self._flusher = threading.Thread(
+                target=self._run_flusher,
+                name="history-flusher",
+                daemon=True
+            )
+            self._flusher.start()
+
     def update(self, calculation: Calculation) -> None:
         """
         Trigger auto-save.
 
         This method is called whenever a new calculation is performed. If the
-        auto-save feature is enabled, it saves the current calculation history.
+        auto-save feature is enabled, it saves the current calculation history,
+        or queues the calculation for the background flusher in write-behind mode.
 
         Args:
             calculation (Calculation): The calculation that was performed.
         """
         if calculation is None:
             raise AttributeError("Calculation cannot be None")
-        if self.calculator.config.auto_save:
+        self._save([calculation])
+
+    def update_batch(self, calculations: List[Calculation]) -> None:
+        """
+        Trigger a single auto-save for a batch of calculations.
+
+        Args:
+            calculations (List[Calculation]): The calculations that were performed.
+        """
+        if calculations:
+            self._save(calculations)
+
+    def _save(self, calculations: List[Calculation]) -> None:
+        """
+        Save now, or queue the calculations in write-behind mode.
+
+        Args:
+            calculations (List[Calculation]): The calculations that were performed.
+        """
+        config = self.calculator.config
+        if not config.auto_save:
+            return
+        if self._flusher is None:
+            self._write(calculations)
+            return
+        with self._pending_lock:
+            self._pending.extend(calculations)
+            dirty_count = len(self._pending)
+        if dirty_count >= config.max_dirty_count:
+            self._wake.set()
+
+    def _write(self, calculations: List[Calculation]) -> None:
+        """
+        Save history using the configured write mode.
+
+        In 'append' mode only the new calculations are written; otherwise the
+        whole history file is rewritten.
+
+        Args:
+            calculations (List[Calculation]): The calculations that were performed.
+        """
+        if self.calculator.config.history_write_mode == 'append':
+            self.calculator.append_history(calculations)
+        else:
             self.calculator.save_history()
-            logging.info("History auto-saved")
+        logging.info("History auto-saved")
+
+    def flush(self) -> None:
+        """
+        Write all pending calculations.
+
+        Does nothing when no calculations are pending.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+            if pending:
+                self._write(pending)
+
+    def _run_flusher(self) -> None:
+        """Background loop flushing pending calculations until closed."""
+        interval = self.calculator.config.flush_interval
+        while not self._stopped.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logging.error(f"Background history flush failed: {e}")
+
+    def close(self) -> None:
+        """
+        Stop the background flusher and flush pending calculations.
+
+        Safe to call more than once, and a no-op outside write-behind mode.
+        """
+        if self._flusher is not None:
+            self._stopped.set()
+            self._wake.set()
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
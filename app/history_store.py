@@ -0,0 +1,180 @@
+########################
+# SQLite History Store #
+########################
+
+from contextlib import closing
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.calculation import Calculation
+
+# A pending change to the stored history, replayed by SQLiteHistoryStore.apply:
+# ('append', calculations), ('drop', count) or ('clear', None)
+HistoryChange = Tuple[str, Any]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS calculations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    operation TEXT NOT NULL,
+    operand1 TEXT NOT NULL,
+    operand2 TEXT NOT NULL,
+    result TEXT NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_calculations_operation ON calculations (operation);
+CREATE INDEX IF NOT EXISTS idx_calculations_timestamp ON calculations (timestamp);
+"""
+
+_COLUMNS = "operation, operand1, operand2, result, timestamp"
+
+
+class SQLiteHistoryStore:
+    """
+    Calculation history persisted in a SQLite database.
+
+    Holds the complete history on disk, so only a window of recent calculations
+    needs to live in memory. Writes are batched into a single transaction and
+    reads are paged by primary key. The operation and timestamp columns are
+    indexed for filtered queries.
+    """
+
+    def __init__(self, db_file: Path):
+        """
+        Open (and create if needed) the history database.
+
+        Args:
+            db_file (Path): Path of the SQLite database file.
+        """
+        self.db_file = db_file
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        # The connection is shared with the write-behind flusher thread,
+        # so every access goes through the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_file), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def _row_values(calculation: Calculation) -> Tuple[str, str, str, str, str]:
+        """Serialize a calculation into a table row."""
+        return (
+            str(calculation.operation),
+            str(calculation.operand1),
+            str(calculation.operand2),
+            str(calculation.result),
+            calculation.timestamp.isoformat()
+        )
+
+    @staticmethod
+    def _row_dict(row: Sequence[Any]) -> Dict[str, Any]:
+        """Convert a selected row into the dictionary used by Calculation.from_dict."""
+        return {
+            'operation': row[0],
+            'operand1': row[1],
+            'operand2': row[2],
+            'result': row[3],
+            'timestamp': row[4]
+        }
+
+    def apply(self, changes: List[HistoryChange]) -> None:
+        """
+        Replay pending history changes in a single transaction.
+
+        Args:
+            changes (List[HistoryChange]): Changes in the order they happened.
+        """
+        if not changes:
+            return
+        with self._lock, self._conn:
+            for kind, payload in changes:
+                if kind == 'append':
+                    self._conn.executemany(
+                        f"INSERT INTO calculations ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                        [self._row_values(calc) for calc in payload]
+                    )
+                elif kind == 'drop':
+                    self._conn.execute(
+                        "DELETE FROM calculations WHERE id IN "
+                        "(SELECT id FROM calculations ORDER BY id DESC LIMIT ?)",
+                        (payload,)
+                    )
+                elif kind == 'clear':
+                    self._conn.execute("DELETE FROM calculations")
+                else:
+                    raise ValueError(f"Unknown history change: {kind}")
+
+    def count(self, operation: Optional[str] = None) -> int:
+        """
+        Count stored calculations.
+
+        Args:
+            operation (Optional[str], optional): Only count this operation. Defaults to None.
+
+        Returns:
+            int: Number of stored calculations.
+        """
+        query = "SELECT COUNT(*) FROM calculations"
+        params: Tuple[Any, ...] = ()
+        if operation is not None:
+            query += " WHERE operation = ?"
+            params = (operation,)
+        with self._lock, closing(self._conn.execute(query, params)) as cursor:
+            return cursor.fetchone()[0]
+
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Read the newest calculations.
+
+        Args:
+            limit (int): Maximum number of rows to read.
+
+        Returns:
+            List[Dict[str, Any]]: The rows, oldest first.
+        """
+        query = (
+            f"SELECT {_COLUMNS} FROM calculations ORDER BY id DESC LIMIT ?"
+        )
+        with self._lock, closing(self._conn.execute(query, (limit,))) as cursor:
+            rows = cursor.fetchall()
+        return [self._row_dict(row) for row in reversed(rows)]
+
+    def iter_pages(
+        self,
+        page_size: int = 1000,
+        operation: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Read the stored history page by page, oldest first.
+
+        Pages are fetched with keyset pagination on the primary key, so memory
+        use is bounded by the page size rather than the history size.
+
+        Args:
+            page_size (int, optional): Rows per page. Defaults to 1000.
+            operation (Optional[str], optional): Only read this operation. Defaults to None.
+
+        Yields:
+            List[Dict[str, Any]]: One page of rows.
+        """
+        last_id = 0
+        while True:
+            query = f"SELECT id, {_COLUMNS} FROM calculations WHERE id > ?"
+            params: List[Any] = [last_id]
+            if operation is not None:
+                query += " AND operation = ?"
+                params.append(operation)
+            query += " ORDER BY id LIMIT ?"
+            params.append(page_size)
+            with self._lock, closing(self._conn.execute(query, params)) as cursor:
+                rows = cursor.fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [self._row_dict(row[1:]) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
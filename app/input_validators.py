@@ -3,10 +3,43 @@
 ########################
 
 from dataclasses import dataclass
-from decimal import Decimal, InvalidOperation
-from typing import Any
+from decimal import MAX_EMAX, MAX_PREC, MIN_EMIN, Context, Decimal, InvalidOperation, getcontext
+import math
+from typing import Any, Dict, Iterable, List, Optional
 from app.calculator_config import CalculatorConfig
 from app.exception import ValidationError
+from app.numeric_backend import NUMERIC_BACKENDS, get_backend
+
+# Normalizes operands without rounding them; the calculator's Decimal context
+# only applies to results. The bound Context method is cheaper to call than
+# Decimal.normalize with a context argument.
+_normalize_exactly = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN).normalize
+
+# Bound try_convert of each numeric backend, found without calling get_backend
+_TRY_CONVERT = {name: backend.try_convert for name, backend in NUMERIC_BACKENDS.items()}
+
+# Integer form of each max_input_value seen, so int operands are compared
+# with an int instead of a Decimal
+_INTEGER_BOUNDS: Dict[Any, Any] = {}
+
+
+def _integer_bound(max_value: Any) -> Any:
+    """Largest allowed int magnitude for a max_input_value (the value itself when infinite)."""
+    bound = _INTEGER_BOUNDS.get(max_value)
+    if bound is None:
+        bound = math.floor(max_value) if Decimal(max_value).is_finite() else max_value
+        _INTEGER_BOUNDS[max_value] = bound
+    return bound
+
+
+@dataclass
+class ValidatedColumn:
+    """Result of validating a column of inputs."""
+
+    values: List[Any]  # Converted value per input, None where it is invalid
+    error_mask: List[bool]  # True where the input is invalid
+    errors: List[Optional[str]]  # Error message per input, None where it is valid
+
 
 @dataclass
 class InputValidator:
@@ -15,24 +48,126 @@ class InputValidator:
     @staticmethod
     def validate_number(value: Any, config: CalculatorConfig) -> Decimal:
         """
-        Validate and convert input to Decimal.
+        Validate and convert input to the configured numeric backend's type.
         
         Args:
             value: Input value to validate
             config: Calculator configuration
             
         Returns:
-            Decimal: Validated and converted number
+            Decimal: Validated and converted number (an int for integral input,
+                a float or Fraction with the 'float' or 'fraction' backend)
             
         Raises:
             ValidationError: If input is invalid
         """
-        try:
+        max_value = config.max_input_value
+        value_type = type(value)
+        if value_type is str and config.numeric_backend == 'decimal':
+            # Strings for the default backend, the most common input, are
+            # converted inline as DecimalBackend.try_convert does, which saves
+            # a call per operand
+            if value.isdecimal() and len(value) <= getcontext().prec:
+                number = int(value)
+                if number <= _integer_bound(max_value):
+                    return number
+            else:
+                try:
+                    number = Decimal(value)
+                except InvalidOperation:
+                    raise ValidationError(f"Invalid number format: {value.strip()}") from None
+                if not number.is_finite():
+                    number = None
+                elif number.copy_abs() <= max_value:
+                    return _normalize_exactly(number)
+        elif value_type is float and config.numeric_backend == 'decimal' and not value.is_integer():
+            # Likewise for fractional floats, as the Decimal of their shortest repr
+            number = Decimal(repr(value))
+            if not number.is_finite():
+                number = None
+            elif number.copy_abs() <= max_value:
+                return _normalize_exactly(number)
+        else:
+            try_convert = _TRY_CONVERT.get(config.numeric_backend)
+            if try_convert is None:
+                # Raises the unknown backend error
+                try_convert = get_backend(config.numeric_backend).try_convert
+            number = try_convert(value)
+            # Inline check for the common valid Decimal and int inputs
+            number_type = type(number)
+            if number_type is Decimal:
+                if number.copy_abs() <= max_value:
+                    return _normalize_exactly(number)
+            elif number_type is int:
+                if abs(number) <= _integer_bound(max_value):
+                    return number
+        error = InputValidator._check(value, number, _integer_bound(max_value), max_value)
+        if error is not None:
+            raise ValidationError(error)
+        return number
+
+    @staticmethod
+    def validate_many(values: Iterable[Any], config: CalculatorConfig) -> ValidatedColumn:
+        """
+        Validate and convert a whole column of inputs.
+
+        Each input is checked like validate_number, but invalid inputs are
+        reported in the error mask instead of raising, and the backend and
+        bounds are looked up once per column.
+
+        Args:
+            values (Iterable[Any]): Inputs to validate.
+            config (CalculatorConfig): Calculator configuration.
+
+        Returns:
+            ValidatedColumn: Converted values, error mask and error messages, one per input.
+        """
+        try_convert = get_backend(config.numeric_backend).try_convert
+        inline_strings = config.numeric_backend == 'decimal'
+        max_value = config.max_input_value
+        integer_bound = _integer_bound(max_value)
+        max_digits = getcontext().prec
+        converted: List[Any] = []
+        errors: List[Optional[str]] = []
+        for value in values:
+            if type(value) is str and inline_strings:
+                # Converted inline like validate_number does
+                if value.isdecimal() and len(value) <= max_digits:
+                    number = int(value)
+                else:
+                    try:
+                        number = Decimal(value)
+                    except InvalidOperation:
+                        number = None
+                    else:
+                        if not number.is_finite():
+                            number = None
+            else:
+                number = try_convert(value)
+            # Inline check for the common valid int and Decimal inputs
+            if type(number) is int and abs(number) <= integer_bound:
+                converted.append(number)
+                errors.append(None)
+            elif type(number) is Decimal and number.copy_abs() <= max_value:
+                converted.append(_normalize_exactly(number))
+                errors.append(None)
+            else:
+                error = InputValidator._check(value, number, integer_bound, max_value)
+                converted.append(None if error is not None else number)
+                errors.append(error)
+        return ValidatedColumn(
+            values=converted,
+            error_mask=[error is not None for error in errors],
+            errors=errors
+        )
+
+    @staticmethod
+    def _check(value: Any, number: Any, integer_bound: Any, max_value: Any) -> Optional[str]:
+        """Bound-check a converted input, returning an error message when it is invalid."""
+        if number is None:
             if isinstance(value, str):
                 value = value.strip()
-            number = Decimal(str(value))
-            if abs(number) > config.max_input_value:
-                raise ValidationError(f"Value exceeds maximum allowed: {config.max_input_value}")
-            return number.normalize()
-        except InvalidOperation as e:
-            raise ValidationError(f"Invalid number format: {value}") from e
+            return f"Invalid number format: {value}"
+        if abs(number) > (integer_bound if type(number) is int else max_value):
+            return f"Value exceeds maximum allowed: {max_value}"
+        return None
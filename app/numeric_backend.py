@@ -0,0 +1,422 @@
+########################
+# Numeric Backends      #
+########################
+
+from abc import ABC, abstractmethod
+from decimal import Decimal, getcontext
+from fractions import Fraction
+import math
+import operator
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from app.decimal_math import decimal_power, decimal_root
+
+# Largest exact power, in bits, computed by the fraction backend
+MAX_FRACTION_BITS = 1_000_000
+
+# Columns shorter than this are computed in plain Python even when NumPy is
+# installed; converting to arrays costs more than it saves
+NUMPY_MIN_ROWS = 64
+
+
+def is_integral(value: Any) -> bool:
+    """
+    Check whether a finite number has no fractional part.
+
+    Args:
+        value (Any): A Decimal, float, Fraction or int.
+
+    Returns:
+        bool: True if the value is a whole number.
+    """
+    if isinstance(value, Decimal):
+        return value == value.to_integral_value()
+    return value == math.floor(value)
+
+
+def integer_result(value: int) -> Union[int, Decimal]:
+    """
+    Keep an int result exact while Decimal arithmetic would keep it exact too.
+
+    An int below 2^(3 prec) has at most prec digits, so Decimal arithmetic
+    would hold it exactly as well. Larger values are converted to a Decimal
+    rounded to the context precision, the same result Decimal arithmetic on
+    the operands would give.
+
+    Args:
+        value (int): An exact integer result.
+
+    Returns:
+        Union[int, Decimal]: The int, or the rounded Decimal when it exceeds the precision.
+    """
+    context = getcontext()
+    if value.bit_length() <= 3 * context.prec:
+        return value
+    return context.plus(Decimal(value))
+
+
+def _integer_root(value: int, n: int) -> int:
+    """Largest integer whose nth power does not exceed value (value >= 0, n >= 1)."""
+    if value < 2:
+        return value
+    if n >= value.bit_length():
+        # 2^n > value, so the root is below 2
+        return 1
+    # Newton iteration from 2^ceil(bits / n), which is above the root
+    x = 1 << -(-value.bit_length() // n)
+    while True:
+        y = ((n - 1) * x + value // x ** (n - 1)) // n
+        if y >= x:
+            return x
+        x = y
+
+
+class NumericBackend(ABC):
+    """
+    Number representation used for operands and results.
+
+    A backend converts user input and persisted text into its number type
+    and provides the power and root kernels, which cannot be written with
+    plain operators. The other operations use Python operators, which every
+    backend's number type supports.
+    """
+
+    name: str = ''
+
+    @abstractmethod
+    def convert(self, value: Any) -> Any:
+        """
+        Convert user input to the backend's number type.
+
+        Args:
+            value (Any): A string or number.
+
+        Returns:
+            Any: The converted, finite number.
+
+        Raises:
+            ValueError: If the value is not a finite number.
+        """
+        pass  # pragma: no cover
+
+    def try_convert(self, value: Any) -> Any:
+        """
+        Convert user input, returning None instead of raising when it is invalid.
+
+        Args:
+            value (Any): A string or number.
+
+        Returns:
+            Any: The converted, finite number, or None.
+        """
+        try:
+            return self.convert(value)
+        except (ArithmeticError, ValueError, TypeError):
+            return None
+
+    def parse(self, text: str) -> Any:
+        """
+        Convert persisted text back to the backend's number type.
+
+        Args:
+            text (str): Text written by str() of a number.
+
+        Returns:
+            Any: The number.
+        """
+        return self.convert(text)
+
+    @abstractmethod
+    def power(self, a: Any, b: Any) -> Any:
+        """Raise a to the power of b."""
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def root(self, a: Any, b: Any) -> Any:
+        """Take the bth root of a."""
+        pass  # pragma: no cover
+
+
+class DecimalBackend(NumericBackend):
+    """
+    Decimal numbers at the Decimal context precision (the default).
+
+    Integral input (an int, or a string of plain digits) is kept as a Python int,
+    which is much cheaper than Decimal for the common whole-number case.
+    Operations that need Decimal (division, percent, power, root) promote
+    ints; the others stay int until a result exceeds the context precision
+    (see integer_result). Other strings, including signed or padded
+    integers, go straight to the Decimal constructor, which is cheaper than
+    any syntax check written in Python.
+    Input is never rounded: integers beyond the precision become exact
+    Decimals, and only results are rounded to the context.
+    """
+
+    name = 'decimal'
+
+    def __init__(self):
+        # Conversion of other input by exact type (strings and floats are
+        # converted inline); remaining types go through str()
+        self._converters: Dict[type, Callable[[Any], Optional[Union[int, Decimal]]]] = {
+            int: self._from_int,
+            Decimal: self._from_decimal,
+        }
+
+    def convert(self, value: Any) -> Union[int, Decimal]:
+        number = self.try_convert(value)
+        if number is None:
+            raise ValueError(f"Not a finite number: {value}")
+        return number
+
+    def try_convert(self, value: Any) -> Optional[Union[int, Decimal]]:
+        if type(value) is str:
+            # Strings, the most common input: digit strings of up to prec digits,
+            # which Decimal would hold exactly too, become ints; anything else
+            # gets a single Decimal() attempt, which also strips whitespace
+            if value.isdecimal() and len(value) <= getcontext().prec:
+                return int(value)
+            try:
+                number = Decimal(value)
+            except (ArithmeticError, ValueError):
+                return None
+        elif type(value) is float:
+            # The Decimal of the shortest repr, as users read the float; repr
+            # gives 'inf' and 'nan' for non-finite floats, rejected below
+            if value.is_integer() and abs(value) < 2 ** 53:
+                return self._from_int(int(value))
+            number = Decimal(repr(value))
+        else:
+            converter = self._converters.get(type(value))
+            if converter is not None:
+                return converter(value)
+            try:
+                number = Decimal(str(value))
+            except (ArithmeticError, ValueError, TypeError):
+                return None
+        return number if number.is_finite() else None
+
+    @staticmethod
+    def _from_int(value: int) -> Union[int, Decimal]:
+        """Keep an int input as an int while it fits the precision, else as the exact Decimal."""
+        if value.bit_length() <= 3 * getcontext().prec:
+            return value
+        return Decimal(value)
+
+    @staticmethod
+    def _from_decimal(value: Decimal) -> Optional[Decimal]:
+        """Accept a finite Decimal as is."""
+        return value if value.is_finite() else None
+
+    def power(self, a: Union[int, Decimal], b: Union[int, Decimal]) -> Decimal:
+        return decimal_power(Decimal(a), Decimal(b))
+
+    def root(self, a: Union[int, Decimal], b: Union[int, Decimal]) -> Decimal:
+        return decimal_root(Decimal(a), Decimal(b))
+
+
+class FloatBackend(NumericBackend):
+    """
+    Binary floating point, the fastest backend.
+
+    Results carry about 16 significant digits. Large columns of additions,
+    subtractions and multiplications are computed with NumPy when it is
+    installed.
+    """
+
+    name = 'float'
+
+    def convert(self, value: Any) -> float:
+        number = float(value.strip() if isinstance(value, str) else value)
+        if not math.isfinite(number):
+            raise ValueError(f"Not a finite number: {value}")
+        return number
+
+    def power(self, a: float, b: float) -> float:
+        if a == 0 and b < 0:
+            raise ZeroDivisionError("Zero cannot be raised to a negative power")
+        return math.pow(a, b)
+
+    def root(self, a: float, b: float) -> float:
+        return self.power(a, 1.0 / b)
+
+
+class FractionBackend(NumericBackend):
+    """
+    Exact rational numbers.
+
+    Every operation is exact, including fractional powers and roots whose
+    result is rational. Irrational results (e.g. the square root of 2) are
+    computed in Decimal at the context precision and stored as the exact
+    fraction of that Decimal.
+    """
+
+    name = 'fraction'
+
+    def convert(self, value: Any) -> Fraction:
+        if isinstance(value, float) and not math.isfinite(value):
+            raise ValueError(f"Not a finite number: {value}")
+        return Fraction(value.strip() if isinstance(value, str) else value)
+
+    def power(self, a: Fraction, b: Fraction) -> Fraction:
+        if b.denominator == 1:
+            return self._exact_power(a, b.numerator)
+        return self._rational_root(self._exact_power(a, b.numerator), b.denominator)
+
+    def root(self, a: Fraction, b: Fraction) -> Fraction:
+        if b == 0:
+            raise ZeroDivisionError("Zero root is undefined")
+        # The bth root is the power 1/b
+        inverse = 1 / b
+        return self._rational_root(self._exact_power(a, inverse.numerator), inverse.denominator)
+
+    @staticmethod
+    def _exact_power(a: Fraction, n: int) -> Fraction:
+        """Raise a to an integral power, refusing results too large to hold exactly."""
+        size = max(a.numerator.bit_length(), a.denominator.bit_length())
+        if size * abs(n) > MAX_FRACTION_BITS:
+            raise OverflowError("Result too large for exact fraction arithmetic")
+        return a ** n
+
+    @staticmethod
+    def _rational_root(a: Fraction, n: int) -> Fraction:
+        """Take the nth root (n >= 1) of a non-negative a, exactly when it is rational."""
+        if n == 1:
+            return a
+        numerator = _integer_root(a.numerator, n)
+        denominator = _integer_root(a.denominator, n)
+        if numerator ** n == a.numerator and denominator ** n == a.denominator:
+            return Fraction(numerator, denominator)
+        # Irrational: round in Decimal, then keep that value exactly
+        context = getcontext()
+        value = context.divide(Decimal(a.numerator), Decimal(a.denominator))
+        return Fraction(decimal_root(value, Decimal(n), context))
+
+
+NUMERIC_BACKENDS: Dict[str, NumericBackend] = {
+    backend.name: backend
+    for backend in (DecimalBackend(), FloatBackend(), FractionBackend())
+}
+
+# Backends by number type, for kernels that receive numbers without a config
+_BACKENDS_BY_TYPE: Dict[type, NumericBackend] = {
+    Decimal: NUMERIC_BACKENDS['decimal'],
+    float: NUMERIC_BACKENDS['float'],
+    Fraction: NUMERIC_BACKENDS['fraction'],
+}
+
+
+def get_backend(name: str) -> NumericBackend:
+    """
+    Get a numeric backend by name.
+
+    Args:
+        name (str): 'decimal', 'float' or 'fraction'.
+
+    Returns:
+        NumericBackend: The backend.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    backend = NUMERIC_BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown numeric backend: {name}")
+    return backend
+
+
+def backend_for(value: Any) -> NumericBackend:
+    """
+    Get the backend whose number type a value has.
+
+    Args:
+        value (Any): A Decimal, int, float or Fraction.
+
+    Returns:
+        NumericBackend: The matching backend; the Decimal backend for ints and other types.
+    """
+    return _BACKENDS_BY_TYPE.get(type(value), NUMERIC_BACKENDS['decimal'])
+
+
+def format_number(value: Any) -> str:
+    """
+    Format a result for display.
+
+    Decimals are shown without trailing zeros, fractions as numerator/denominator
+    and floats as Python prints them.
+
+    Args:
+        value (Any): The number to format.
+
+    Returns:
+        str: The display text.
+    """
+    if isinstance(value, Decimal):
+        value = value.normalize()
+    return str(value)
+
+
+def float_array_kernel(name: str) -> Optional[Callable[[Sequence[float], Sequence[float]], List[float]]]:
+    """
+    Get a NumPy implementation of an operation for float columns.
+
+    Only operations that cannot fail on finite operands, other than by
+    overflowing, are vectorized. Overflowed rows come back as infinities,
+    which Operation.execute_many reports as errors like the row kernels do.
+
+    Args:
+        name (str): Operation name (e.g. 'Addition').
+
+    Returns:
+        Optional[Callable]: A function of two float columns returning the results,
+            or None when NumPy is not installed or the operation is not vectorized.
+    """
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - NumPy is optional
+        return None
+    ufunc = {
+        'Addition': np.add,
+        'Subtraction': np.subtract,
+        'Multiplication': np.multiply,
+    }.get(name)
+    if ufunc is None:
+        return None
+
+    def kernel(a_values: Sequence[float], b_values: Sequence[float]) -> List[float]:
+        with np.errstate(over='ignore'):
+            return ufunc(
+                np.asarray(a_values, dtype=np.float64), np.asarray(b_values, dtype=np.float64)
+            ).tolist()
+    return kernel
+
+
+def int_array_kernel(name: str) -> Optional[Callable[[Sequence[int], Sequence[int]], List[Any]]]:
+    """
+    Get an implementation of an operation for int columns.
+
+    Like float_array_kernel, only operations that cannot fail are covered.
+    Each column is computed in one map() pass over the Python operator, and
+    results are checked against the context precision once per column.
+
+    Args:
+        name (str): Operation name (e.g. 'Addition').
+
+    Returns:
+        Optional[Callable]: A function of two int columns returning the results, or
+            None when the operation is not covered.
+    """
+    function = {
+        'Addition': operator.add,
+        'Subtraction': operator.sub,
+        'Multiplication': operator.mul,
+    }.get(name)
+    if function is None:
+        return None
+
+    def kernel(a_values: Sequence[int], b_values: Sequence[int]) -> List[Any]:
+        results = list(map(function, a_values, b_values))
+        limit = 3 * getcontext().prec
+        if max(map(int.bit_length, results), default=0) > limit:
+            return [integer_result(value) for value in results]
+        return results
+    return kernel
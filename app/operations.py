@@ -1,7 +1,101 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
 from app.exception import ValidationError
+from app.numeric_backend import (
+    NUMPY_MIN_ROWS,
+    backend_for,
+    float_array_kernel,
+    int_array_kernel,
+    integer_result,
+    is_integral,
+)
+
+
+# Kernels below accept ints from the decimal backend's integer fast path.
+# Int results stay exact while they fit the Decimal context precision, and
+# modulus and integer division follow Decimal's sign rules (truncation
+# towards zero) rather than Python's floor rules on every backend. Float
+# results that overflow to infinity raise OverflowError, like Decimal's
+# Overflow trap, instead of being stored.
+
+# Error for float results outside the float range
+NON_FINITE_RESULT = "Result is not a finite number"
+
+def _checked(result: Decimal) -> Decimal:
+    """Round an int result to the context, and reject a float result that overflowed."""
+    if type(result) is int:
+        return integer_result(result)
+    if type(result) is float and not math.isfinite(result):
+        raise OverflowError(NON_FINITE_RESULT)
+    return result
+
+
+def add(a: Decimal, b: Decimal) -> Decimal:
+    """Add a and b."""
+    return _checked(a + b)
+
+
+def subtract(a: Decimal, b: Decimal) -> Decimal:
+    """Subtract b from a."""
+    return _checked(a - b)
+
+
+def multiply(a: Decimal, b: Decimal) -> Decimal:
+    """Multiply a by b."""
+    return _checked(a * b)
+
+
+def divide(a: Decimal, b: Decimal) -> Decimal:
+    """Divide a by b, promoting integer operands to Decimal."""
+    if type(a) is int and type(b) is int:
+        a = Decimal(a)
+    return _checked(a / b)
+
+
+def modulus(a: Decimal, b: Decimal) -> Decimal:
+    """Remainder of a divided by b, with the sign of a."""
+    if isinstance(a, Decimal) or isinstance(b, Decimal):
+        return a % b
+    if type(a) is float:
+        return math.fmod(a, b)
+    # int and Fraction operands
+    remainder = abs(a) % abs(b)
+    return -remainder if a < 0 else remainder
+
+
+def integer_divide(a: Decimal, b: Decimal) -> Decimal:
+    """Quotient of a divided by b, truncated towards zero."""
+    if isinstance(a, Decimal) or isinstance(b, Decimal):
+        return a // b
+    if type(a) is float:
+        # a - fmod(a, b) is an exact multiple of b; rounding only undoes the
+        # error of the division, as in Python's own float floor division
+        return float(round((a - math.fmod(a, b)) / b))
+    # int and Fraction operands
+    quotient = abs(a) // abs(b)
+    return -quotient if (a < 0) != (b < 0) else quotient
+
+
+def power(a: Decimal, b: Decimal) -> Decimal:
+    """Raise a to the power of b with the numeric backend of the operands."""
+    return backend_for(a).power(a, b)
+
+
+def root(a: Decimal, b: Decimal) -> Decimal:
+    """Take the bth root of a with the numeric backend of the operands."""
+    return backend_for(a).root(a, b)
+
+
+def percent(a: Decimal, b: Decimal) -> Decimal:
+    """Express a as a percentage of b."""
+    return _checked(divide(a, b) * 100)
+
+
+def absolute_difference(a: Decimal, b: Decimal) -> Decimal:
+    """Return the absolute difference between a and b."""
+    return abs(subtract(a, b))
 
 
 class Operation(ABC):
@@ -47,6 +141,59 @@ class Operation(ABC):
         """
         pass
 
+    def execute_many(
+        self,
+        a_values: Iterable[Decimal],
+        b_values: Iterable[Decimal]
+    ) -> Tuple[List[Optional[Decimal]], List[Optional[str]]]:
+        """
+        Execute the operation over whole columns of operands.
+
+        Rows are evaluated independently, so an invalid row (e.g. a zero divisor)
+        is reported in the error column instead of aborting the remaining rows.
+        When the operation cannot fail, int columns are computed in one pass and
+        large float columns with NumPy when it is installed.
+
+        Args:
+            a_values (Iterable[Decimal]): Column of first operands.
+            b_values (Iterable[Decimal]): Column of second operands.
+
+        Returns:
+            Tuple[List[Optional[Decimal]], List[Optional[str]]]: The results, with None
+                for failed rows, and the error messages, with None for successful rows.
+        """
+        a_values = list(a_values)
+        b_values = list(b_values)
+        column_types = set(map(type, a_values))
+        column_types.update(map(type, b_values))
+        kernel = None
+        if column_types == {int}:
+            kernel = int_array_kernel(str(self))
+        elif column_types == {float} and len(a_values) >= NUMPY_MIN_ROWS:
+            kernel = float_array_kernel(str(self))
+        if kernel is not None:
+            results = kernel(a_values, b_values)
+            errors = [None] * len(a_values)
+            if column_types == {float} and not all(map(math.isfinite, results)):
+                # NumPy overflows to infinity where the row kernels raise
+                for i, result in enumerate(results):
+                    if not math.isfinite(result):
+                        results[i] = None
+                        errors[i] = NON_FINITE_RESULT
+            return results, errors
+
+        execute = self.execute
+        results: List[Optional[Decimal]] = []
+        errors: List[Optional[str]] = []
+        for a, b in zip(a_values, b_values):
+            try:
+                results.append(execute(a, b))
+                errors.append(None)
+            except (ValidationError, ArithmeticError) as e:
+                results.append(None)
+                errors.append(str(e))
+        return results, errors
+
     def __str__(self) -> str:
         """
         Return operation name for display.
@@ -78,7 +225,7 @@ class Addition(Operation):
             Decimal: Sum of the two operands.
         """
         self.validate_operands(a, b)
-        return a + b
+        return add(a, b)
 
 
 class Subtraction(Operation):
@@ -100,7 +247,7 @@ class Subtraction(Operation):
             Decimal: Difference between the two operands.
         """
         self.validate_operands(a, b)
-        return a - b
+        return subtract(a, b)
 
 
 class Multiplication(Operation):
@@ -122,7 +269,7 @@ class Multiplication(Operation):
             Decimal: Product of the two operands.
         """
         self.validate_operands(a, b)
-        return a * b
+        return multiply(a, b)
 
 
 class Division(Operation):
@@ -161,7 +308,7 @@ class Division(Operation):
             Decimal: Quotient of the division.
         """
         self.validate_operands(a, b)
-        return a / b
+        return divide(a, b)
 
 
 class Power(Operation):
@@ -175,18 +322,21 @@ class Power(Operation):
         """
         Validate operands for power operation.
 
-        Overrides the base class method to ensure that the exponent is not negative.
+        Overrides the base class method to ensure that the exponent is not negative,
+        and is a whole number for a negative base.
 
         Args:
             a (Decimal): Base number.
             b (Decimal): Exponent.
 
         Raises:
-            ValidationError: If the exponent is negative.
+            ValidationError: If the exponent is negative, or fractional with a negative base.
         """
         super().validate_operands(a, b)
         if b < 0:
-            raise ValidationError("Negative exponents not supported")
+            raise ValidationError("Negative exponents are not supported")
+        if a < 0 and not is_integral(b):
+            raise ValidationError("Fractional exponents of negative numbers are not supported")
 
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
@@ -200,7 +350,7 @@ class Power(Operation):
             Decimal: Result of the exponentiation.
         """
         self.validate_operands(a, b)
-        return Decimal(pow(float(a), float(b)))
+        return power(a, b)
 
 
 class Root(Operation):
@@ -242,7 +392,7 @@ class Root(Operation):
             Decimal: Result of the root calculation.
         """
         self.validate_operands(a, b)
-        return Decimal(pow(float(a), 1 / float(b)))
+        return root(a, b)
 
 class Modulus(Operation):
     """
@@ -280,7 +430,7 @@ class Modulus(Operation):
             Decimal: modulus operation result.
         """
         self.validate_operands(a, b)
-        return a % b
+        return modulus(a, b)
 
 class Int_Division(Operation):
     """
@@ -318,7 +468,7 @@ class Int_Division(Operation):
             Decimal: Quotient of the division.
         """
         self.validate_operands(a, b)
-        return a // b
+        return integer_divide(a, b)
 
 class AbsoluteDifference(Operation):
     """
@@ -339,7 +489,7 @@ class AbsoluteDifference(Operation):
             Decimal: Difference between the two operands.
         """
         self.validate_operands(a, b)
-        return abs(a - b)
+        return absolute_difference(a, b)
 
 
 class Percent(Operation):
@@ -378,7 +528,7 @@ class Percent(Operation):
             Decimal: Percent of A of B.
         """
         self.validate_operands(a, b)
-        return ((a) / (b)) * 100
+        return percent(a, b)
 
 class OperationFactory:
     """
@@ -387,6 +537,9 @@ class OperationFactory:
     Implements the Factory pattern by providing a method to instantiate
     different operation classes based on a given operation type. This promotes
     scalability and decouples the creation logic from the Calculator class.
+
+    Operations are stateless, so the factory hands out one shared instance per
+    operation type (Flyweight pattern) instead of a new object per call.
     """
 
     # Dictionary mapping operation identifiers to their corresponding classes
@@ -403,12 +556,20 @@ class OperationFactory:
         'abs_diff': AbsoluteDifference
     }
 
+    # Shared operation instances, created on first use and keyed by lowercase name
+    _instances: Dict[str, Operation] = {}
+
+    # Operation identifier per class name (e.g. 'Addition': 'add'), filled on lookup
+    _class_names: Dict[str, str] = {}
+
     @classmethod
     def register_operation(cls, name: str, operation_class: type) -> None:
         """
         Register a new operation type.
 
-        Allows dynamic addition of new operations to the factory.
+        Allows dynamic addition of new operations to the factory. Calculation finds
+        the operation by its class name (see operation_for), so it can evaluate (and
+        reload from history) calculations produced by the plugin.
 
         Args:
             name (str): Operation identifier (e.g., 'modulus').
@@ -420,26 +581,100 @@ class OperationFactory:
         if not issubclass(operation_class, Operation):
             raise TypeError("Operation class must inherit from Operation")
         cls._operations[name.lower()] = operation_class
+        # Drop the shared instance of an operation type being replaced
+        cls._instances.pop(name.lower(), None)
+        cls._class_names.clear()
 
     @classmethod
     def create_operation(cls, operation_type: str) -> Operation:
         """
-        Create an operation instance based on the operation type.
+        Get the operation instance for an operation type.
 
         This method retrieves the appropriate operation class from the
-        _operations dictionary and instantiates it.
+        _operations dictionary and instantiates it on first use. Later calls
+        return the same shared instance.
 
         Args:
             operation_type (str): The type of operation to create (e.g., 'add').
 
         Returns:
-            Operation: An instance of the specified operation class.
+            Operation: The shared instance of the specified operation class.
 
         Raises:
             ValueError: If the operation type is unknown.
         """
-        operation_class = cls._operations.get(operation_type.lower())
-        if not operation_class:
-            raise ValueError(f"Unknown operation: {operation_type}")
-        return operation_class()
+        operation = cls._instances.get(operation_type)
+        if operation is not None:
+            return operation
+        name = operation_type.lower()
+        operation = cls._instances.get(name)
+        if operation is None:
+            operation_class = cls._operations.get(name)
+            if not operation_class:
+                raise ValueError(f"Unknown operation: {operation_type}")
+            # Two threads may both get here; either instance will do
+            operation = cls._instances[name] = operation_class()
+        return operation
+
+    @classmethod
+    def operation_for(cls, class_name: str) -> Operation:
+        """
+        Get the shared operation instance for an operation class name.
+
+        Calculations record the class name of their operation (e.g. 'Addition'),
+        which this maps back to the registered operation.
+
+        Args:
+            class_name (str): Class name of the operation.
+
+        Returns:
+            Operation: The shared instance of the operation class.
+
+        Raises:
+            ValueError: If no registered operation has that class name.
+        """
+        name = cls._class_names.get(class_name)
+        if name is None:
+            for identifier, operation_class in cls._operations.items():
+                if operation_class.__name__ == class_name:
+                    name = cls._class_names[class_name] = identifier
+                    break
+            else:
+                raise ValueError(f"Unknown operation: {class_name}")
+        return cls.create_operation(name)
+
+    @classmethod
+    def resolve_many(cls, operation_types: Iterable[str]) -> Tuple[List[int], List[Operation]]:
+        """
+        Resolve a column of operation types in one pass.
+
+        Each distinct spelling is looked up once. The column is returned as
+        integer codes into a list of the distinct operations, so batch code can
+        group rows by code without comparing names again.
+
+        Args:
+            operation_types (Iterable[str]): Operation types (e.g. 'add'), one per row.
+
+        Returns:
+            Tuple[List[int], List[Operation]]: One code per row, -1 where the type is
+                unknown, and the operations the codes refer to.
+        """
+        codes: List[int] = []
+        operations: List[Operation] = []
+        seen: Dict[str, int] = {}
+        for operation_type in operation_types:
+            code = seen.get(operation_type)
+            if code is None:
+                try:
+                    operation = cls.create_operation(operation_type)
+                except ValueError:
+                    code = -1
+                else:
+                    # 'add' and 'ADD' share the instance, and so the code
+                    if operation not in operations:
+                        operations.append(operation)
+                    code = operations.index(operation)
+                seen[operation_type] = code
+            codes.append(code)
+        return codes, operations
 
@@ -0,0 +1,156 @@
+########################
+# Process Pool Engine   #
+########################
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import csv
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from app.bulk_compute import (
+    BULK_OUTPUT_COLUMNS,
+    BulkSummary,
+    RowOutcome,
+    chunk_rows,
+    compute_calculations,
+    compute_rows,
+    read_bulk_rows,
+    write_bulk_chunk,
+)
+from app.calculation import Calculation
+from app.calculator_config import CalculatorConfig
+
+# A computed chunk: its rows, one outcome per row and the successful calculations
+ChunkResult = Tuple[List[Sequence[str]], List[RowOutcome], List[Calculation]]
+
+# Per-process state, set up once by _init_worker
+_worker_config: Optional[CalculatorConfig] = None
+
+
+def _init_worker(config: CalculatorConfig) -> None:
+    """Store the configuration in a worker process so tasks only carry their rows."""
+    global _worker_config
+    _worker_config = config
+
+
+def _compute_chunk(
+    rows: List[Sequence[str]],
+    record: bool
+) -> Tuple[List[RowOutcome], List[Calculation]]:
+    """Compute one chunk in a worker process, with its calculations when record is set."""
+    if record:
+        return compute_calculations(rows, _worker_config)
+    return compute_rows(rows, _worker_config), []
+
+
+class ProcessPoolEngine:
+    """
+    Bulk computation engine that evaluates chunks in worker processes.
+
+    Decimal arithmetic is CPU-bound and holds the GIL, so threads cannot speed
+    it up. The engine splits the input into chunks of bulk_chunk_size rows and
+    computes them in bulk_workers processes. Results come back in input order.
+    Only a few chunks per worker are in flight at a time, so memory stays
+    bounded for streamed input. With a single worker, chunks are computed in
+    the calling process and no pool is started.
+    """
+
+    def __init__(
+        self,
+        config: Optional[CalculatorConfig] = None,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            config (Optional[CalculatorConfig], optional): Configuration used to validate
+                operands. Defaults to a new CalculatorConfig.
+            workers (Optional[int], optional): Worker processes. Defaults to the
+                bulk_workers configuration setting.
+            chunk_size (Optional[int], optional): Rows per worker task. Defaults to the
+                bulk_chunk_size configuration setting.
+        """
+        self.config = config or CalculatorConfig()
+        self.workers = workers or self.config.bulk_workers
+        self.chunk_size = chunk_size or self.config.bulk_chunk_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> 'ProcessPoolEngine':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def map_chunks(
+        self,
+        rows: Iterable[Sequence[str]],
+        record: bool = True
+    ) -> Iterator[ChunkResult]:
+        """
+        Compute rows chunk by chunk.
+
+        Args:
+            rows (Iterable[Sequence[str]]): Rows of operation name (e.g. 'add') and two operands.
+            record (bool, optional): Build a Calculation for every successful row.
+                Defaults to True.
+
+        Yields:
+            ChunkResult: Each chunk's rows, outcomes and calculations, in input order.
+        """
+        chunks = chunk_rows(rows, self.chunk_size)
+        if self.workers == 1:
+            for chunk in chunks:
+                if record:
+                    yield (chunk, *compute_calculations(chunk, self.config))
+                else:
+                    yield (chunk, compute_rows(chunk, self.config), [])
+            return
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.config,)
+            )
+        # Keep every worker busy without reading the whole input ahead
+        pending: Deque[Tuple[List[Sequence[str]], Future]] = deque()
+        for chunk in chunks:
+            pending.append((chunk, self._executor.submit(_compute_chunk, chunk, record)))
+            if len(pending) >= 2 * self.workers:
+                chunk, future = pending.popleft()
+                yield (chunk, *future.result())
+        while pending:
+            chunk, future = pending.popleft()
+            yield (chunk, *future.result())
+
+    def compute_csv(self, source: TextIO, destination: TextIO) -> BulkSummary:
+        """
+        Compute a CSV file of operation,operand1,operand2 rows in parallel.
+
+        Produces the same output as bulk_compute.compute_csv.
+
+        Args:
+            source (TextIO): Input CSV with an operation,operand1,operand2 header.
+            destination (TextIO): Output CSV stream.
+
+        Returns:
+            BulkSummary: Number of rows computed and number of failed rows.
+
+        Raises:
+            ValidationError: If the input header does not have the expected columns.
+        """
+        rows = read_bulk_rows(source)
+        writer = csv.writer(destination)
+        writer.writerow(BULK_OUTPUT_COLUMNS)
+        summary = BulkSummary()
+        for chunk, outcomes, _ in self.map_chunks(rows, record=False):
+            write_bulk_chunk(writer, chunk, outcomes, summary)
+        return summary
@@ -0,0 +1,157 @@
+########################
+# Result Cache          #
+########################
+
+from collections import OrderedDict
+from contextlib import nullcontext
+from dataclasses import dataclass
+from decimal import Decimal, getcontext
+import threading
+from typing import Any, ContextManager, Iterable, Optional, Tuple
+
+from app.calculation import Calculation
+
+# Cache key: operation name, both operands, and the precision and rounding
+# of the Decimal context the result was computed in
+CacheKey = Tuple[str, Decimal, Decimal, int, str]
+
+
+@dataclass
+class CacheStats:
+    """Counters of a ResultCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of lookups answered from the cache.
+
+        Returns:
+            float: Hits divided by lookups, 0.0 before the first lookup.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """
+    Bounded least-recently-used cache of operation results.
+
+    Results are keyed on the operation name, the operands, and the precision and
+    rounding of the current Decimal context, so a result computed under another
+    context is never reused. Decimal equality and hashing ignore the exponent, so
+    operands that only differ in trailing zeros (2, 2.0, 2.00) share one entry. When the cache is full, the least
+    recently used entry is evicted. Failed operations are never cached.
+    """
+
+    def __init__(self, maxsize: int, thread_safe: bool = False):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of cached results.
+            thread_safe (bool, optional): Guard the cache with a lock so it can be
+                shared by many threads. Defaults to False.
+        """
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[CacheKey, Decimal]' = OrderedDict()
+        self._lock: ContextManager[Any] = threading.Lock() if thread_safe else nullcontext()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(operation: str, a: Decimal, b: Decimal) -> CacheKey:
+        """Build the cache key of an operation in the current Decimal context."""
+        context = getcontext()
+        return (operation, a, b, context.prec, context.rounding)
+
+    def get(self, operation: str, a: Decimal, b: Decimal) -> Optional[Decimal]:
+        """
+        Look up a cached result and mark it as recently used.
+
+        Args:
+            operation (str): Operation name (e.g. 'Power').
+            a (Decimal): First operand.
+            b (Decimal): Second operand.
+
+        Returns:
+            Optional[Decimal]: The cached result, or None on a miss.
+        """
+        key = self._key(operation, a, b)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, operation: str, a: Decimal, b: Decimal, result: Decimal) -> None:
+        """
+        Store a result, evicting the least recently used one when full.
+
+        Args:
+            operation (str): Operation name (e.g. 'Power').
+            a (Decimal): First operand.
+            b (Decimal): Second operand.
+            result (Decimal): The operation's result.
+        """
+        key = self._key(operation, a, b)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def warm(self, calculations: Iterable[Calculation]) -> int:
+        """
+        Fill the cache from past calculations without counting lookups.
+
+        Later calculations are treated as more recently used, so when there are
+        more calculations than the cache holds, the newest ones are kept. The
+        results are cached for the current Decimal context, so they must have
+        been computed in it.
+
+        Args:
+            calculations (Iterable[Calculation]): Calculations, oldest first.
+
+        Returns:
+            int: Number of cached results afterwards.
+        """
+        for calculation in calculations:
+            self.put(calculation.operation, calculation.operand1,
+                     calculation.operand2, calculation.result)
+        return len(self)
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        """
+        Get a snapshot of the cache counters.
+
+        Returns:
+            CacheStats: Hits, misses, evictions, current size and maximum size.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize
+            )
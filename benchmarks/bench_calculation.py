@@ -0,0 +1,65 @@
+########################
+# Calculation Benchmark #
+########################
+
+"""
+Micro-benchmark for Calculation construction cost.
+
+Compares building a Calculation with the module-level dispatch tables against
+the previous approach of building a dict of lambdas on every calculate() call.
+
+Run from the project root:
+    python -m benchmarks.bench_calculation
+"""
+
+from decimal import Decimal
+import timeit
+
+from app.calculation import Calculation
+from app.exception import OperationError
+
+
+def _per_call_table(operation: str, x: Decimal, y: Decimal) -> Decimal:
+    """Reproduce the previous calculate(): a fresh lambda table per call."""
+    def raise_div_zero():
+        raise OperationError("Division by zero is not allowed")
+
+    operations = {
+        "Addition": lambda x, y: x + y,
+        "Subtraction": lambda x, y: x - y,
+        "Multiplication": lambda x, y: x * y,
+        "Division": lambda x, y: x / y if y != 0 else raise_div_zero(),
+        "Power": lambda x, y: Decimal(pow(float(x), float(y))),
+        "Root": lambda x, y: Decimal(pow(float(x), 1 / float(y))),
+        "Modulus": lambda x, y: x % y if y != 0 else raise_div_zero(),
+        "Int_Division": lambda x, y: x // y if y != 0 else raise_div_zero(),
+        "Percent": lambda x, y: (x / y) * Decimal(100) if y != 0 else raise_div_zero(),
+        "AbsoluteDifference": lambda x, y: abs(x - y),
+    }
+    return operations[operation](x, y)
+
+
+def main(number: int = 200_000) -> None:
+    """Time Calculation construction under both strategies and print the per-call cost."""
+    a, b = Decimal("12.5"), Decimal("3")
+    for operation in ("Addition", "Division", "Power"):
+        legacy = timeit.timeit(
+            lambda: Calculation(
+                operation=operation, operand1=a, operand2=b,
+                result=_per_call_table(operation, a, b)
+            ),
+            number=number,
+        )
+        current = timeit.timeit(
+            lambda: Calculation(operation=operation, operand1=a, operand2=b),
+            number=number,
+        )
+        print(
+            f"{operation:<15} per-call table: {legacy / number * 1e9:7.0f} ns  "
+            f"module table: {current / number * 1e9:7.0f} ns  "
+            f"speedup: {legacy / current:4.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+########################
+# Contention Benchmark  #
+########################
+
+"""
+Lock contention benchmark for a Calculator shared by many threads.
+
+Each thread performs the same number of perform_operation(a, b, operation='add') calls
+on one thread-safe Calculator. The table shows total throughput for 1..N
+threads, and the single-threaded cost of thread-safe mode against an
+unlocked calculator.
+
+Run from the project root:
+    python -m benchmarks.bench_contention [operations_per_thread] [max_threads]
+"""
+
+from decimal import Decimal
+import os
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import time
+
+from app.calculator import Calculator
+from app.calculator_config import CalculatorConfig
+
+
+def make_calculator(base_dir: Path, thread_safe: bool) -> Calculator:
+    """Create a calculator that keeps its files in base_dir and never saves."""
+    os.environ['CALCULATOR_LOG_DIR'] = str(base_dir / "logs")
+    os.environ['CALCULATOR_LOG_FILE'] = str(base_dir / "logs" / "calculator.log")
+    os.environ['CALCULATOR_HISTORY_DIR'] = str(base_dir / "history")
+    os.environ['CALCULATOR_HISTORY_FILE'] = str(base_dir / "history" / "calculator_history.csv")
+    return Calculator(config=CalculatorConfig(
+        base_dir=base_dir,
+        auto_save=False,
+        max_input_value=Decimal(10 ** 9),
+        thread_safe=thread_safe
+    ))
+
+
+def run(calculator: Calculator, threads: int, operations: int) -> float:
+    """Return the seconds taken by threads threads doing operations calls each."""
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker(n: int) -> None:
+        start_barrier.wait()
+        for i in range(operations):
+            calculator.perform_operation(n, i, operation='add')
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main(operations: int = 20_000, max_threads: int = 8) -> None:
+    """Print throughput per thread count and the single-threaded locking overhead."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = Path(temp_dir)
+        unlocked = run(make_calculator(base_dir, thread_safe=False), 1, operations)
+        locked = run(make_calculator(base_dir, thread_safe=True), 1, operations)
+        print(
+            f"1 thread  unlocked: {operations / unlocked:10,.0f} ops/s  "
+            f"thread-safe: {operations / locked:10,.0f} ops/s  "
+            f"overhead: {(locked / unlocked - 1) * 100:5.1f}%"
+        )
+        threads = 1
+        while threads <= max_threads:
+            elapsed = run(make_calculator(base_dir, thread_safe=True), threads, operations)
+            print(f"{threads:>3} threads  {threads * operations / elapsed:10,.0f} ops/s")
+            threads *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
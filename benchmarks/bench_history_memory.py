@@ -0,0 +1,113 @@
+###########################
+# History Memory Benchmark #
+###########################
+
+"""
+Memory benchmark for the in-memory calculation history.
+
+Measures the bytes per entry held by CalculationHistory (one Calculation object
+per entry) and by the columnar ColumnarHistory, using tracemalloc: first the bare
+containers, then a Calculator with each history_storage setting after as many
+perform_operation calls, which includes the undo stack.
+
+Run from the project root:
+    python -m benchmarks.bench_history_memory 100000 1000000
+"""
+
+import datetime
+from decimal import Decimal
+import os
+from pathlib import Path
+import sys
+import tempfile
+import tracemalloc
+from typing import Callable, List
+
+from app.calculation import Calculation
+from app.calculator import Calculator
+from app.calculator_config import CalculatorConfig
+from app.history import CalculationHistory, ColumnarHistory
+
+
+def make_calculations(rows: int) -> List[Calculation]:
+    """Build calculations with distinct operands and timestamps."""
+    start = datetime.datetime(2025, 1, 1)
+    step = datetime.timedelta(seconds=1)
+    return [
+        Calculation(
+            operation="Addition",
+            operand1=Decimal(f"{i}.25"),
+            operand2=Decimal("0.5"),
+            result=Decimal(f"{i}.75"),
+            timestamp=start + i * step
+        )
+        for i in range(rows)
+    ]
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by build() once it has returned."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def make_calculator(base_dir: Path, storage: str, rows: int) -> Calculator:
+    """Create a calculator holding up to rows entries that keeps its files in base_dir and never saves."""
+    os.environ['CALCULATOR_LOG_DIR'] = str(base_dir / "logs")
+    os.environ['CALCULATOR_LOG_FILE'] = str(base_dir / "logs" / "calculator.log")
+    os.environ['CALCULATOR_HISTORY_DIR'] = str(base_dir / "history")
+    os.environ['CALCULATOR_HISTORY_FILE'] = str(base_dir / "history" / "calculator_history.csv")
+    return Calculator(config=CalculatorConfig(
+        base_dir=base_dir,
+        auto_save=False,
+        max_history_size=rows,
+        history_storage=storage
+    ), load_existing=False)
+
+
+def measure_calculator(calculator: Calculator, rows: int) -> int:
+    """Return the bytes still allocated after rows perform_operation calls."""
+    operands = [(f"{i}.25", "0.5") for i in range(rows)]
+
+    def build() -> Calculator:
+        for a, b in operands:
+            calculator.perform_operation(a, b, operation='add')
+        return calculator
+
+    return measure(build)
+
+
+def report(label: str, rows: int, objects: int, columnar: int) -> None:
+    """Print bytes per entry for both layouts."""
+    print(
+        f"{label:<11}{rows:>10,} rows  objects: {objects / rows:7.1f} B/entry  "
+        f"columnar: {columnar / rows:7.1f} B/entry  ratio: {objects / columnar:5.1f}x"
+    )
+
+
+def main(sizes: List[int]) -> None:
+    """Print the memory used per entry by both history layouts."""
+    for rows in sizes:
+        report(
+            "history",
+            rows,
+            measure(lambda: CalculationHistory(rows, make_calculations(rows))),
+            measure(lambda: ColumnarHistory(rows, make_calculations(rows)))
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report(
+                "calculator",
+                rows,
+                measure_calculator(make_calculator(Path(temp_dir), 'objects', rows), rows),
+                measure_calculator(make_calculator(Path(temp_dir), 'columnar', rows), rows)
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10 ** 5])
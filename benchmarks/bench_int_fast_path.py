@@ -0,0 +1,93 @@
+########################
+# Int Fast Path Benchmark #
+########################
+
+"""
+Benchmark of the integer fast path for whole-number operands.
+
+Every case runs the same values twice: written as integers ("123456"),
+which stay Python ints, and with a ".0" suffix ("123456.0"), which take
+the Decimal path every value took before. It times validating both
+operands and executing each operation, bulk_compute.compute_rows over a
+column of rows, and appending the calculations to a ColumnarHistory.
+Times are the best of several repeats.
+
+Run from the project root:
+    python -m benchmarks.bench_int_fast_path [number] [rows]
+"""
+
+import random
+import sys
+import timeit
+from typing import Callable, List, Tuple
+
+from app.bulk_compute import compute_calculations, compute_rows
+from app.calculator_config import CalculatorConfig
+from app.history import ColumnarHistory
+from app.input_validators import InputValidator
+from app.operations import OperationFactory
+
+OPERATIONS = ['add', 'subtract', 'multiply', 'int_divide', 'mod', 'divide', 'percent']
+
+REPEAT = 5
+
+
+def best(func: Callable[[], object], number: int) -> float:
+    """Best time of REPEAT runs of number calls, in seconds per call."""
+    return min(timeit.repeat(func, number=number, repeat=REPEAT)) / number
+
+
+def make_rows(rows: int) -> Tuple[List[Tuple[str, str, str]], List[Tuple[str, str, str]]]:
+    """Random integer rows and the same rows with every operand written as a decimal."""
+    rng = random.Random(0)
+    integer_rows = [
+        (rng.choice(OPERATIONS), str(rng.randint(-10 ** 6, 10 ** 6)), str(rng.randint(1, 10 ** 4)))
+        for _ in range(rows)
+    ]
+    decimal_rows = [(name, a + ".0", b + ".0") for name, a, b in integer_rows]
+    return integer_rows, decimal_rows
+
+
+def main(number: int = 100_000, rows: int = 100_000) -> None:
+    """Time the Decimal and int paths per operation, for bulk rows and for history."""
+    config = CalculatorConfig()
+    print(f"{'case':<14} {'decimal':>10} {'int':>10} {'speedup':>8}")
+
+    def report(label: str, decimal_time: float, int_time: float, unit: str = "us") -> None:
+        print(f"{label:<14} {decimal_time:8.2f}{unit} {int_time:8.2f}{unit} "
+              f"{decimal_time / int_time:7.2f}x")
+
+    for name in OPERATIONS:
+        execute = OperationFactory.create_operation(name).execute
+
+        def run(a_text: str, b_text: str) -> object:
+            return execute(
+                InputValidator.validate_number(a_text, config),
+                InputValidator.validate_number(b_text, config)
+            )
+
+        assert run("123456", "789") == run("123456.0", "789.0")
+        report(
+            name,
+            best(lambda: run("123456.0", "789.0"), number) * 1e6,
+            best(lambda: run("123456", "789"), number) * 1e6
+        )
+
+    integer_rows, decimal_rows = make_rows(rows)
+    report(
+        "bulk rows",
+        best(lambda: compute_rows(decimal_rows, config), 1) / rows * 1e6,
+        best(lambda: compute_rows(integer_rows, config), 1) / rows * 1e6
+    )
+
+    integer_calculations = compute_calculations(integer_rows, config)[1]
+    decimal_calculations = compute_calculations(decimal_rows, config)[1]
+    report(
+        "history",
+        best(lambda: ColumnarHistory(rows, decimal_calculations), 1) / rows * 1e6,
+        best(lambda: ColumnarHistory(rows, integer_calculations), 1) / rows * 1e6
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,95 @@
+########################
+# Load History Benchmark #
+########################
+
+"""
+Benchmark for Calculator.load_history.
+
+Compares the previous DataFrame.iterrows() loader with the columnar loader over
+generated history files. Sizes are given as arguments; the iterrows loader is
+skipped above 10**6 rows because it takes minutes at that scale.
+
+Run from the project root:
+    python -m benchmarks.bench_load_history 100000 1000000 10000000
+"""
+
+import datetime
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import List
+
+import pandas as pd
+
+from app.calculation import Calculation
+from app.calculator import Calculator
+from app.calculator_config import CalculatorConfig
+
+ITERROWS_LIMIT = 10 ** 6
+
+
+def write_history(path: Path, rows: int) -> None:
+    """Write a history CSV with the given number of rows."""
+    timestamp = datetime.datetime(2025, 1, 1).isoformat()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("operation,operand1,operand2,result,timestamp\n")
+        for i in range(rows):
+            f.write(f"Addition,{i},0.5,{i}.5,{timestamp}\n")
+
+
+def load_with_iterrows(path: Path) -> List[Calculation]:
+    """Reproduce the previous loader: pandas Series per row via iterrows()."""
+    df = pd.read_csv(path)
+    return [
+        Calculation.from_dict({
+            'operation': row['operation'],
+            'operand1': row['operand1'],
+            'operand2': row['operand2'],
+            'result': row['result'],
+            'timestamp': row['timestamp']
+        })
+        for _, row in df.iterrows()
+    ]
+
+
+def main(sizes: List[int]) -> None:
+    """Time both loaders for each history size and print rows per second."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = Path(temp_dir)
+        history_file = base_dir / "history" / "calculator_history.csv"
+        # Keep logs and history inside the temporary directory
+        os.environ['CALCULATOR_LOG_DIR'] = str(base_dir / "logs")
+        os.environ['CALCULATOR_LOG_FILE'] = str(base_dir / "logs" / "calculator.log")
+        os.environ['CALCULATOR_HISTORY_DIR'] = str(history_file.parent)
+        os.environ['CALCULATOR_HISTORY_FILE'] = str(history_file)
+
+        calculator = Calculator(config=CalculatorConfig(base_dir=base_dir, auto_save=False))
+        for rows in sizes:
+            write_history(history_file, rows)
+            calculator.config.max_history_size = rows
+
+            start = time.perf_counter()
+            calculator.load_history()
+            columnar = time.perf_counter() - start
+            assert len(calculator.history) == rows
+
+            if rows <= ITERROWS_LIMIT:
+                start = time.perf_counter()
+                load_with_iterrows(history_file)
+                legacy = time.perf_counter() - start
+                legacy_text = f"{legacy:8.2f} s ({rows / legacy:10,.0f} rows/s)"
+                speedup = f"{legacy / columnar:5.1f}x"
+            else:
+                legacy_text = "skipped".ljust(30)
+                speedup = "  n/a"
+
+            print(
+                f"{rows:>10,} rows  iterrows: {legacy_text}  "
+                f"columnar: {columnar:8.2f} s ({rows / columnar:10,.0f} rows/s)  speedup: {speedup}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10 ** 5])
@@ -0,0 +1,60 @@
+########################
+# Parallel Benchmark    #
+########################
+
+"""
+Scaling benchmark for the process-pool bulk engine.
+
+Computes the same generated rows with 1..N worker processes and prints the
+throughput and the speedup over a single worker. With one worker the engine
+computes in the calling process, so that row is the sequential baseline.
+N defaults to the number of CPUs.
+
+Run from the project root:
+    python -m benchmarks.bench_parallel [rows] [max_workers]
+"""
+
+from decimal import Decimal
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import List
+
+from app.calculator_config import CalculatorConfig
+from app.parallel_engine import ProcessPoolEngine
+
+OPERATIONS = ['add', 'multiply', 'divide', 'power', 'root', 'percent']
+
+
+def make_rows(rows: int) -> List[List[str]]:
+    """Build a mix of operations with non-trivial operands."""
+    return [
+        [OPERATIONS[i % len(OPERATIONS)], f"{i % 997 + 1}.{i % 89}", f"{i % 7 + 1}.5"]
+        for i in range(rows)
+    ]
+
+
+def main(rows: int = 200_000, max_workers: int = 0) -> None:
+    """Time the engine for each worker count and print rows per second."""
+    max_workers = max_workers or os.cpu_count() or 1
+    data = make_rows(rows)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = CalculatorConfig(base_dir=Path(temp_dir), max_input_value=Decimal(10 ** 6))
+        baseline = None
+        for workers in range(1, max_workers + 1):
+            with ProcessPoolEngine(config, workers=workers) as engine:
+                start = time.perf_counter()
+                for _ in engine.map_chunks(data, record=False):
+                    pass
+                elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(
+                f"{workers:>3} workers  {elapsed:7.2f} s  {rows / elapsed:10,.0f} rows/s  "
+                f"speedup: {baseline / elapsed:4.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
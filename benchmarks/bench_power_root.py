@@ -0,0 +1,86 @@
+########################
+# Power/Root Benchmark  #
+########################
+
+"""
+Benchmark of the Decimal power and root engine against the float round-trip.
+
+For each case, prints the per-call cost of the previous
+Decimal(pow(float(a), float(b))) implementation and of decimal_power /
+decimal_root at 28 digits, and how many significant digits each result
+gets right against a 60-digit reference.
+
+Run from the project root:
+    python -m benchmarks.bench_power_root [number]
+"""
+
+from decimal import Context, Decimal, localcontext
+import sys
+import timeit
+
+from app.decimal_math import decimal_power, decimal_root
+
+CASES = [
+    ('power', '2', '10'),
+    ('power', '12.5', '3'),
+    ('power', '2', '100'),
+    ('power', '1.0001', '2.5'),
+    ('power', '3', '0.123'),
+    ('power', '1E+200', '3'),
+    ('root', '27', '3'),
+    ('root', '2', '2'),
+    ('root', '2', '3'),
+    ('root', '123.456', '5'),
+    ('root', '8', '1.5'),
+    ('root', '1E+999', '3'),
+]
+
+
+def float_power(a: Decimal, b: Decimal) -> Decimal:
+    """The previous float round-trip power."""
+    return Decimal(pow(float(a), float(b)))
+
+
+def float_root(a: Decimal, b: Decimal) -> Decimal:
+    """The previous float round-trip root."""
+    return Decimal(pow(float(a), 1 / float(b)))
+
+
+def correct_digits(value: Decimal, expected: Decimal) -> int:
+    """Count the significant digits of value that agree with expected; 28 if correctly rounded."""
+    if value == expected or value == Context(prec=28).plus(expected):
+        return 28
+    if not value.is_finite():
+        return 0
+    error = abs(value - expected) / abs(expected)
+    return max(0, min(28, -error.adjusted() - 1))
+
+
+def main(number: int = 20_000) -> None:
+    """Time each case under both implementations and print cost and accuracy."""
+    reference = Context(prec=60)
+    print(f"{'case':<22} {'float':>9} {'digits':>6} {'decimal':>9} {'digits':>6}")
+    with localcontext(Context(prec=28)):
+        for name, a_text, b_text in CASES:
+            a, b = Decimal(a_text), Decimal(b_text)
+            if name == 'power':
+                old, new = float_power, decimal_power
+                expected = reference.power(a, b)
+            else:
+                old, new = float_root, decimal_root
+                expected = reference.power(a, reference.divide(1, b))
+            try:
+                old_digits = str(correct_digits(old(a, b), expected))
+                old_time = f"{timeit.timeit(lambda: old(a, b), number=number) / number * 1e6:7.2f}us"
+            except OverflowError:
+                old_digits, old_time = "-", "overflow"
+            new_digits = correct_digits(new(a, b), expected)
+            new_time = timeit.timeit(lambda: new(a, b), number=number) / number * 1e6
+            print(
+                f"{name}({a_text}, {b_text})".ljust(22) +
+                f" {old_time:>9} {old_digits:>6} {new_time:7.2f}us {new_digits:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,67 @@
+########################
+# Precision Benchmark   #
+########################
+
+"""
+Benchmark of calculation cost against the configured precision.
+
+Runs perform_operation on a fixed workload of non-integral operands with
+calculators configured for several precisions (significant digits of
+their Decimal context) and prints the per-call cost of each operation.
+
+Run from the project root:
+    python -m benchmarks.bench_precision [calls]
+"""
+
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+
+from app.calculator import Calculator
+from app.calculator_config import CalculatorConfig
+
+PRECISIONS = [10, 28, 50, 100]
+
+OPERATIONS = ['multiply', 'divide', 'power', 'root']
+
+
+def make_calculator(base_dir: Path, precision: int) -> Calculator:
+    """Create a calculator that keeps its files in base_dir and never saves."""
+    os.environ['CALCULATOR_LOG_DIR'] = str(base_dir / "logs")
+    os.environ['CALCULATOR_LOG_FILE'] = str(base_dir / "logs" / "calculator.log")
+    os.environ['CALCULATOR_HISTORY_DIR'] = str(base_dir / "history")
+    os.environ['CALCULATOR_HISTORY_FILE'] = str(base_dir / "history" / "calculator_history.csv")
+    return Calculator(config=CalculatorConfig(
+        base_dir=base_dir,
+        auto_save=False,
+        precision=precision
+    ), load_existing=False)
+
+
+def main(calls: int = 5_000) -> None:
+    """Time every operation at every precision."""
+    rng = random.Random(42)
+    operands = [
+        (f"{rng.uniform(1, 1000):.6f}", f"{rng.uniform(1.5, 4):.3f}")
+        for _ in range(calls)
+    ]
+
+    print("precision " + "".join(f"{name:>12}" for name in OPERATIONS))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for precision in PRECISIONS:
+            calculator = make_calculator(Path(temp_dir), precision)
+            line = f"{precision:<9} "
+            for name in OPERATIONS:
+                start = time.perf_counter()
+                for a, b in operands:
+                    calculator.perform_operation(a, b, operation=name)
+                elapsed = time.perf_counter() - start
+                line += f"{elapsed / calls * 1e6:10.2f}us"
+            print(line)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,65 @@
+########################
+# Result Cache Benchmark #
+########################
+
+"""
+Benchmark for the LRU result cache on a repetitive workload.
+
+Runs perform_operation over a stream of power and root calculations drawn
+from a small pool of distinct operand pairs, with the result cache disabled
+and enabled, and prints the per-call cost and the cache counters.
+
+Run from the project root:
+    python -m benchmarks.bench_result_cache [calls] [distinct_pairs]
+"""
+
+from decimal import Decimal
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+
+from app.calculator import Calculator
+from app.calculator_config import CalculatorConfig
+
+
+def make_calculator(base_dir: Path, cache_size: int) -> Calculator:
+    """Create a calculator that keeps its files in base_dir and never saves."""
+    os.environ['CALCULATOR_LOG_DIR'] = str(base_dir / "logs")
+    os.environ['CALCULATOR_LOG_FILE'] = str(base_dir / "logs" / "calculator.log")
+    os.environ['CALCULATOR_HISTORY_DIR'] = str(base_dir / "history")
+    os.environ['CALCULATOR_HISTORY_FILE'] = str(base_dir / "history" / "calculator_history.csv")
+    return Calculator(config=CalculatorConfig(
+        base_dir=base_dir,
+        auto_save=False,
+        result_cache_size=cache_size
+    ), load_existing=False)
+
+
+def main(calls: int = 100_000, distinct: int = 500) -> None:
+    """Time a repetitive power/root workload with and without the cache."""
+    rng = random.Random(42)
+    pool = [
+        (rng.choice(['power', 'root']), str(rng.uniform(1, 1000))[:8], str(rng.randint(2, 9)))
+        for _ in range(distinct)
+    ]
+    workload = [rng.choice(pool) for _ in range(calls)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for label, cache_size in (("no cache", 0), ("LRU cache", distinct)):
+            calculator = make_calculator(Path(temp_dir), cache_size)
+            start = time.perf_counter()
+            for operation, a, b in workload:
+                calculator.perform_operation(a, b, operation=operation)
+            elapsed = time.perf_counter() - start
+            line = f"{label:<10} {elapsed / calls * 1e6:6.2f} us/call"
+            if calculator.result_cache is not None:
+                stats = calculator.result_cache.stats()
+                line += f"  hit rate: {stats.hit_rate:.1%}  evictions: {stats.evictions}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
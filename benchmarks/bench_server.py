@@ -0,0 +1,126 @@
+########################
+# Server Load Generator #
+########################
+
+"""
+Load generator for the JSON calculator server.
+
+Opens several connections, each pipelining up to a window of requests, and
+reports throughput and p50/p99 latency (send to response). By default it
+benchmarks an in-process server on a free port, which shares the CPU with the
+load generator; pass --connect to load an external ``python main.py --serve``
+instead.
+
+Run from the project root:
+    python -m benchmarks.bench_server --connections 16 --requests 5000 --window 32
+    python -m benchmarks.bench_server --connect 127.0.0.1:8765
+"""
+
+import argparse
+import asyncio
+from collections import deque
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import Deque, List, Tuple
+
+from app.calculator_config import CalculatorConfig
+from app.calculator_server import CalculatorServer
+
+OPERATIONS = ['add', 'subtract', 'multiply', 'divide', 'power']
+
+
+async def run_connection(
+    host: str,
+    port: int,
+    session: str,
+    requests: int,
+    window: int
+) -> List[float]:
+    """Send requests on one connection with at most window in flight; return latencies."""
+    reader, writer = await asyncio.open_connection(host, port)
+    in_flight = asyncio.Semaphore(window)
+    sent: Deque[float] = deque()
+    latencies: List[float] = []
+
+    async def receive() -> None:
+        for _ in range(requests):
+            line = await reader.readline()
+            latencies.append(time.perf_counter() - sent.popleft())
+            in_flight.release()
+            if not json.loads(line)['ok']:
+                raise RuntimeError(line)
+
+    receiver = asyncio.ensure_future(receive())
+    for i in range(requests):
+        await in_flight.acquire()
+        request = {
+            'id': i,
+            'session': session,
+            'command': OPERATIONS[i % len(OPERATIONS)],
+            'a': str(i % 100 + 1),
+            'b': str(i % 7 + 1),
+        }
+        sent.append(time.perf_counter())
+        writer.write(json.dumps(request).encode() + b'\n')
+        await writer.drain()
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+    return latencies
+
+
+async def load(host: str, port: int, connections: int, requests: int, window: int) -> None:
+    """Run every connection concurrently and print the results."""
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        run_connection(host, port, f"bench-{n}", requests, window) for n in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+    latencies = sorted(latency for result in results for latency in result)
+    total = len(latencies)
+    print(
+        f"{connections} connections x {requests} requests, window {window}: "
+        f"{total / elapsed:10,.0f} req/s  "
+        f"p50: {latencies[total // 2] * 1000:6.2f} ms  "
+        f"p99: {latencies[min(total - 1, int(total * 0.99))] * 1000:6.2f} ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Benchmark an external server, or an in-process one on a free port."""
+    if args.connect:
+        host, _, port = args.connect.rpartition(':')
+        await load(host or '127.0.0.1', int(port), args.connections, args.requests, args.window)
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = Path(temp_dir)
+        # Keep logs and the history store inside the temporary directory
+        os.environ['CALCULATOR_LOG_DIR'] = str(base_dir / "logs")
+        os.environ['CALCULATOR_LOG_FILE'] = str(base_dir / "logs" / "calculator.log")
+        os.environ['CALCULATOR_HISTORY_DIR'] = str(base_dir / "history")
+        os.environ['CALCULATOR_HISTORY_DB_FILE'] = str(base_dir / "history" / "calculator_history.db")
+        server = CalculatorServer(CalculatorConfig(base_dir=base_dir))
+        listener = await server.start_tcp()
+        try:
+            await load('127.0.0.1', listener.sockets[0].getsockname()[1],
+                       args.connections, args.requests, args.window)
+        finally:
+            await server.close()
+
+
+def parse_args() -> argparse.Namespace:
+    """Read the load parameters from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--connect', metavar='[HOST:]PORT', help='load an external server')
+    parser.add_argument('--connections', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=5000, help='requests per connection')
+    parser.add_argument('--window', type=int, default=32, help='pipelined requests in flight')
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
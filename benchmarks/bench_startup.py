@@ -0,0 +1,65 @@
+########################
+# Startup Benchmark     #
+########################
+
+"""
+Import-time benchmark for the command-line entry point.
+
+Runs ``python -X importtime`` in fresh interpreters and reports the cumulative
+import time of app.calculator_repl (what ``python main.py`` pays before the
+first prompt), next to the cost of eagerly importing pandas and colorama as
+the modules used to. The best of several runs is reported. A non-zero exit
+status flags pandas or colorama being imported at startup again.
+
+Run from the project root:
+    python -m benchmarks.bench_startup [runs]
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_times(modules: List[str]) -> Dict[str, int]:
+    """Import modules in a fresh interpreter and return cumulative import times in microseconds."""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {', '.join(modules)}"],
+        capture_output=True, text=True, check=True, cwd=PROJECT_ROOT
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def best_of(runs: int, modules: List[str]) -> float:
+    """Return the fastest total import time of the modules over several runs, in milliseconds."""
+    return min(
+        sum(times[module] for module in modules)
+        for times in (import_times(modules) for _ in range(runs))
+    ) / 1000
+
+
+def main(runs: int = 5) -> int:
+    """Print the startup import cost and return 1 if heavy modules are imported eagerly."""
+    startup_ms = best_of(runs, ['app.calculator_repl'])
+    eager_ms = best_of(runs, ['pandas', 'colorama', 'app.calculator_repl'])
+    print(f"app.calculator_repl: {startup_ms:7.1f} ms")
+    print(f"with eager pandas and colorama: {eager_ms:7.1f} ms  speedup: {eager_ms / startup_ms:4.1f}x")
+
+    startup = import_times(['app.calculator_repl'])
+    heavy = [name for name in ('pandas', 'colorama') if name in startup]
+    if heavy:
+        print(f"Imported at startup: {', '.join(heavy)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:])))
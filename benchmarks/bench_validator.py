@@ -0,0 +1,82 @@
+########################
+# Validator Benchmark   #
+########################
+
+"""
+Benchmark of input validation.
+
+For several kinds of input, prints the per-value cost of the previous
+validator (str() round-trip, Decimal constructor with exceptions for
+invalid input, abs() comparison with the Decimal bound and normalize()),
+of InputValidator.validate_number and of InputValidator.validate_many over
+a whole column.
+
+Run from the project root:
+    python -m benchmarks.bench_validator [values]
+"""
+
+from decimal import Decimal, InvalidOperation
+import sys
+import timeit
+from typing import Any, List
+
+from app.calculator_config import CalculatorConfig
+from app.exception import ValidationError
+from app.input_validators import InputValidator
+
+REPEAT = 5
+
+INPUTS = {
+    'int strings': lambda i: str(i * 7919 - 500_000),
+    'decimal strings': lambda i: f"{i * 7.919 - 5000:.3f}",
+    'exponent strings': lambda i: f"{i}e-3",
+    'ints': lambda i: i * 7919 - 500_000,
+    'floats': lambda i: i * 0.25,
+    'Decimals': lambda i: Decimal(i) / 8,
+    'invalid strings': lambda i: f"x{i}",
+}
+
+
+def previous_validate_number(value: Any, config: CalculatorConfig) -> Decimal:
+    """The previous validator."""
+    try:
+        if isinstance(value, str):
+            value = value.strip()
+        number = Decimal(str(value))
+        if not number.is_finite():
+            raise ValidationError(f"Invalid number format: {value}")
+        if abs(number) > config.max_input_value:
+            raise ValidationError(f"Value exceeds maximum allowed: {config.max_input_value}")
+        return number.normalize()
+    except InvalidOperation as e:
+        raise ValidationError(f"Invalid number format: {value}") from e
+
+
+def validate_each(validate: Any, values: List[Any], config: CalculatorConfig) -> None:
+    """Validate values one at a time, collecting errors like a batch would."""
+    for value in values:
+        try:
+            validate(value, config)
+        except ValidationError:
+            pass
+
+
+def main(size: int = 20_000) -> None:
+    """Time every validator on every kind of input."""
+    config = CalculatorConfig()
+    print(f"{'input':<17} {'previous':>10} {'validate':>10} {'many':>10}")
+    for label, make in INPUTS.items():
+        values = [make(i) for i in range(size)]
+        times = [
+            min(timeit.repeat(call, number=1, repeat=REPEAT)) / size * 1e9
+            for call in (
+                lambda: validate_each(previous_validate_number, values, config),
+                lambda: validate_each(InputValidator.validate_number, values, config),
+                lambda: InputValidator.validate_many(values, config),
+            )
+        ]
+        print(f"{label:<17} " + " ".join(f"{t:8.0f}ns" for t in times))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -1,19 +1,111 @@
-# This line is importing the "calculator" function from another file.
-# Imagine that "calculator" is like a tool or recipe that we've already written somewhere else,
-# and now we are telling the computer, "Go and find that calculator tool for us."
-# The "app" part is like a folder, and inside that folder, there's another file called "calculator.py",
-# which has the tool (function) called "calculator" that we need.
+# These lines are importing the tools we need from other files.
+# Imagine that "calculator_repl" and "calculator_batch" are like tools or recipes that we've
+# already written somewhere else, and now we are telling the computer, "Go and find those tools
+# for us." The "app" part is like a folder, and inside that folder there are files called
+# "calculator_repl.py" and "calculator_batch.py", which have the tools (functions) that we need.
+# "argparse" and "sys" come with Python: they read the options typed after "python main.py".
+import argparse
+import sys
+
+from app.calculator_batch import calculator_batch
+from app.calculator_config import CalculatorConfig
 from app.calculator_repl import calculator_repl
+from app.exception import ValidationError
+
+
+# This function decides which calculator to start.
+# With no options, we start the interactive calculator that asks us questions.
+# With "--batch", we read calculations like "add 2 3" from a file (or from the keyboard/pipe
+# when the file is "-") and print one answer per line, without asking any questions.
+# With "--bulk", we read a big CSV file of "operation,operand1,operand2" rows a little piece at
+# a time and write the same rows with their "result" and "error" columns added. The pieces are
+# shared between several worker processes, so every CPU in the computer helps with the math.
+# With "--serve", we start a calculator server that many people can use at the same time over
+# the network (or over a "--unix" socket file). Everyone gets their own history, undo and redo.
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Command-line calculator.")
+    parser.add_argument(
+        "--batch",
+        nargs="?",
+        const="-",
+        metavar="FILE",
+        help=(
+            "run the calculations in FILE (default: standard input), "
+            "one per line such as 'add 2 3'"
+        ),
+    )
+    parser.add_argument(
+        "--bulk",
+        metavar="INPUT",
+        help="compute a CSV file of operation,operand1,operand2 rows",
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="where --bulk writes its CSV (default: standard output)",
+    )
+    parser.add_argument(
+        "--serve",
+        nargs="?",
+        const="127.0.0.1:8765",
+        metavar="[HOST:]PORT",
+        help="run a newline-delimited JSON calculator server (default: 127.0.0.1:8765)",
+    )
+    parser.add_argument(
+        "--unix",
+        metavar="PATH",
+        help="run the calculator server on a Unix domain socket",
+    )
+    args = parser.parse_args(argv)
+
+    if args.serve is not None or args.unix is not None:
+        # The server tools are only fetched when we start a server
+        from app.calculator_server import run_server
+
+        if args.unix is not None:
+            run_server(unix_path=args.unix)
+        else:
+            host, _, port = args.serve.rpartition(":")
+            run_server(host or "127.0.0.1", int(port))
+        return 0
+
+    if args.bulk is not None:
+        # The worker-process tools take a moment to load, so we only fetch them when we need them
+        from app.parallel_engine import ProcessPoolEngine
+
+        # A file we cannot open or a CSV without the right header stops the
+        # whole run, so we print what went wrong instead of crashing
+        try:
+            with open(args.bulk, newline="", encoding="utf-8") as source, \
+                 ProcessPoolEngine(CalculatorConfig()) as engine:
+                if args.output is None:
+                    summary = engine.compute_csv(source, sys.stdout)
+                else:
+                    with open(args.output, "w", newline="", encoding="utf-8") as destination:
+                        summary = engine.compute_csv(source, destination)
+        except (ValidationError, OSError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        return 1 if summary.errors else 0
+    if args.batch is None:
+        calculator_repl()
+        return 0
+    if args.batch == "-":
+        return calculator_batch(sys.stdin)
+    with open(args.batch, encoding="utf-8") as f:
+        return calculator_batch(f)
+
 
-# This part of the code is super important! It checks if this file is being run directly by the computer.
+# This part of the code is super important! It checks if this file is being run directly by
+# the computer.
 # Let me explain: when we write Python programs, sometimes we want to run them directly,
 # and other times we just want to use parts of the program inside other programs.
 # The "__name__" is a special word in Python. It tells us if we are running the program directly.
 # "__main__" is what Python calls this program when we run it directly.
 
-# So, what this line means is: "If you're running this program directly (not as part of another program), 
-# then go ahead and start the calculator."
+# So, what this line means is: "If you're running this program directly (not as part of another
+# program), then go ahead and start the calculator."
 if __name__ == "__main__":
-    # Now, we use the calculator tool we got earlier. This will start the calculator, which is a program 
-    # that keeps running and doing math based on what we tell it.
-    calculator_repl()
+    # Now, we use the main function we wrote above. It starts the calculator, and when the
+    # calculator is done, we hand its answer (0 means everything worked) back to the computer.
+    sys.exit(main())
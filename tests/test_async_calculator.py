@@ -0,0 +1,132 @@
+import asyncio
+from decimal import Decimal
+import threading
+import pytest
+from unittest.mock import patch, PropertyMock
+
+from app.async_calculator import AsyncCalculator
+from app.calculator import Calculator
+from app.calculator_config import CalculatorConfig
+from app.exception import ConfigurationError, OperationError
+from app.history import AsyncHistoryObserver, LoggingObserver
+
+
+@pytest.fixture
+def calculator(tmp_path):
+    config = CalculatorConfig(base_dir=tmp_path, auto_save=False, thread_safe=True)
+    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
+         patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
+         patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
+         patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
+        mock_log_dir.return_value = tmp_path / "logs"
+        mock_log_file.return_value = tmp_path / "logs/calculator.log"
+        mock_history_dir.return_value = tmp_path / "history"
+        mock_history_file.return_value = tmp_path / "history/calculator_history.csv"
+        yield Calculator(config=config)
+
+
+class RecordingObserver(AsyncHistoryObserver):
+    def __init__(self):
+        self.seen = []
+
+    async def update(self, calculation):
+        await asyncio.sleep(0)
+        self.seen.append(calculation)
+
+
+def test_requires_thread_safe_calculator(calculator):
+    calculator.config.thread_safe = False
+    with pytest.raises(ConfigurationError, match="thread_safe"):
+        AsyncCalculator(calculator)
+
+
+def test_perform_undo_redo(calculator):
+    async def scenario():
+        async with AsyncCalculator(calculator) as calc:
+            assert await calc.perform_operation(2, 3, operation='add') == Decimal('5')
+            assert await calc.undo() is True
+            assert len(calculator.history) == 0
+            assert await calc.redo() is True
+            with pytest.raises(OperationError, match="Unknown operation"):
+                await calc.perform_operation(1, 2, operation='unknown')
+
+    asyncio.run(scenario())
+    assert [str(calc.result) for calc in calculator.history] == ['5']
+
+
+def test_coroutine_and_plain_observers(calculator):
+    observer = RecordingObserver()
+    plain = LoggingObserver()
+
+    async def scenario():
+        async with AsyncCalculator(calculator) as calc:
+            calc.add_observer(observer)
+            calc.add_observer(plain)
+            await asyncio.gather(*(calc.perform_operation(i, 2, operation='multiply') for i in range(5)))
+            calc.remove_observer(observer)
+            calc.remove_observer(plain)
+            await calc.perform_operation(1, 1, operation='add')
+
+    asyncio.run(scenario())
+    assert sorted(calc.result for calc in observer.seen) == [Decimal(n) for n in (0, 2, 4, 6, 8)]
+    assert plain not in calculator.observers
+
+
+def test_save_and_load_run_off_the_event_loop(calculator):
+    loop_threads = set()
+    original_save = calculator.save_history
+
+    def save():
+        loop_threads.add(threading.current_thread().name)
+        original_save()
+
+    async def scenario():
+        async with AsyncCalculator(calculator) as calc:
+            await calc.perform_operation(1, 2, operation='add')
+            with patch.object(calculator, 'save_history', side_effect=save):
+                await calc.save_history()
+            calculator.clear_history()
+            await calc.load_history()
+
+    asyncio.run(scenario())
+    assert all(name.startswith("async-calculator") for name in loop_threads)
+    assert [str(calc.result) for calc in calculator.history] == ['3']
+
+
+def test_concurrent_saves_are_coalesced(calculator):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_save():
+        calls.append(len(calculator.history))
+        started.set()
+        release.wait(5)
+
+    async def scenario():
+        async with AsyncCalculator(calculator) as calc:
+            with patch.object(calculator, 'save_history', side_effect=slow_save):
+                first = asyncio.ensure_future(calc.save_history())
+                await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+                await calc.perform_operation(1, 2, operation='add')
+                followers = [asyncio.ensure_future(calc.save_history()) for _ in range(5)]
+                await asyncio.sleep(0)
+                release.set()
+                await asyncio.gather(first, *followers)
+
+    asyncio.run(scenario())
+    # One running save and a single follow-up save that sees the new calculation
+    assert calls == [0, 1]
+
+
+def test_save_errors_reach_every_caller(calculator):
+    async def scenario():
+        async with AsyncCalculator(calculator) as calc:
+            with patch.object(calculator, 'save_history', side_effect=OperationError("disk full")):
+                results = await asyncio.gather(
+                    calc.save_history(), calc.save_history(), return_exceptions=True
+                )
+        return results
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, OperationError) for result in results)
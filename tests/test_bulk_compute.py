@@ -0,0 +1,104 @@
+import csv
+from decimal import Decimal
+from io import StringIO
+import pytest
+from unittest.mock import patch
+
+from app.bulk_compute import BulkSummary, compute_csv, compute_rows
+from app.calculator_config import CalculatorConfig
+from app.exception import ValidationError
+from app.operations import OperationFactory
+import main
+
+
+@pytest.fixture
+def config(tmp_path):
+    return CalculatorConfig(base_dir=tmp_path, max_input_value=Decimal('1000'))
+
+
+def read_output(destination: StringIO):
+    return list(csv.DictReader(StringIO(destination.getvalue())))
+
+
+def test_compute_rows_keeps_order_and_reports_errors(config):
+    rows = [
+        ['add', '1', '2'],
+        ['divide', '1', '0'],
+        ['ADD', '3', '4'],
+        ['unknown', '1', '2'],
+        ['power', '2', 'x'],
+        ['multiply', '5000', '1'],
+        ['add', '1'],
+    ]
+    outcomes = compute_rows(rows, config)
+    assert outcomes == [
+        (Decimal('3'), None),
+        (None, "Division by zero is not allowed"),
+        (Decimal('7'), None),
+        (None, "Unknown operation: unknown"),
+        (None, "Invalid number format: x"),
+        (None, "Value exceeds maximum allowed: 1000"),
+        (None, "Expected 3 fields, got 2"),
+    ]
+
+
+def test_compute_rows_resolves_names_once_per_chunk(config):
+    rows = [['add', '1', '2'], ['ADD', '3', '4'], [' mod ', '7', '4'], ['add', '5', '6']]
+    with patch.object(OperationFactory, 'resolve_many', wraps=OperationFactory.resolve_many) as mock_resolve:
+        outcomes = compute_rows(rows, config)
+    mock_resolve.assert_called_once_with(['add', 'ADD', 'mod', 'add'])
+    assert outcomes == [(Decimal('3'), None), (Decimal('7'), None), (Decimal('3'), None), (Decimal('11'), None)]
+
+
+def test_compute_rows_uses_configured_precision(config):
+    config.precision = 4
+    outcomes = compute_rows([['divide', '2', '3'], ['root', '2', '2']], config)
+    assert outcomes == [(Decimal('0.6667'), None), (Decimal('1.414'), None)]
+
+
+def test_compute_csv_streams_in_chunks(config):
+    source = StringIO(
+        "operation,operand1,operand2\n"
+        "add,1,2\n"
+        "\n"
+        "divide,1,0\n"
+        "multiply,2,3\n"
+    )
+    destination = StringIO()
+    with patch('app.bulk_compute.compute_rows', wraps=compute_rows) as mock_compute:
+        summary = compute_csv(source, destination, config, chunk_size=2)
+    assert summary == BulkSummary(rows=3, errors=1)
+    assert [len(call.args[0]) for call in mock_compute.call_args_list] == [2, 1]
+    assert read_output(destination) == [
+        {'operation': 'add', 'operand1': '1', 'operand2': '2', 'result': '3', 'error': ''},
+        {'operation': 'divide', 'operand1': '1', 'operand2': '0', 'result': '',
+         'error': 'Division by zero is not allowed'},
+        {'operation': 'multiply', 'operand1': '2', 'operand2': '3', 'result': '6', 'error': ''},
+    ]
+
+
+def test_compute_csv_rejects_bad_header(config):
+    with pytest.raises(ValidationError, match="Expected CSV header"):
+        compute_csv(StringIO("a,b,c\nadd,1,2\n"), StringIO(), config)
+
+
+def test_main_bulk_writes_output_file(tmp_path):
+    source = tmp_path / "input.csv"
+    output = tmp_path / "output.csv"
+    source.write_text("operation,operand1,operand2\nadd,1,2\nroot,4,0\n")
+    assert main.main(["--bulk", str(source), "--output", str(output)]) == 1
+    lines = output.read_text().splitlines()
+    assert lines[1] == "add,1,2,3,"
+    assert lines[2] == "root,4,0,,Zero root is undefined"
+
+
+def test_main_bulk_reports_bad_header(tmp_path, capsys):
+    source = tmp_path / "input.csv"
+    source.write_text("a,b,c\nadd,1,2\n")
+    assert main.main(["--bulk", str(source)]) == 1
+    assert "Error: Expected CSV header" in capsys.readouterr().err
+
+
+def test_main_bulk_reports_missing_file(tmp_path, capsys):
+    assert main.main(["--bulk", str(tmp_path / "missing.csv")]) == 1
+    assert "Error:" in capsys.readouterr().err
@@ -4,6 +4,7 @@ from datetime import datetime
 from app.calculation import Calculation
 from app.exception import OperationError
 import logging
+from unittest.mock import patch
 
 
 def test_addition():
@@ -51,6 +52,44 @@ def test_invalid_root():
         Calculation(operation="Root", operand1=Decimal("-16"), operand2=Decimal("2"))
 
 
+def test_precomputed_result_skips_calculate():
+    with patch.object(Calculation, "calculate") as mock_calculate:
+        calc = Calculation(operation="Power", operand1=Decimal("2"), operand2=Decimal("3"), result=Decimal("8"))
+    mock_calculate.assert_not_called()
+    assert calc.result == Decimal("8")
+
+
+def test_registered_plugin_visible_to_calculation():
+    from app.operations import Operation, OperationFactory
+
+    class Hypotenuse(Operation):
+        def execute(self, a: Decimal, b: Decimal) -> Decimal:
+            return (a * a + b * b).sqrt()
+
+    OperationFactory.register_operation("hypot", Hypotenuse)
+    calc = Calculation(operation="Hypotenuse", operand1=Decimal("3"), operand2=Decimal("4"))
+    assert calc.result == Decimal("5")
+
+
+def test_calculation_runs_plugin_operand_checks():
+    from app.exception import ValidationError
+    from app.operations import Operation, OperationFactory
+
+    class Reciprocal(Operation):
+        def validate_operands(self, a: Decimal, b: Decimal) -> None:
+            if a == 0:
+                raise ValidationError("Zero has no reciprocal")
+
+        def execute(self, a: Decimal, b: Decimal) -> Decimal:
+            self.validate_operands(a, b)
+            return 1 / a
+
+    OperationFactory.register_operation("reciprocal", Reciprocal)
+    assert Calculation(operation="Reciprocal", operand1=Decimal("4"), operand2=Decimal("0")).result == Decimal("0.25")
+    with pytest.raises(OperationError, match="Zero has no reciprocal"):
+        Calculation(operation="Reciprocal", operand1=Decimal("0"), operand2=Decimal("0"))
+
+
 def test_unknown_operation():
     with pytest.raises(OperationError, match="Unknown operation"):
         Calculation(operation="Unknown", operand1=Decimal("5"), operand2=Decimal("3"))
@@ -137,3 +176,31 @@ def test_from_dict_result_mismatch(caplog):
 
     # Assert
     assert "Loaded calculation result 10 differs from computed result 5" in caplog.text
+
+
+def test_from_dict_lazy_trusts_saved_result():
+    data = {
+        "operation": "Addition",
+        "operand1": "2",
+        "operand2": "3",
+        "result": "10",
+        "timestamp": datetime.now().isoformat()
+    }
+    with patch.object(Calculation, "calculate") as mock_calculate:
+        calc = Calculation.from_dict(data, lazy=True)
+    mock_calculate.assert_not_called()
+    assert calc.result == Decimal("10")
+
+
+def test_verify(caplog):
+    calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"), result=Decimal("10"))
+    with caplog.at_level(logging.WARNING):
+        assert calc.verify() is False
+    assert "differs from computed result 5" in caplog.text
+    assert Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3")).verify() is True
+
+
+def test_verify_unknown_operation():
+    calc = Calculation(operation="Unknown", operand1=Decimal("2"), operand2=Decimal("3"), result=Decimal("5"))
+    assert calc.verify() is False
+
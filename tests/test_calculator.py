@@ -1,15 +1,19 @@
 import datetime
 from pathlib import Path
+import subprocess
+import sys
+import threading
 import pandas as pd
 import pytest
 from unittest.mock import Mock, patch, PropertyMock
-from decimal import Decimal
+from decimal import Decimal, localcontext
+from fractions import Fraction
 from tempfile import TemporaryDirectory
 from app.calculator import Calculator
 from app.calculator_repl import calculator_repl
 from app.calculator_config import CalculatorConfig
 from app.exception import OperationError, ValidationError
-from app.history import LoggingObserver, AutoSaveObserver
+from app.history import CalculationHistory, ColumnarHistory, LoggingObserver, AutoSaveObserver
 from app.operations import OperationFactory
 
 from colorama import Fore, Style, Back
@@ -101,6 +105,13 @@ def test_perform_operation_addition(calculator):
     result = calculator.perform_operation(2, 3)
     assert result == Decimal('5')
 
+def test_perform_operation_computes_once(calculator):
+    calculator.set_operation(OperationFactory.create_operation('power'))
+    with patch('app.calculator.Calculation.calculate') as mock_calculate:
+        result = calculator.perform_operation(2, 10)
+    mock_calculate.assert_not_called()
+    assert calculator.history[-1].result == result == Decimal('1024')
+
 def test_perform_operation_validation_error(calculator):
     calculator.set_operation(OperationFactory.create_operation('add'))
     with pytest.raises(ValidationError):
@@ -133,28 +144,270 @@ def test_redo(calculator):
     calculator.redo()
     assert len(calculator.history) == 1
 
+def test_perform_operation_evicts_oldest(calculator):
+    calculator.config.max_history_size = 2
+    calculator.history = CalculationHistory(2)
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for i in range(3):
+        calculator.perform_operation(i, 0)
+    assert [calc.operand1 for calc in calculator.history] == [Decimal('1'), Decimal('2')]
+
+# Test Batch Operations
+
+def test_perform_batch(calculator):
+    result = calculator.perform_batch('add', [1, '2', Decimal('3')], [4, 5, 6])
+    assert result.results == [Decimal('5'), Decimal('7'), Decimal('9')]
+    assert result.error_mask == [False, False, False]
+    assert len(calculator.history) == 3
+    assert len(calculator.undo_stack) == 1
+
+def test_perform_batch_error_mask(calculator):
+    result = calculator.perform_batch('divide', [6, 'abc', 8], [2, 1, 0])
+    assert result.results == [Decimal('3'), None, None]
+    assert result.error_mask == [False, True, True]
+    assert result.error_count == 2
+    assert "Invalid number format" in result.errors[1]
+    assert result.errors[2] == "Division by zero is not allowed"
+    assert len(calculator.history) == 1
+
+def test_perform_batch_numpy_arrays(calculator):
+    np = pytest.importorskip("numpy")
+    result = calculator.perform_batch('multiply', np.array([1.5, 2]), np.array([2, 3]))
+    assert result.results == [Decimal('3'), Decimal('6')]
+
+def test_perform_batch_single_undo_step(calculator):
+    calculator.perform_batch('add', [1, 2, 3], [1, 2, 3])
+    calculator.undo()
+    assert calculator.history == []
+
+def test_perform_batch_notifies_observers_once(calculator):
+    observer = Mock()
+    calculator.add_observer(observer)
+    calculator.perform_batch('add', [1, 2], [3, 4])
+    observer.update_batch.assert_called_once()
+    assert len(observer.update_batch.call_args[0][0]) == 2
+    observer.update.assert_not_called()
+
+def test_perform_batch_length_mismatch(calculator):
+    with pytest.raises(ValidationError, match="differ in length"):
+        calculator.perform_batch('add', [1, 2], [3])
+
+def test_perform_batch_unknown_operation(calculator):
+    with pytest.raises(OperationError, match="Unknown operation"):
+        calculator.perform_batch('unknown', [1], [2])
+
+def test_undo_redo_restores_evicted(calculator):
+    calculator.config.max_history_size = 2
+    calculator.history = CalculationHistory(2)
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for i in range(3):
+        calculator.perform_operation(i, 0)
+    calculator.undo()
+    assert [calc.operand1 for calc in calculator.history] == [Decimal('0'), Decimal('1')]
+    calculator.redo()
+    assert [calc.operand1 for calc in calculator.history] == [Decimal('1'), Decimal('2')]
+
+@pytest.mark.parametrize("storage", ['objects', 'columnar'])
+def test_undo_redo_batch_larger_than_history(calculator, storage):
+    calculator.config.history_storage = storage
+    calculator.config.max_history_size = 3
+    calculator.history = calculator._new_history()
+    calculator.perform_operation(100, 0, operation='add')
+    calculator.perform_batch('add', [1, 2, 3, 4, 5], [0, 0, 0, 0, 0])
+    assert [calc.result for calc in calculator.history] == [Decimal('3'), Decimal('4'), Decimal('5')]
+    assert calculator.undo()
+    assert [calc.result for calc in calculator.history] == [Decimal('100')]
+    assert calculator.redo()
+    assert [calc.result for calc in calculator.history] == [Decimal('3'), Decimal('4'), Decimal('5')]
+    assert calculator.undo()
+    assert calculator.undo()
+    assert calculator.history == []
+
+def test_columnar_history_storage(calculator):
+    calculator.config.history_storage = 'columnar'
+    calculator.config.max_history_size = 2
+    calculator.history = calculator._new_history()
+    assert isinstance(calculator.history, ColumnarHistory)
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for i in range(3):
+        calculator.perform_operation(i, 0)
+    calculator.undo()
+    assert [calc.operand1 for calc in calculator.history] == [Decimal('0'), Decimal('1')]
+    calculator.save_history()
+    calculator.load_history()
+    assert isinstance(calculator.history, ColumnarHistory)
+    assert [calc.result for calc in calculator.history] == [Decimal('0'), Decimal('1')]
+
+def test_perform_operation_with_operation_argument(calculator):
+    calculator.set_operation(OperationFactory.create_operation('multiply'))
+    assert calculator.perform_operation(2, 3, operation='add') == Decimal('5')
+    assert calculator.perform_operation(2, 3, operation=OperationFactory.create_operation('subtract')) == Decimal('-1')
+    # The shared strategy is left untouched
+    assert calculator.perform_operation(2, 3) == Decimal('6')
+    assert [calc.operation for calc in calculator.history] == ['Addition', 'Subtraction', 'Multiplication']
+    calculation = calculator.perform_calculation(2, 3, operation='power')
+    assert calculation is calculator.history[-1]
+    assert calculation.result == Decimal('8')
+
+def test_perform_operation_argument_errors(calculator):
+    with pytest.raises(OperationError, match="Unknown operation"):
+        calculator.perform_operation(2, 3, operation='unknown')
+    with pytest.raises(TypeError):
+        calculator.perform_operation(2)
+    with pytest.raises(TypeError):
+        calculator.perform_operation('add', 2, 3)
+
+def test_perform_operation_keyword_arguments(calculator):
+    calculator.set_operation(OperationFactory.create_operation('subtract'))
+    assert calculator.perform_operation(a=5, b=3) == Decimal('2')
+    assert calculator.perform_operation(b=3, a=5, operation='multiply') == Decimal('15')
+    assert calculator.perform_calculation(a=5, b=3).result == Decimal('2')
+
+def test_result_cache_reuses_results(calculator):
+    calculator.config.result_cache_size = 2
+    calculator = Calculator(config=calculator.config)
+    with patch('app.operations.Power.execute', autospec=True, return_value=Decimal('8')) as mock_execute:
+        assert calculator.perform_operation(2, 3, operation='power') == Decimal('8')
+        assert calculator.perform_operation('2.0', 3, operation='power') == Decimal('8')
+    assert mock_execute.call_count == 1
+    # Cache hits are still recorded in the history
+    assert len(calculator.history) == 2
+
+    calculator.perform_operation(1, 2, operation='add')
+    calculator.perform_operation(2, 2, operation='add')
+    stats = calculator.result_cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 3, 1, 2)
+
+def test_result_cache_disabled_by_default(calculator):
+    assert calculator.result_cache is None
+    assert calculator.warm_result_cache() == 0
+
+def test_result_cache_warmed_from_loaded_history(calculator):
+    calculator.config.history_file.parent.mkdir(parents=True, exist_ok=True)
+    calculator.config.history_file.write_text(
+        "operation,operand1,operand2,result,timestamp\n"
+        f"Root,27,3,3,{datetime.datetime.now().isoformat()}\n"
+    )
+    calculator.config.result_cache_size = 10
+    calculator = Calculator(config=calculator.config)
+    assert len(calculator.result_cache) == 1
+    with patch('app.operations.Root.execute', autospec=True) as mock_execute:
+        assert calculator.perform_operation(27, 3, operation='root') == Decimal('3')
+    mock_execute.assert_not_called()
+
+    calculator.config.result_cache_warm = False
+    calculator = Calculator(config=calculator.config)
+    assert len(calculator.result_cache) == 0
+
+def test_loaded_history_recomputed_through_result_cache(calculator):
+    calculator.config.history_file.parent.mkdir(parents=True, exist_ok=True)
+    now = datetime.datetime.now().isoformat()
+    calculator.config.history_file.write_text(
+        "operation,operand1,operand2,result,timestamp\n"
+        f"Root,27,3,3,{now}\n"
+        f"Root,27,3,3,{now}\n"
+        f"Root,27,3,3,{now}\n"
+    )
+    calculator.config.result_cache_size = 10
+    with patch('app.operations.Root.execute', autospec=True, return_value=Decimal('3')) as mock_execute:
+        calculator = Calculator(config=calculator.config)
+    # The repeated calculation is computed once and then read from the cache
+    assert mock_execute.call_count == 1
+    assert [calc.result for calc in calculator.history] == [Decimal('3')] * 3
+    stats = calculator.result_cache.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+
+def test_result_cache_not_warmed_from_unverified_lazy_history(calculator):
+    calculator.config.history_file.parent.mkdir(parents=True, exist_ok=True)
+    # Saved by a calculator with the default 28 digit context
+    calculator.config.history_file.write_text(
+        "operation,operand1,operand2,result,timestamp\n"
+        f"Division,1,3,0.3333333333333333333333333333,{datetime.datetime.now().isoformat()}\n"
+        f"Multiplication,2,3,6,{datetime.datetime.now().isoformat()}\n"
+    )
+    calculator.config.result_cache_size = 10
+    calculator.config.lazy_load = True
+    calculator.config.integrity_check = 'off'
+    calculator.config.precision = 10
+    calculator = Calculator(config=calculator.config)
+    assert len(calculator.result_cache) == 0
+    assert calculator.perform_operation(1, 3, operation='divide') == Decimal('0.3333333333')
+
+    # Only results the integrity check recomputed and confirmed are cached
+    calculator.result_cache.clear()
+    calculator.verify_history()
+    with localcontext(calculator.decimal_context):
+        assert calculator.result_cache.get('Multiplication', 2, 3) == 6
+        # The stale 28 digit result failed verification; the one computed above did not
+        assert calculator.result_cache.get('Division', 1, 3) == Decimal('0.3333333333')
+
+def test_thread_safe_calculator_shared_by_threads(calculator):
+    calculator.config.thread_safe = True
+    calculator.config.max_history_size = 10000
+    calculator = Calculator(config=calculator.config)
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(100):
+                calculator.perform_operation(n, i, operation='add')
+                calculator.show_history()
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(calculator.history) == 800
+    assert len(calculator.undo_stack) == 800
+    while calculator.undo():
+        pass
+    assert len(calculator.history) == 0
+
+def test_undo_stack_stores_deltas(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for i in range(5):
+        calculator.perform_operation(i, 0)
+    # The appended calculations are in the history, so mementos only count them
+    assert all(m.appended_count == 1 and not m.appended and not m.evicted for m in calculator.undo_stack)
+    calculator.undo()
+    assert [calc.operand1 for calc in calculator.redo_stack[-1].appended] == [Decimal('4')]
+    calculator.redo()
+    assert not calculator.undo_stack[-1].appended
+
+def test_undo_redo_nothing(calculator):
+    assert calculator.undo() is False
+    assert calculator.redo() is False
+
 # Test History Management
 
-@patch('app.calculator.pd.DataFrame.to_csv')
-def test_save_history(mock_to_csv, calculator):
+def test_save_history(calculator):
     operation = OperationFactory.create_operation('add')
     calculator.set_operation(operation)
     calculator.perform_operation(2, 3)
     calculator.save_history()
-    mock_to_csv.assert_called_once()
-
-@patch('app.calculator.pd.read_csv')
-@patch('app.calculator.Path.exists', return_value=True)
-def test_load_history(mock_exists, mock_read_csv, calculator):
-    # Mock CSV data to match the expected format in from_dict
-    mock_read_csv.return_value = pd.DataFrame({
-        'operation': ['Addition'],
-        'operand1': ['2'],
-        'operand2': ['3'],
-        'result': ['5'],
-        'timestamp': [datetime.datetime.now().isoformat()]
-    })
-    
+    lines = calculator.config.history_file.read_text(encoding='utf-8').splitlines()
+    assert lines[0] == "operation,operand1,operand2,result,timestamp"
+    assert lines[1].startswith("Addition,2,3,5,")
+
+def test_save_empty_history_writes_header(calculator):
+    calculator.save_history()
+    assert calculator.config.history_file.read_text(encoding='utf-8').splitlines() == [
+        "operation,operand1,operand2,result,timestamp"
+    ]
+    assert calculator.config.history_file.read_bytes() == b"operation,operand1,operand2,result,timestamp\n"
+
+def test_load_history(calculator):
+    calculator.config.history_file.parent.mkdir(parents=True, exist_ok=True)
+    calculator.config.history_file.write_text(
+        "operation,operand1,operand2,result,timestamp\n"
+        f"Addition,2,3,5,{datetime.datetime.now().isoformat()}\n"
+    )
+
     # Test the load_history functionality
     try:
         calculator.load_history()
@@ -169,6 +422,279 @@ def test_load_history(mock_exists, mock_read_csv, calculator):
         pytest.fail("Loading history failed due to OperationError")
         
             
+def test_load_history_keeps_decimal_text_and_window(calculator):
+    calculator.config.max_history_size = 2
+    calculator.config.history_file.parent.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.datetime.now().isoformat()
+    calculator.config.history_file.write_text(
+        "operation,operand1,operand2,result,timestamp\n"
+        f"Addition,1,1,2,{timestamp}\n"
+        f"Addition,0.1,0.2,0.3,{timestamp}\n"
+        f"Multiplication,1.10,3,3.30,{timestamp}\n"
+    )
+    calculator.load_history()
+    assert len(calculator.history) == 2
+    assert calculator.history[0].operand1 == Decimal('0.1')
+    assert str(calculator.history[0].result) == '0.3'
+    assert str(calculator.history[1].operand1) == '1.10'
+
+    # Files over the size limit go through pandas with the same result
+    with patch('app.calculator.CSV_MODULE_MAX_BYTES', 0):
+        calculator.load_history()
+    assert [str(calc.operand1) for calc in calculator.history] == ['0.1', '1.10']
+
+def test_fraction_backend_round_trip(calculator):
+    calculator.config.numeric_backend = 'fraction'
+    assert calculator.perform_operation('1', '3', operation='divide') == Fraction(1, 3)
+    assert calculator.perform_operation('4/9', '0.5', operation='power') == Fraction(2, 3)
+    calculator.save_history()
+    calculator.load_history()
+    assert [calc.result for calc in calculator.history] == [Fraction(1, 3), Fraction(2, 3)]
+    assert calculator.history[0].format_result(4) == '0.3333'
+
+def test_float_backend_rejects_overflowing_results(calculator):
+    calculator.config.numeric_backend = 'float'
+    calculator.config.max_input_value = Decimal('1e300')
+    with pytest.raises(OperationError, match="Result is not a finite number"):
+        calculator.perform_operation('1e200', '1e200', operation='multiply')
+    batch = calculator.perform_batch('multiply', ['1e200', '2'], ['1e200', '3'])
+    assert batch.results == [None, 6.0]
+    assert batch.errors == ["Result is not a finite number", None]
+    assert [calc.result for calc in calculator.history] == [6.0]
+
+def test_precision_and_rounding_apply_to_calculations(calculator):
+    calculator.config.precision = 5
+    calculator.config.rounding = 'ROUND_DOWN'
+    calculator.decimal_context = calculator.config.decimal_context()
+    assert calculator.perform_operation('2', '3', operation='divide') == Decimal('0.66666')
+    assert calculator.perform_operation('123.45', '3.3', operation='multiply') == Decimal('407.38')
+    batch = calculator.perform_batch('root', ['2'], ['2'])
+    assert batch.results == [Decimal('1.4142')]
+    # The global context is left alone
+    assert Decimal(2) / Decimal(3) == Decimal('0.6666666666666666666666666667')
+
+def test_precision_rounds_results_but_not_operands(calculator):
+    calculator.config.precision = 10
+    calculator.config.max_input_value = Decimal('1e20')
+    calculator.decimal_context = calculator.config.decimal_context()
+    calculation = calculator.perform_calculation('12345678901.5', '0', operation='add')
+    assert str(calculation.operand1) == '12345678901.5'
+    assert calculation.result == Decimal('1.234567890E+10')
+    for a in ('12345678901234', 12345678901234, 12345678901234.0):
+        calculation = calculator.perform_calculation(a, 1, operation='add')
+        assert calculation.operand1 == 12345678901234
+        assert calculation.result == Decimal('1.234567890E+13')
+    batch = calculator.perform_batch('add', ['12345678901.50', 12345678901234], ['0', 1])
+    assert [str(calc.operand1) for calc in calculator.history[-2:]] == ['12345678901.5', '12345678901234']
+    assert batch.results == [Decimal('1.234567890E+10'), Decimal('1.234567890E+13')]
+
+def test_load_history_recomputes_in_calculator_context(calculator):
+    calculator.config.history_file.parent.mkdir(parents=True, exist_ok=True)
+    calculator.config.history_file.write_text(
+        "operation,operand1,operand2,result,timestamp\n"
+        f"Division,1,3,0.33333,{datetime.datetime.now().isoformat()}\n"
+    )
+    calculator.config.precision = 5
+    calculator.decimal_context = calculator.config.decimal_context()
+    calculator.load_history()
+    assert calculator.history[0].result == Decimal('0.33333')
+    assert calculator.verify_history() == []
+
+def test_calculators_with_different_precision_do_not_interfere(calculator):
+    precise = Calculator(CalculatorConfig(precision=40), load_existing=False)
+    results = {5: [], 40: []}
+    calculator.config.precision = 5
+    calculator.decimal_context = calculator.config.decimal_context()
+
+    def worker(calc, precision):
+        for _ in range(200):
+            results[precision].append(calc.perform_operation('1', '7', operation='divide'))
+
+    threads = [
+        threading.Thread(target=worker, args=(calculator, 5)),
+        threading.Thread(target=worker, args=(precise, 40)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert {len(result.as_tuple().digits) for result in results[5]} == {5}
+    assert {len(result.as_tuple().digits) for result in results[40]} == {40}
+
+def test_import_does_not_load_pandas_or_colorama():
+    code = (
+        "import sys, app.calculator_repl; "
+        "print('pandas' in sys.modules, 'colorama' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True, text=True, check=True, cwd=Path(__file__).parent.parent
+    ).stdout
+    assert output.split() == ['False', 'False']
+
+def test_load_history_lazy(calculator):
+    timestamp = datetime.datetime.now().isoformat()
+    calculator.config.history_file.parent.mkdir(parents=True, exist_ok=True)
+    calculator.config.history_file.write_text(
+        "operation,operand1,operand2,result,timestamp\n"
+        f"Addition,2,3,5,{timestamp}\n"
+        f"Addition,4,4,9,{timestamp}\n"
+    )
+    calculator.config.lazy_load = True
+    calculator.config.integrity_check = 'full'
+    calculator.load_history()
+    calculator._integrity_thread.join()
+
+    # The persisted result is kept as-is and flagged by the integrity check
+    assert calculator.history[1].result == Decimal('9')
+    assert calculator.verify_history() == [calculator.history[1]]
+    assert len(calculator.verify_history(sample_size=1)) <= 1
+
+def test_integrity_check_off(calculator):
+    calculator.config.integrity_check = 'off'
+    calculator._start_integrity_check()
+    assert calculator._integrity_thread is None
+
+def test_append_history_writes_only_new_rows(calculator):
+    calculator.config.auto_save = True
+    calculator.config.history_write_mode = 'append'
+    calculator.add_observer(AutoSaveObserver(calculator))
+    calculator.set_operation(OperationFactory.create_operation('add'))
+
+    calculator.perform_operation(1, 2)  # no file yet, so a full save
+    with patch.object(calculator, 'save_history', wraps=calculator.save_history) as mock_save:
+        calculator.perform_operation(3, 4)
+        calculator.perform_batch('multiply', [2, 3], [5, 5])
+        mock_save.assert_not_called()
+
+    df = pd.read_csv(calculator.config.history_file)
+    assert list(df['result']) == [3, 7, 10, 15]
+
+    # A reload sees the same history as memory
+    calculator.load_history()
+    assert [str(calc.result) for calc in calculator.history] == ['3', '7', '10', '15']
+
+def test_append_history_keeps_lf_line_endings(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.config.history_file.parent.mkdir(parents=True, exist_ok=True)
+    # An LF file as pandas wrote it before
+    calculator.config.history_file.write_bytes(
+        f"operation,operand1,operand2,result,timestamp\nAddition,1,2,3,{calculator.history[-1].timestamp.isoformat()}\n".encode()
+    )
+    calculator.perform_operation(3, 4)
+    calculator.append_history([calculator.history[-1]])
+    data = calculator.config.history_file.read_bytes()
+    assert b"\r" not in data
+    assert data.count(b"\n") == 3
+
+def test_append_history_compacts_after_undo(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.save_history()
+    calculator.perform_operation(3, 4)
+    calculator.undo()
+    with patch.object(calculator, 'save_history') as mock_save:
+        calculator.append_history([calculator.history[-1]])
+        mock_save.assert_called_once()
+
+def test_append_history_compacts_periodically(calculator):
+    calculator.config.compaction_interval = 2
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.save_history()
+    with patch.object(calculator, 'save_history') as mock_save:
+        calculator.append_history([calculator.history[-1]])
+        calculator.append_history([calculator.history[-1]])
+        mock_save.assert_not_called()
+        calculator.append_history([calculator.history[-1]])
+        mock_save.assert_called_once()
+
+def test_append_history_failure(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.save_history()
+    with patch('builtins.open', side_effect=OSError("disk full")):
+        with pytest.raises(OperationError, match="Failed to append history"):
+            calculator.append_history([calculator.history[-1]])
+
+@pytest.fixture
+def sqlite_calculator(tmp_path):
+    config = CalculatorConfig(base_dir=tmp_path, history_backend='sqlite', max_history_size=3)
+    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
+         patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
+         patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
+         patch.object(CalculatorConfig, 'history_db_file', new_callable=PropertyMock) as mock_db_file:
+        mock_log_dir.return_value = tmp_path / "logs"
+        mock_log_file.return_value = tmp_path / "logs/calculator.log"
+        mock_history_dir.return_value = tmp_path / "history"
+        mock_db_file.return_value = tmp_path / "history/calculator_history.db"
+        yield Calculator(config=config)
+
+def test_sqlite_backend_keeps_full_history(sqlite_calculator):
+    calc = sqlite_calculator
+    calc.set_operation(OperationFactory.create_operation('add'))
+    for i in range(5):
+        calc.perform_operation(i, 1)
+    calc.undo()
+    calc.perform_batch('multiply', [2, 3], [5, 5])
+    calc.save_history()
+
+    # Memory keeps a bounded window, the database keeps everything
+    assert len(calc.history) == 3
+    df = calc.get_history_dataframe()
+    assert list(df['result']) == ['1', '2', '3', '4', '10', '15']
+    assert list(calc.get_history_dataframe(operation='Multiplication')['result']) == ['10', '15']
+
+    # Reloading reads only the newest window
+    calc.load_history()
+    assert calc.show_history() == [
+        "Addition(3, 1) = 4", "Multiplication(2, 5) = 10", "Multiplication(3, 5) = 15"
+    ]
+
+def test_sqlite_backend_undo_redo_batch_larger_than_history(sqlite_calculator):
+    calc = sqlite_calculator
+    calc.perform_operation(1, 0, operation='add')
+    calc.perform_batch('add', [10, 20, 30, 40, 50], [0] * 5)
+    calc.undo()
+    calc.save_history()
+    assert list(calc.get_history_dataframe()['result']) == ['1']
+    # Redo only brings back the calculations the history kept
+    calc.redo()
+    calc.save_history()
+    assert list(calc.get_history_dataframe()['result']) == ['1', '30', '40', '50']
+    calc.undo()
+    calc.save_history()
+    assert list(calc.get_history_dataframe()['result']) == ['1']
+
+    reloaded = Calculator(config=calc.config)
+    assert reloaded.show_history() == ["Addition(1, 0) = 1"]
+
+def test_sqlite_backend_clear(sqlite_calculator):
+    calc = sqlite_calculator
+    calc.perform_batch('add', [1, 2], [1, 1])
+    calc.save_history()
+    calc.clear_history()
+    calc.perform_batch('add', [3], [1])
+    calc.append_history(calc.history.copy())
+    assert list(calc.get_history_dataframe()['result']) == ['4']
+
+def test_sqlite_backend_empty(sqlite_calculator):
+    sqlite_calculator.load_history()
+    assert sqlite_calculator.history == []
+    assert list(sqlite_calculator.get_history_dataframe().columns) == [
+        'operation', 'operand1', 'operand2', 'result', 'timestamp'
+    ]
+
+def test_sqlite_backend_save_failure_keeps_journal(sqlite_calculator):
+    calc = sqlite_calculator
+    calc.perform_batch('add', [1], [1])
+    with patch.object(calc._history_store, 'apply', side_effect=Exception("locked")):
+        with pytest.raises(OperationError, match="Failed to save history: locked"):
+            calc.save_history()
+    calc.save_history()
+    assert list(calc.get_history_dataframe()['result']) == ['2']
+
 # Test Clearing History
 
 def test_clear_history(calculator):
@@ -182,9 +708,10 @@ def test_clear_history(calculator):
 
 # Test REPL Commands (using patches for input/output handling)
 
+@patch('sys.stdout.isatty', return_value=True)
 @patch('builtins.input', side_effect=['exit'])
 @patch('builtins.print')
-def test_calculator_repl_exit(mock_print, mock_input):
+def test_calculator_repl_exit(mock_print, mock_input, mock_isatty):
     with patch('app.calculator.Calculator.save_history') as mock_save_history:
         calculator_repl()
         mock_save_history.assert_called_once()
@@ -192,14 +719,24 @@ def test_calculator_repl_exit(mock_print, mock_input):
         print(Style.RESET_ALL)
         mock_print.assert_any_call("Goodbye!")
 
+@patch('sys.stdout.isatty', return_value=True)
 @patch('builtins.input', side_effect=['help', 'exit'])
 @patch('builtins.print')
-def test_calculator_repl_help(mock_print, mock_input):
+def test_calculator_repl_help(mock_print, mock_input, mock_isatty):
     calculator_repl()
     mock_print.assert_any_call(Style.BRIGHT + Fore.YELLOW +"\nAvailable commands:")
 
+@patch('sys.stdout.isatty', return_value=True)
 @patch('builtins.input', side_effect=['add', '2', '3', 'exit'])
 @patch('builtins.print')
-def test_calculator_repl_addition(mock_print, mock_input):
+def test_calculator_repl_addition(mock_print, mock_input, mock_isatty):
     calculator_repl()
     mock_print.assert_any_call(Style.BRIGHT+ Back.GREEN +"\nResult: 5")
+
+@patch('builtins.input', side_effect=['add', '2', '3', 'exit'])
+@patch('builtins.print')
+def test_calculator_repl_plain_output_when_not_a_tty(mock_print, mock_input):
+    with patch('sys.stdout.isatty', return_value=False):
+        calculator_repl()
+    mock_print.assert_any_call("\nResult: 5")
+    assert not any('\x1b' in str(args) for args, _ in mock_print.call_args_list)
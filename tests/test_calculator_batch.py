@@ -0,0 +1,73 @@
+from io import StringIO
+import pytest
+from unittest.mock import patch, PropertyMock
+
+from app.calculator import Calculator
+from app.calculator_batch import calculator_batch
+from app.calculator_config import CalculatorConfig
+import main
+
+
+@pytest.fixture
+def calculator(tmp_path):
+    config = CalculatorConfig(base_dir=tmp_path, auto_save=False)
+    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
+         patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
+         patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
+         patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
+        mock_log_dir.return_value = tmp_path / "logs"
+        mock_log_file.return_value = tmp_path / "logs/calculator.log"
+        mock_history_dir.return_value = tmp_path / "history"
+        mock_history_file.return_value = tmp_path / "history/calculator_history.csv"
+        yield Calculator(config=config)
+
+
+def test_batch_streams_results(calculator):
+    output = StringIO()
+    status = calculator_batch(["add 2 3\n", "\n", "# comment\n", "multiply 1.5 4\n"], output, calculator)
+    assert status == 0
+    assert output.getvalue() == "5\n6\n"
+    assert len(calculator.history) == 2
+
+
+def test_batch_reports_errors_in_place(calculator):
+    output = StringIO()
+    status = calculator_batch(
+        ["divide 1 0", "power 2 3", "unknown 1 2", "add 1", "add x 2"], output, calculator
+    )
+    assert status == 1
+    assert output.getvalue().splitlines() == [
+        "Error: Division by zero is not allowed",
+        "8",
+        "Error: Unknown operation: unknown",
+        "Error: Expected '<command> <a> <b>', got: add 1",
+        "Error: Invalid number format: x",
+    ]
+
+
+def test_batch_saves_history_once(calculator):
+    calculator.config.auto_save = True
+    with patch.object(calculator, 'save_history') as mock_save:
+        calculator_batch(["add 1 2", "add 3 4"], StringIO(), calculator)
+    mock_save.assert_called_once()
+
+
+def test_main_batch_reads_file(tmp_path):
+    script = tmp_path / "calcs.txt"
+    script.write_text("add 2 3\n")
+    with patch('main.calculator_batch', return_value=0) as mock_batch:
+        assert main.main(["--batch", str(script)]) == 0
+    assert mock_batch.call_args[0][0].name == str(script)
+
+
+def test_main_batch_reads_stdin():
+    with patch('main.calculator_batch', return_value=1) as mock_batch, \
+         patch('sys.stdin', StringIO("add 2 3\n")) as stdin:
+        assert main.main(["--batch"]) == 1
+    mock_batch.assert_called_once_with(stdin)
+
+
+def test_main_defaults_to_repl():
+    with patch('main.calculator_repl') as mock_repl:
+        assert main.main([]) == 0
+    mock_repl.assert_called_once()
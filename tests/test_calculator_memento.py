@@ -0,0 +1,51 @@
+from decimal import Decimal
+
+from app.calculation import Calculation
+from app.calculator_memento import CalculatorMemento
+from app.history import CalculationHistory
+
+
+def make_calc(n: int) -> Calculation:
+    return Calculation(operation="Addition", operand1=Decimal(n), operand2=Decimal("1"))
+
+
+def test_revert_and_apply_with_eviction():
+    history = CalculationHistory(2, [make_calc(1), make_calc(2)])
+    evicted = history.append(make_calc(3))
+    memento = CalculatorMemento(appended=[make_calc(3)], evicted=[evicted])
+
+    memento.revert(history)
+    assert history == [make_calc(1), make_calc(2)]
+
+    memento.apply(history)
+    assert history == [make_calc(2), make_calc(3)]
+
+
+def test_revert_cleared_history():
+    history = CalculationHistory(3, [make_calc(1), make_calc(2)])
+    memento = CalculatorMemento(evicted=history.copy())
+    history.clear()
+
+    memento.revert(history)
+    assert history == [make_calc(1), make_calc(2)]
+
+
+def test_to_dict_from_dict_round_trip():
+    memento = CalculatorMemento(appended=[make_calc(3)], evicted=[make_calc(1)])
+    restored = CalculatorMemento.from_dict(memento.to_dict())
+    assert restored.appended == memento.appended
+    assert restored.evicted == memento.evicted
+    assert restored.timestamp == memento.timestamp
+
+
+def test_counted_memento_holds_appended_only_while_undone():
+    history = CalculationHistory(3, [make_calc(1), make_calc(2)])
+    memento = CalculatorMemento(appended_count=1, evicted=())
+
+    memento.revert(history)
+    assert history == [make_calc(1)]
+    assert memento.appended == [make_calc(2)]
+
+    assert memento.apply(history) == [make_calc(2)]
+    assert history == [make_calc(1), make_calc(2)]
+    assert not memento.appended
@@ -507,4 +507,21 @@ def test_calc_exception():
         output = fake_output.getvalue()
 
     #test assertions for exceptions
-    assert "Fatal error: Error" in output
\ No newline at end of file
+    assert "Fatal error: Error" in output
+
+#test pending auto-saves are flushed on end of input
+def test_eof_flushes_auto_save():
+    inputs = [EOFError()]
+
+    with patch("app.calculator_repl.Calculator") as MockCalc, \
+         patch("builtins.input", side_effect= inputs), \
+         patch("sys.stdout", new_callable=StringIO) as fake_output, \
+         patch("app.calculator_repl.LoggingObserver"), \
+         patch("app.calculator_repl.AutoSaveObserver") as MockAutoSave:
+
+        MockAutoSave.return_value.close.side_effect = Exception("Flush Error")
+        calculator_repl()
+        output = fake_output.getvalue()
+
+    MockAutoSave.return_value.close.assert_called_once()
+    assert "Warning: Could not save history: Flush Error" in output
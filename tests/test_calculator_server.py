@@ -0,0 +1,204 @@
+import asyncio
+from decimal import Decimal
+import json
+import threading
+import pytest
+from unittest.mock import patch, PropertyMock
+
+from app.calculator_config import CalculatorConfig
+from app.calculator_server import CalculatorServer, MAX_REQUEST_SIZE
+from app.history_store import SQLiteHistoryStore
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = CalculatorConfig(base_dir=tmp_path, flush_interval=0.01)
+    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
+         patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
+         patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
+         patch.object(CalculatorConfig, 'history_db_file', new_callable=PropertyMock) as mock_db_file:
+        mock_log_dir.return_value = tmp_path / "logs"
+        mock_log_file.return_value = tmp_path / "logs/calculator.log"
+        mock_history_dir.return_value = tmp_path / "history"
+        mock_db_file.return_value = tmp_path / "history/calculator_history.db"
+        yield config
+
+
+async def exchange(port, requests):
+    """Pipeline all requests on one connection, then read every response."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b''.join(
+        (request if isinstance(request, bytes) else json.dumps(request).encode()) + b'\n'
+        for request in requests
+    ))
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in requests]
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+def run_with_server(config, scenario):
+    async def main():
+        server = CalculatorServer(config)
+        listener = await server.start_tcp()
+        try:
+            return server, await scenario(server, listener.sockets[0].getsockname()[1])
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+
+def test_pipelined_requests_are_answered_in_order(config):
+    async def scenario(server, port):
+        return await exchange(port, [
+            {'id': 1, 'command': 'add', 'a': '2', 'b': '3'},
+            {'id': 2, 'command': 'divide', 'a': 1, 'b': 0},
+            {'id': 3, 'command': 'power', 'a': 2, 'b': 10},
+            {'id': 4, 'command': 'undo'},
+            {'id': 5, 'command': 'history'},
+            {'id': 6, 'command': 'nope', 'a': 1, 'b': 1},
+            b'not json',
+            b'[1, 2]',
+        ])
+
+    server, responses = run_with_server(config, scenario)
+    assert responses[:5] == [
+        {'id': 1, 'ok': True, 'result': '5'},
+        {'id': 2, 'ok': False, 'error': 'Division by zero is not allowed'},
+        {'id': 3, 'ok': True, 'result': '1024'},
+        {'id': 4, 'ok': True, 'result': True},
+        {'id': 5, 'ok': True, 'result': ['Addition(2, 3) = 5']},
+    ]
+    assert responses[5]['error'] == 'Unknown operation: nope'
+    assert responses[6]['error'].startswith('Invalid JSON')
+    assert responses[7]['error'] == 'Request must be a JSON object'
+    # The connection's private session is gone, but its calculations were stored
+    assert server.sessions == {}
+    assert server.connection_sessions == {}
+    store = SQLiteHistoryStore(config.history_db_file)
+    assert [row['result'] for row in store.tail(10)] == ['5', '1024']
+    store.close()
+
+
+def test_named_sessions_are_isolated_and_shared(config):
+    async def scenario(server, port):
+        await exchange(port, [
+            {'session': 'alice', 'command': 'add', 'a': 1, 'b': 1},
+            {'session': 'bob', 'command': 'multiply', 'a': 3, 'b': 3},
+        ])
+        return await exchange(port, [
+            {'session': 'alice', 'command': 'history'},
+            {'session': 'bob', 'command': 'history'},
+            {'session': 'bob', 'command': 'clear'},
+            {'session': 'bob', 'command': 'redo'},
+        ])
+
+    server, responses = run_with_server(config, scenario)
+    assert [response['result'] for response in responses] == [
+        ['Addition(1, 1) = 2'], ['Multiplication(3, 3) = 9'], True, False
+    ]
+    assert set(server.sessions) == {'alice', 'bob'}
+
+
+def test_private_sessions_cannot_be_named(config):
+    async def scenario(server, port):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(b'{"command": "add", "a": 1, "b": 1}\n')
+        await reader.readline()
+        # Another client names what used to be the first connection's session key
+        responses = await exchange(port, [
+            {'session': 'connection-1', 'command': 'history'},
+            {'session': '1', 'command': 'clear'},
+        ])
+        writer.write(b'{"command": "history"}\n')
+        own = json.loads(await reader.readline())
+        writer.close()
+        await writer.wait_closed()
+        return responses, own
+
+    _, (responses, own) = run_with_server(config, scenario)
+    assert responses[0]['result'] == []
+    assert own['result'] == ['Addition(1, 1) = 2']
+
+
+def test_slow_operations_do_not_block_other_connections(config):
+    release = threading.Event()
+
+    def slow_power(self, a, b):
+        # Only succeeds if the event loop stays free to answer the other connection
+        if not release.wait(2):
+            raise ArithmeticError("event loop was blocked")
+        return Decimal(8)
+
+    async def scenario(server, port):
+        with patch('app.operations.Power.execute', autospec=True, side_effect=slow_power):
+            slow = asyncio.ensure_future(
+                exchange(port, [{'id': 1, 'command': 'power', 'a': 2, 'b': 3}])
+            )
+            fast = await exchange(port, [{'id': 2, 'command': 'add', 'a': 1, 'b': 1}])
+            release.set()
+            return fast + await slow
+
+    _, responses = run_with_server(config, scenario)
+    assert responses == [
+        {'id': 2, 'ok': True, 'result': '2'},
+        {'id': 1, 'ok': True, 'result': '8'},
+    ]
+
+
+def test_session_calculators_skip_logging_setup(config):
+    async def scenario(server, port):
+        with patch('app.calculator.setup_environment') as mock_setup:
+            await exchange(port, [
+                {'session': 'alice', 'command': 'add', 'a': 1, 'b': 1},
+                {'command': 'add', 'a': 1, 'b': 1},
+            ])
+        return mock_setup.call_count
+
+    _, calls = run_with_server(config, scenario)
+    assert calls == 0
+
+
+def test_idle_sessions_are_evicted(config):
+    config.session_idle_timeout = 0.05
+
+    async def scenario(server, port):
+        await exchange(port, [{'session': 'alice', 'command': 'add', 'a': 1, 'b': 1}])
+        await asyncio.sleep(0.2)
+        return dict(server.sessions)
+
+    _, sessions = run_with_server(config, scenario)
+    assert sessions == {}
+
+
+def test_oversized_request_closes_connection(config):
+    async def scenario(server, port):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(b'x' * (MAX_REQUEST_SIZE + 10) + b'\n')
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        closed = await reader.read() == b''
+        writer.close()
+        return response, closed
+
+    _, (response, closed) = run_with_server(config, scenario)
+    assert response['error'] == 'Request too large'
+    assert closed
+
+
+def test_unix_socket(config, tmp_path):
+    async def main():
+        server = CalculatorServer(config)
+        path = str(tmp_path / "calc.sock")
+        await server.start_unix(path)
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+            writer.write(b'{"command": "subtract", "a": 1, "b": 3}\n')
+            response = json.loads(await reader.readline())
+            writer.close()
+            return response
+        finally:
+            await server.close()
+
+    assert asyncio.run(main()) == {'id': None, 'ok': True, 'result': '-2'}
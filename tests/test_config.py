@@ -1,6 +1,6 @@
 import pytest
 import os
-from decimal import Decimal
+from decimal import Decimal, DivisionByZero, InvalidOperation, Overflow, ROUND_HALF_EVEN, ROUND_HALF_UP
 from pathlib import Path
 from app.calculator_config import CalculatorConfig
 from app.exception import ConfigurationError
@@ -74,6 +74,97 @@ def test_invalid_max_input_value():
         config = CalculatorConfig(max_input_value=Decimal("-1"))
         config.validate()
 
+def test_invalid_integrity_check():
+    with pytest.raises(ConfigurationError, match="integrity_check must be"):
+        config = CalculatorConfig(integrity_check="sometimes")
+        config.validate()
+
+def test_invalid_history_write_mode():
+    with pytest.raises(ConfigurationError, match="history_write_mode must be"):
+        config = CalculatorConfig(history_write_mode="sometimes")
+        config.validate()
+
+def test_invalid_compaction_interval():
+    with pytest.raises(ConfigurationError, match="compaction_interval must be positive"):
+        config = CalculatorConfig(compaction_interval=-1)
+        config.validate()
+
+def test_invalid_durability():
+    with pytest.raises(ConfigurationError, match="durability must be"):
+        config = CalculatorConfig(durability="eventually")
+        config.validate()
+
+def test_invalid_flush_interval():
+    with pytest.raises(ConfigurationError, match="flush_interval must be positive"):
+        config = CalculatorConfig(flush_interval=-1)
+        config.validate()
+
+def test_invalid_max_dirty_count():
+    with pytest.raises(ConfigurationError, match="max_dirty_count must be positive"):
+        config = CalculatorConfig(max_dirty_count=-1)
+        config.validate()
+
+def test_invalid_history_backend():
+    with pytest.raises(ConfigurationError, match="history_backend must be"):
+        config = CalculatorConfig(history_backend="mongo")
+        config.validate()
+
+def test_invalid_bulk_chunk_size():
+    with pytest.raises(ConfigurationError, match="bulk_chunk_size must be positive"):
+        config = CalculatorConfig(bulk_chunk_size=-1)
+        config.validate()
+
+def test_invalid_bulk_workers():
+    with pytest.raises(ConfigurationError, match="bulk_workers must be positive"):
+        config = CalculatorConfig(bulk_workers=-2)
+        config.validate()
+
+def test_invalid_session_idle_timeout():
+    with pytest.raises(ConfigurationError, match="session_idle_timeout must be positive"):
+        config = CalculatorConfig(session_idle_timeout=-1)
+        config.validate()
+
+def test_invalid_result_cache_size():
+    with pytest.raises(ConfigurationError, match="result_cache_size must not be negative"):
+        config = CalculatorConfig(result_cache_size=-1)
+        config.validate()
+
+def test_invalid_numeric_backend():
+    with pytest.raises(ConfigurationError, match="numeric_backend must be"):
+        config = CalculatorConfig(numeric_backend="mpfr")
+        config.validate()
+
+def test_invalid_rounding():
+    with pytest.raises(ConfigurationError, match="rounding must be one of"):
+        config = CalculatorConfig(rounding="ROUND_SIDEWAYS")
+        config.validate()
+
+def test_decimal_context():
+    config = CalculatorConfig(precision=7, rounding="round_half_up")
+    context = config.decimal_context()
+    assert context.prec == 7
+    assert context.rounding == ROUND_HALF_UP
+    assert context.traps[InvalidOperation] and context.traps[DivisionByZero] and context.traps[Overflow]
+    assert context is not config.decimal_context()
+
+def test_invalid_history_storage():
+    with pytest.raises(ConfigurationError, match="history_storage must be"):
+        config = CalculatorConfig(history_storage="arrays")
+        config.validate()
+
+def test_history_db_file_property():
+    clear_env_vars('CALCULATOR_HISTORY_DIR', 'CALCULATOR_HISTORY_DB_FILE')
+    config = CalculatorConfig(base_dir=Path('/new_base_dir'))
+    assert config.history_db_file == Path('/new_base_dir/history/calculator_history.db').resolve()
+
+def test_lazy_load_env_var():
+    os.environ['CALCULATOR_LAZY_LOAD'] = 'true'
+    try:
+        assert CalculatorConfig().lazy_load is True
+    finally:
+        clear_env_vars('CALCULATOR_LAZY_LOAD')
+    assert CalculatorConfig().lazy_load is False
+
 def test_auto_save_env_var_true():
     os.environ['CALCULATOR_AUTO_SAVE'] = 'true'
     config = CalculatorConfig(auto_save=None)
@@ -114,6 +205,24 @@ def test_default_fallbacks():
     assert config.precision == 10
     assert config.max_input_value == Decimal("1e999")
     assert config.default_encoding == 'utf-8'
+    assert config.lazy_load is False
+    assert config.integrity_check == 'sample'
+    assert config.integrity_sample_size == 100
+    assert config.history_write_mode == 'full'
+    assert config.compaction_interval == 100
+    assert config.durability == 'sync'
+    assert config.flush_interval == 1.0
+    assert config.max_dirty_count == 50
+    assert config.history_backend == 'csv'
+    assert config.history_storage == 'objects'
+    assert config.bulk_chunk_size == 10000
+    assert config.bulk_workers == (os.cpu_count() or 1)
+    assert config.thread_safe is False
+    assert config.session_idle_timeout == 300.0
+    assert config.result_cache_size == 0
+    assert config.result_cache_warm is True
+    assert config.numeric_backend == 'decimal'
+    assert config.rounding == ROUND_HALF_EVEN
 
 def test_get_project_root():
     # Test that get_project_root() points to the correct path
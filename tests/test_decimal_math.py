@@ -0,0 +1,91 @@
+from decimal import Context, Decimal, DivisionByZero, InvalidOperation, Overflow, localcontext
+import pytest
+
+from app.decimal_math import EXACT_BITS, decimal_power, decimal_root
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ("2", "10", "1024"),
+    ("1.5", "3", "3.375"),
+    ("-1.1", "3", "-1.331"),
+    ("1E+300", "3", "1E+900"),
+    ("0", "0", "1"),
+    ("0", "2.5", "0"),
+    ("2", "0.5", "1.414213562373095048801688724"),
+    ("1.0000001", "100000", "1.010050166579143007794674060"),
+    # Past the exact limit, powers come from Decimal arithmetic at guard precision
+    ("1.0000001", str(EXACT_BITS), "1.000409683877046030071033861"),
+    ("2", "0.123", "1.088997015336106389859998877"),
+])
+def test_decimal_power(a, b, expected):
+    assert str(decimal_power(Decimal(a), Decimal(b), Context(prec=28))) == expected
+
+
+def test_decimal_power_is_correctly_rounded_beyond_float():
+    # 2**100 is exact in Decimal; float would round it to 53 bits
+    assert decimal_power(Decimal(2), Decimal(100), Context(prec=40)) == 2 ** 100
+    assert str(decimal_power(Decimal(2), Decimal(100), Context(prec=5))) == "1.2677E+30"
+
+
+@pytest.mark.parametrize("a", ["100000", "1E-5"])
+def test_decimal_power_intermediate_outside_exponent_range(a):
+    # a^999999 over- or underflows, but a^999.999 is representable
+    a_value, b_value = Decimal(a), Decimal("999.999")
+    context = Context(prec=28)
+    result = decimal_power(a_value, b_value, context)
+    assert result == context.plus(Context(prec=60).power(a_value, b_value))
+    assert result != 0
+
+
+def test_decimal_power_errors():
+    with pytest.raises(Overflow):
+        decimal_power(Decimal(10), Decimal("1e999"), Context(prec=28))
+    with pytest.raises(InvalidOperation):
+        decimal_power(Decimal(-8), Decimal("0.5"), Context(prec=28))
+    with pytest.raises(ZeroDivisionError):
+        decimal_power(Decimal(0), Decimal(-1), Context(prec=28))
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ("27", "3", "3"),
+    ("2", "2", "1.414213562373095048801688724"),
+    ("3.375", "3", "1.5"),
+    ("0.001", "3", "0.1"),
+    ("1E+999", "3", "1E+333"),
+    ("1E-999", "3", "1E-333"),
+    ("2", "3", "1.259921049894873164767210607"),
+    ("8", "1.5", "4"),
+    ("8", "-3", "0.5"),
+    ("0", "5", "0"),
+    ("2", "1000", "1.000693387462580632537568639"),
+    ("5", "1E+999", "1.000000000000000000000000000"),
+])
+def test_decimal_root(a, b, expected):
+    assert str(decimal_root(Decimal(a), Decimal(b), Context(prec=28))) == expected
+
+
+def test_decimal_root_errors():
+    with pytest.raises(ZeroDivisionError):
+        decimal_root(Decimal(0), Decimal(-2), Context(prec=28))
+    with pytest.raises(ZeroDivisionError):
+        decimal_root(Decimal(8), Decimal(0), Context(prec=28))
+
+
+def test_precision_follows_the_current_context():
+    with localcontext(Context(prec=10)):
+        assert str(decimal_root(Decimal(2), Decimal(3))) == "1.259921050"
+        assert str(decimal_power(Decimal(2), Decimal("0.5"))) == "1.414213562"
+
+
+def test_results_match_high_precision_reference():
+    context = Context(prec=20)
+    reference = Context(prec=60)
+    for a in ("0.37", "2", "12.5", "98765.4321"):
+        for b in ("2", "3", "7", "2.5", "0.75"):
+            a_value, b_value = Decimal(a), Decimal(b)
+            assert decimal_power(a_value, b_value, context) == context.plus(
+                reference.power(a_value, b_value)
+            )
+            assert decimal_root(a_value, b_value, context) == context.plus(
+                reference.power(a_value, reference.divide(1, b_value))
+            )
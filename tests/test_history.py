@@ -0,0 +1,222 @@
+import datetime
+import logging
+import threading
+import pytest
+from decimal import Decimal
+from unittest.mock import Mock
+
+from app.calculation import Calculation
+from app.history import AutoSaveObserver, CalculationHistory, ColumnarHistory
+
+
+def make_calc(n: int) -> Calculation:
+    return Calculation(operation="Addition", operand1=Decimal(n), operand2=Decimal("0"))
+
+
+def test_append_evicts_oldest():
+    history = CalculationHistory(2)
+    assert history.append(make_calc(1)) is None
+    assert history.append(make_calc(2)) is None
+    evicted = history.append(make_calc(3))
+    assert evicted == make_calc(1)
+    assert history == [make_calc(2), make_calc(3)]
+
+
+def test_extend_returns_evicted():
+    history = CalculationHistory(3, [make_calc(1), make_calc(2)])
+    evicted = history.extend([make_calc(3), make_calc(4), make_calc(5)])
+    assert evicted == [make_calc(1), make_calc(2)]
+    assert len(history) == 3
+
+
+def test_initial_entries_are_bounded():
+    history = CalculationHistory(2, [make_calc(i) for i in range(5)])
+    assert history.copy() == [make_calc(3), make_calc(4)]
+
+
+def test_indexing_and_slicing():
+    history = CalculationHistory(10, [make_calc(i) for i in range(5)])
+    assert history[0] == make_calc(0)
+    assert history[-1] == make_calc(4)
+    assert history[1:3] == [make_calc(1), make_calc(2)]
+    assert history[::2] == [make_calc(0), make_calc(2), make_calc(4)]
+    assert history[4:1] == []
+    with pytest.raises(IndexError):
+        history[5]
+
+
+def test_clear_and_copy_is_snapshot():
+    history = CalculationHistory(3, [make_calc(1)])
+    snapshot = history.copy()
+    history.clear()
+    assert history == []
+    assert snapshot == [make_calc(1)]
+
+
+def test_pop_popleft_appendleft():
+    history = CalculationHistory(3, [make_calc(1), make_calc(2), make_calc(3)])
+    with pytest.raises(IndexError, match="full history"):
+        history.appendleft(make_calc(0))
+    assert history.pop() == make_calc(3)
+    assert history.popleft() == make_calc(1)
+    history.appendleft(make_calc(0))
+    assert history == [make_calc(0), make_calc(2)]
+
+
+def test_equality():
+    assert CalculationHistory(3, [make_calc(1)]) == CalculationHistory(5, [make_calc(1)])
+    assert CalculationHistory(3) != [make_calc(1)]
+    assert CalculationHistory(3).__eq__(object()) is NotImplemented
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError, match="max_size must be positive"):
+        CalculationHistory(0)
+
+
+def test_repr():
+    assert repr(CalculationHistory(4, [make_calc(1)])) == "CalculationHistory(max_size=4, size=1)"
+
+
+def make_write_behind_observer(max_dirty_count=2, flush_interval=60):
+    calculator = Mock()
+    calculator.config.auto_save = True
+    calculator.config.durability = 'write_behind'
+    calculator.config.history_write_mode = 'append'
+    calculator.config.flush_interval = flush_interval
+    calculator.config.max_dirty_count = max_dirty_count
+    return calculator, AutoSaveObserver(calculator)
+
+
+def test_write_behind_defers_until_close():
+    calculator, observer = make_write_behind_observer(max_dirty_count=10)
+    observer.update(make_calc(1))
+    observer.update_batch([make_calc(2), make_calc(3)])
+    calculator.append_history.assert_not_called()
+
+    observer.close()
+    calculator.append_history.assert_called_once_with([make_calc(1), make_calc(2), make_calc(3)])
+    observer.close()
+    calculator.append_history.assert_called_once()
+
+
+def test_write_behind_flushes_at_max_dirty_count():
+    calculator, observer = make_write_behind_observer(max_dirty_count=2)
+    flushed = threading.Event()
+    calculator.append_history.side_effect = lambda calcs: flushed.set()
+    observer.update(make_calc(1))
+    observer.update(make_calc(2))
+    assert flushed.wait(5)
+    observer.close()
+
+
+def test_write_behind_flushes_on_interval():
+    calculator, observer = make_write_behind_observer(max_dirty_count=100, flush_interval=0.01)
+    flushed = threading.Event()
+    calculator.save_history.side_effect = lambda: flushed.set()
+    calculator.config.history_write_mode = 'full'
+    observer.update(make_calc(1))
+    assert flushed.wait(5)
+    observer.close()
+
+
+def test_write_behind_flush_error_is_logged(caplog):
+    calculator, observer = make_write_behind_observer(max_dirty_count=1)
+    failed = threading.Event()
+
+    def fail(calcs):
+        failed.set()
+        raise OSError("disk full")
+
+    calculator.append_history.side_effect = fail
+    with caplog.at_level(logging.ERROR):
+        observer.update(make_calc(1))
+        assert failed.wait(5)
+        observer.close()
+    assert "Background history flush failed: disk full" in caplog.text
+
+
+def test_sync_auto_save_disabled():
+    calculator = Mock()
+    calculator.config.auto_save = False
+    calculator.config.durability = 'sync'
+    observer = AutoSaveObserver(calculator)
+    observer.update(make_calc(1))
+    calculator.save_history.assert_not_called()
+    calculator.append_history.assert_not_called()
+
+
+def test_columnar_round_trip_and_eviction():
+    history = ColumnarHistory(3, [make_calc(i) for i in range(5)])
+    assert history == [make_calc(2), make_calc(3), make_calc(4)]
+    assert history.append(make_calc(5)) == make_calc(2)
+    assert history.extend([make_calc(6), make_calc(7)]) == [make_calc(3), make_calc(4)]
+    assert history[0] == make_calc(5)
+    assert history[-1] == make_calc(7)
+    assert history[::2] == [make_calc(5), make_calc(7)]
+    with pytest.raises(IndexError):
+        history[3]
+
+
+def test_columnar_pop_popleft_appendleft():
+    history = ColumnarHistory(3, [make_calc(1), make_calc(2), make_calc(3)])
+    with pytest.raises(IndexError, match="full history"):
+        history.appendleft(make_calc(0))
+    assert history.pop() == make_calc(3)
+    assert history.popleft() == make_calc(1)
+    history.appendleft(make_calc(0))
+    assert history == [make_calc(0), make_calc(2)]
+    history.clear()
+    assert len(history) == 0
+    with pytest.raises(IndexError):
+        history.pop()
+
+
+def test_columnar_grows_past_initial_capacity():
+    calcs = [make_calc(i) for i in range(100)]
+    history = ColumnarHistory(1000)
+    history.appendleft(calcs[0])
+    history.extend(calcs[1:])
+    assert history.copy() == calcs
+    assert list(history) == calcs
+
+
+@pytest.mark.parametrize("value", [
+    Decimal("1e999"),
+    Decimal("-0"),
+    Decimal("NaN"),
+    Decimal("Infinity"),
+    Decimal("123456789012345678901234567890"),
+    Decimal("-0.000000000000000000001"),
+])
+def test_columnar_keeps_exact_decimals(value):
+    calc = Calculation(operation="Addition", operand1=value, operand2=Decimal("0"), result=value)
+    stored = ColumnarHistory(2, [calc])[0]
+    assert str(stored.operand1) == str(value)
+    assert str(stored.result) == str(value)
+
+
+@pytest.mark.parametrize("value", [0, -5, 2 ** 63 - 1, -2 ** 63, 2 ** 63, -10 ** 30])
+def test_columnar_keeps_ints(value):
+    calc = Calculation(operation="Addition", operand1=value, operand2=0, result=value)
+    stored = ColumnarHistory(2, [calc])[0]
+    assert type(stored.operand1) is int and stored.operand1 == value
+    assert type(stored.result) is int and stored.result == value
+
+
+def test_columnar_keeps_timestamps():
+    naive = make_calc(1)
+    aware = make_calc(2)
+    aware.timestamp = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    distant = make_calc(3)
+    distant.timestamp = datetime.datetime(9999, 12, 31, 23, 59, 59, 999999)
+    history = ColumnarHistory(3, [naive, aware, distant])
+    assert [calc.timestamp for calc in history] == [naive.timestamp, aware.timestamp, distant.timestamp]
+
+
+def test_columnar_repr_and_equality():
+    history = ColumnarHistory(4, [make_calc(1)])
+    assert repr(history) == "ColumnarHistory(max_size=4, size=1)"
+    assert history == CalculationHistory(2, [make_calc(1)])
+    with pytest.raises(ValueError, match="max_size must be positive"):
+        ColumnarHistory(0)
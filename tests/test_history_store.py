@@ -0,0 +1,57 @@
+import pytest
+from decimal import Decimal
+
+from app.calculation import Calculation
+from app.history_store import SQLiteHistoryStore
+
+
+def make_calc(operation: str, n: int) -> Calculation:
+    return Calculation(operation=operation, operand1=Decimal(n), operand2=Decimal("2"))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteHistoryStore(tmp_path / "history" / "calculator_history.db")
+    yield store
+    store.close()
+
+
+def test_schema_has_indexes(store):
+    indexes = {row[0] for row in store._conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_calculations_operation", "idx_calculations_timestamp"} <= indexes
+
+
+def test_apply_changes(store):
+    store.apply([
+        ('append', [make_calc("Addition", 1), make_calc("Addition", 2), make_calc("Division", 3)]),
+        ('drop', 1),
+        ('append', [make_calc("Power", 4)]),
+    ])
+    assert store.count() == 3
+    assert store.count(operation="Addition") == 2
+    assert [row['operation'] for row in store.tail(10)] == ["Addition", "Addition", "Power"]
+    assert store.tail(1)[0]['result'] == "16"
+
+    store.apply([('clear', None)])
+    assert store.count() == 0
+
+
+def test_apply_unknown_change(store):
+    with pytest.raises(ValueError, match="Unknown history change"):
+        store.apply([('rename', None)])
+
+
+def test_iter_pages(store):
+    store.apply([('append', [make_calc("Addition" if n % 2 else "Multiplication", n) for n in range(7)])])
+    pages = list(store.iter_pages(page_size=3))
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [row['operand1'] for page in pages for row in page] == [str(n) for n in range(7)]
+
+    filtered = [row for page in store.iter_pages(page_size=2, operation="Addition") for row in page]
+    assert [row['operand1'] for row in filtered] == ["1", "3", "5"]
+
+
+def test_rows_round_trip(store):
+    calc = make_calc("Division", 9)
+    store.apply([('append', [calc])])
+    assert Calculation.from_dict(store.tail(1)[0]) == calc
@@ -0,0 +1,188 @@
+from decimal import Decimal, localcontext
+from fractions import Fraction
+import pytest
+
+from app.numeric_backend import (
+    NUMPY_MIN_ROWS,
+    backend_for,
+    float_array_kernel,
+    format_number,
+    get_backend,
+    integer_result,
+    is_integral,
+)
+from app.operations import NON_FINITE_RESULT, Addition, Division, Multiplication
+
+
+def test_get_backend():
+    assert get_backend('decimal').name == 'decimal'
+    assert get_backend('float').name == 'float'
+    assert get_backend('fraction').name == 'fraction'
+    with pytest.raises(ValueError, match="Unknown numeric backend: mpfr"):
+        get_backend('mpfr')
+
+
+@pytest.mark.parametrize("name, value, expected", [
+    ('decimal', " 1.50 ", Decimal("1.50")),
+    ('float', "0.1", 0.1),
+    ('fraction', "0.1", Fraction(1, 10)),
+    ('fraction', 3, Fraction(3)),
+])
+def test_convert(name, value, expected):
+    number = get_backend(name).convert(value)
+    assert number == expected
+    assert type(number) is type(expected)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("42", 42),
+    (" -7 ", Decimal("-7")),
+    ("007", 7),
+    (12, 12),
+    ("+5", Decimal(5)),
+    ("1.0", Decimal("1.0")),
+    ("1e3", Decimal("1e3")),
+    ("+5e-1", Decimal("0.5")),
+    (".5", Decimal("0.5")),
+    (2.5, Decimal("2.5")),
+    (0.1, Decimal("0.1")),
+    (3.0, 3),
+    (Decimal("1.10"), Decimal("1.10")),
+    ("9" * 29, Decimal("9" * 29)),
+])
+def test_decimal_backend_keeps_integers_as_int(value, expected):
+    number = get_backend('decimal').convert(value)
+    assert number == expected
+    assert type(number) is type(expected)
+
+
+@pytest.mark.parametrize("value", ["--5", "-", "1-2", "1.2.3", "e5", "1e", None, [], True])
+def test_decimal_backend_rejects_malformed_numbers(value):
+    assert get_backend('decimal').try_convert(value) is None
+    with pytest.raises(ValueError):
+        get_backend('decimal').convert(value)
+
+
+def test_integer_result():
+    assert integer_result(10 ** 20) == 10 ** 20
+    assert type(integer_result(10 ** 20)) is int
+    with localcontext() as context:
+        context.prec = 3
+        assert integer_result(999) == 999
+        assert integer_result(12345) == Decimal("1.23E+4")
+        assert isinstance(integer_result(12345), Decimal)
+
+
+@pytest.mark.parametrize("name", ['decimal', 'float', 'fraction'])
+@pytest.mark.parametrize("value", ["abc", "nan", "inf"])
+def test_convert_rejects_non_finite(name, value):
+    with pytest.raises((ValueError, ArithmeticError)):
+        get_backend(name).convert(value)
+
+
+@pytest.mark.parametrize("name", ['float', 'fraction'])
+def test_try_convert_returns_none_for_invalid_input(name):
+    assert get_backend(name).try_convert("abc") is None
+    assert get_backend(name).try_convert("1.5") == get_backend(name).convert("1.5")
+
+
+def test_parse_round_trips_persisted_text():
+    for name, value in (('decimal', Decimal("1.10")), ('float', 0.1), ('fraction', Fraction(1, 3))):
+        assert get_backend(name).parse(str(value)) == value
+
+
+def test_backend_for():
+    assert backend_for(Decimal(1)).name == 'decimal'
+    assert backend_for(1.0).name == 'float'
+    assert backend_for(Fraction(1)).name == 'fraction'
+    assert backend_for(1).name == 'decimal'
+    assert get_backend('decimal').power(2, 10) == Decimal(1024)
+    assert get_backend('decimal').root(27, 3) == Decimal(3)
+
+
+def test_is_integral():
+    assert is_integral(Decimal("2.00"))
+    assert not is_integral(Decimal("2.5"))
+    assert is_integral(-3.0)
+    assert not is_integral(Fraction(1, 3))
+
+
+def test_float_power_and_root():
+    backend = get_backend('float')
+    assert backend.power(2.0, 10.0) == 1024.0
+    assert backend.root(27.0, 3.0) == pytest.approx(3.0)
+    with pytest.raises(ZeroDivisionError):
+        backend.power(0.0, -1.0)
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    (Fraction(2, 3), Fraction(3), Fraction(8, 27)),
+    (Fraction(2, 3), Fraction(-2), Fraction(9, 4)),
+    (Fraction(4, 9), Fraction(3, 2), Fraction(8, 27)),
+    (Fraction(10), Fraction(0), Fraction(1)),
+])
+def test_fraction_power_is_exact(a, b, expected):
+    assert get_backend('fraction').power(a, b) == expected
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    (Fraction(8, 27), Fraction(3), Fraction(2, 3)),
+    (Fraction(1, 4), Fraction(-2), Fraction(2)),
+    (Fraction(8), Fraction(3, 2), Fraction(4)),
+    (Fraction(2 ** 200), Fraction(200), Fraction(2)),
+])
+def test_fraction_root_is_exact(a, b, expected):
+    assert get_backend('fraction').root(a, b) == expected
+
+
+def test_fraction_irrational_root_is_rounded():
+    result = get_backend('fraction').root(Fraction(2), Fraction(2))
+    assert isinstance(result, Fraction)
+    assert Decimal(result.numerator) / Decimal(result.denominator) == Decimal(2).sqrt()
+
+
+def test_fraction_errors():
+    backend = get_backend('fraction')
+    with pytest.raises(ZeroDivisionError):
+        backend.root(Fraction(2), Fraction(0))
+    with pytest.raises(ZeroDivisionError):
+        backend.power(Fraction(0), Fraction(-1))
+    with pytest.raises(OverflowError, match="too large"):
+        backend.power(Fraction(3), Fraction(10 ** 7))
+
+
+def test_format_number():
+    assert format_number(Decimal("2.500")) == "2.5"
+    assert format_number(Fraction(1, 3)) == "1/3"
+    assert format_number(0.5) == "0.5"
+
+
+def test_float_array_kernel():
+    pytest.importorskip('numpy')
+    assert float_array_kernel('Addition')([1.0, 2.0], [0.5, 0.25]) == [1.5, 2.25]
+    assert float_array_kernel('Division') is None
+
+
+def test_execute_many_float_columns_match_row_by_row():
+    a_values = [float(i) * 0.1 for i in range(NUMPY_MIN_ROWS * 2)]
+    b_values = [0.3] * len(a_values)
+    results, errors = Addition().execute_many(a_values, b_values)
+    assert results == [a + b for a, b in zip(a_values, b_values)]
+    assert all(isinstance(result, float) for result in results)
+    assert errors == [None] * len(a_values)
+
+    # Operations that can fail still run row by row
+    results, errors = Division().execute_many(a_values[:NUMPY_MIN_ROWS], [0.0] * NUMPY_MIN_ROWS)
+    assert results == [None] * NUMPY_MIN_ROWS
+
+
+def test_execute_many_float_columns_reject_overflow():
+    a_values = [1e200] * NUMPY_MIN_ROWS + [2.0]
+    b_values = [1e200] * NUMPY_MIN_ROWS + [3.0]
+    results, errors = Multiplication().execute_many(a_values, b_values)
+    assert results == [None] * NUMPY_MIN_ROWS + [6.0]
+    assert errors == [NON_FINITE_RESULT] * NUMPY_MIN_ROWS + [None]
+    # The row kernels reject the same rows
+    results, errors = Multiplication().execute_many(a_values[-2:], b_values[-2:])
+    assert results == [None, 6.0]
+    assert errors == [NON_FINITE_RESULT, None]
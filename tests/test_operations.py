@@ -1,5 +1,5 @@
 import pytest
-from decimal import Decimal
+from decimal import Decimal, localcontext
 from typing import Any, Dict, Type
 
 from app.exception import ValidationError
@@ -16,6 +16,14 @@ from app.operations import (
     AbsoluteDifference,
     Percent,
     OperationFactory,
+    absolute_difference,
+    add,
+    divide,
+    integer_divide,
+    modulus,
+    multiply,
+    percent,
+    subtract,
 )
 
 
@@ -30,6 +38,44 @@ class TestOperation:
 
         assert str(TestOp()) == "TestOp"
 
+    def test_execute_many(self):
+        """Test column execution reports per-row errors."""
+        results, errors = Division().execute_many(
+            [Decimal("6"), Decimal("1"), Decimal("9")],
+            [Decimal("2"), Decimal("0"), Decimal("3")],
+        )
+        assert results == [Decimal("3"), None, Decimal("3")]
+        assert errors == [None, "Division by zero is not allowed", None]
+
+
+@pytest.mark.parametrize("kernel, a, b", [
+    (kernel, a, b)
+    for kernel in (add, subtract, multiply, divide,
+                   modulus, integer_divide, percent, absolute_difference)
+    for a, b in ((7, 2), (-7, 2), (7, -2), (-7, -2), (6, 3), (-6, 4))
+])
+def test_integer_kernels_match_decimal(kernel, a, b):
+    """Int operands give the same results as Decimal operands, including signs."""
+    assert kernel(a, b) == kernel(Decimal(a), Decimal(b))
+
+
+def test_integer_kernels_keep_int_within_precision():
+    assert type(multiply(123456, 789)) is int
+    assert divide(1, 3) == Decimal(1) / Decimal(3)
+    with localcontext() as context:
+        context.prec = 5
+        # Rounded like the Decimal product once past the precision
+        assert multiply(123456, 789) == Decimal('9.7407E+7')
+        results, errors = Addition().execute_many([99999, 1], [1, 1])
+        assert results == [Decimal('1.0000E+5'), 2]
+
+
+def test_execute_many_int_columns():
+    results, errors = Multiplication().execute_many([2, -3, 10 ** 12], [5, 4, 10 ** 12])
+    assert results == [10, -12, 10 ** 24]
+    assert all(type(result) is int for result in results)
+    assert errors == [None] * 3
+
 
 class BaseOperationTest:
     """Base test class for all operations."""
@@ -149,13 +195,22 @@ class TestPower(BaseOperationTest):
         "one_exponent": {"a": "5", "b": "1", "expected": "5"},
         "decimal_base": {"a": "2.5", "b": "2", "expected": "6.25"},
         "zero_base": {"a": "0", "b": "5", "expected": "0"},
+        "negative_base": {"a": "-2", "b": "3", "expected": "-8"},
+        "fractional_exponent": {"a": "4", "b": "1.5", "expected": "8"},
+        "exact_large_power": {"a": "3", "b": "40", "expected": "12157665459056928801"},
     }
     invalid_test_cases = {
         "negative_exponent": {
             "a": "2",
             "b": "-3",
             "error": ValidationError,
-            "message": "Negative exponents not supported"
+            "message": "Negative exponents are not supported"
+        },
+        "negative_base_fractional_exponent": {
+            "a": "-8",
+            "b": "0.5",
+            "error": ValidationError,
+            "message": "Fractional exponents of negative numbers are not supported"
         },
     }
 
@@ -169,6 +224,8 @@ class TestRoot(BaseOperationTest):
         "cube_root": {"a": "27", "b": "3", "expected": "3"},
         "fourth_root": {"a": "16", "b": "4", "expected": "2"},
         "decimal_root": {"a": "2.25", "b": "2", "expected": "1.5"},
+        "fractional_degree": {"a": "8", "b": "1.5", "expected": "4"},
+        "negative_degree": {"a": "8", "b": "-3", "expected": "0.5"},
     }
     invalid_test_cases = {
         "negative_base": {
@@ -225,6 +282,22 @@ class TestIntDivison(BaseOperationTest):
         },
     }
 
+@pytest.mark.parametrize("backend", ['decimal', 'float', 'fraction'])
+@pytest.mark.parametrize("a, b, remainder, quotient", [
+    ("-7", "2", -1, -3),
+    ("7", "-2", 1, -3),
+    ("-7", "-2", -1, 3),
+    ("-3.5", "2", -1.5, -1),
+])
+def test_modulus_and_int_division_truncate_on_every_backend(backend, a, b, remainder, quotient):
+    """Every numeric backend truncates towards zero, like Decimal."""
+    from app.numeric_backend import get_backend
+
+    numbers = get_backend(backend)
+    a_value, b_value = numbers.convert(a), numbers.convert(b)
+    assert Modulus().execute(a_value, b_value) == numbers.convert(str(remainder))
+    assert Int_Division().execute(a_value, b_value) == quotient
+
 class TestAbsoluteDifference(BaseOperationTest):
     """Test Absolute Difference operation."""
 
@@ -284,6 +357,22 @@ class TestOperationFactory:
             operation = OperationFactory.create_operation(op_name.upper())
             assert isinstance(operation, op_class)
 
+    def test_create_operation_returns_shared_instance(self):
+        """Test that the factory hands out one instance per operation type."""
+        operation = OperationFactory.create_operation('power')
+        assert OperationFactory.create_operation('power') is operation
+        assert OperationFactory.create_operation('POWER') is operation
+
+    def test_resolve_many(self):
+        """Test resolving a column of operation types to codes."""
+        codes, operations = OperationFactory.resolve_many(['add', 'mod', 'ADD', 'nope', 'mod'])
+        assert codes == [0, 1, 0, -1, 1]
+        assert operations == [
+            OperationFactory.create_operation('add'),
+            OperationFactory.create_operation('mod'),
+        ]
+        assert OperationFactory.resolve_many([]) == ([], [])
+
     def test_create_invalid_operation(self):
         """Test creation of invalid operation raises error."""
         with pytest.raises(ValueError, match="Unknown operation: invalid_op"):
@@ -298,6 +387,15 @@ class TestOperationFactory:
         OperationFactory.register_operation("new_op", NewOperation)
         operation = OperationFactory.create_operation("new_op")
         assert isinstance(operation, NewOperation)
+        assert OperationFactory.create_operation("new_op") is operation
+
+        # Registering a replacement drops the shared instance of the old class
+        class ReplacementOperation(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return b
+
+        OperationFactory.register_operation("NEW_OP", ReplacementOperation)
+        assert isinstance(OperationFactory.create_operation("new_op"), ReplacementOperation)
 
     def test_register_invalid_operation(self):
         """Test registering an invalid operation class raises error."""
@@ -0,0 +1,82 @@
+from decimal import Decimal
+from io import StringIO
+import pytest
+from unittest.mock import patch, PropertyMock
+
+from app.bulk_compute import compute_csv, compute_rows
+from app.calculator import Calculator
+from app.calculator_config import CalculatorConfig
+from app.parallel_engine import ProcessPoolEngine
+
+
+ROWS = [
+    ['add', '1', '2'],
+    ['divide', '1', '0'],
+    ['power', '2', '10'],
+    ['unknown', '1', '2'],
+    ['multiply', '1.5', '4'],
+    ['subtract', 'x', '1'],
+    ['root', '9', '2'],
+]
+
+
+@pytest.fixture
+def config(tmp_path):
+    return CalculatorConfig(base_dir=tmp_path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_map_chunks_keeps_input_order(config, workers):
+    with ProcessPoolEngine(config, workers=workers, chunk_size=2) as engine:
+        chunks = list(engine.map_chunks(ROWS))
+    assert [row for chunk, _, _ in chunks for row in chunk] == ROWS
+    assert [outcome for _, outcomes, _ in chunks for outcome in outcomes] == compute_rows(ROWS, config)
+    calculations = [calc for _, _, calcs in chunks for calc in calcs]
+    assert [str(calc.result) for calc in calculations] == ['3', '1024', '6.0', '3']
+
+
+def test_map_chunks_without_calculations(config):
+    with ProcessPoolEngine(config, workers=2, chunk_size=3) as engine:
+        assert all(calcs == [] for _, _, calcs in engine.map_chunks(ROWS, record=False))
+
+
+def test_compute_csv_matches_sequential(config):
+    text = "operation,operand1,operand2\n" + "".join(",".join(row) + "\n" for row in ROWS * 5)
+    expected = StringIO()
+    compute_csv(StringIO(text), expected, config)
+    output = StringIO()
+    with ProcessPoolEngine(config, workers=2, chunk_size=4) as engine:
+        summary = engine.compute_csv(StringIO(text), output)
+    assert output.getvalue() == expected.getvalue()
+    assert (summary.rows, summary.errors) == (35, 15)
+
+
+def test_engine_defaults_from_config(tmp_path):
+    config = CalculatorConfig(base_dir=tmp_path, bulk_workers=3, bulk_chunk_size=7)
+    engine = ProcessPoolEngine(config)
+    assert (engine.workers, engine.chunk_size) == (3, 7)
+    engine.close()
+
+
+def test_perform_bulk_records_one_batch(tmp_path):
+    config = CalculatorConfig(base_dir=tmp_path, auto_save=False)
+    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
+         patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
+         patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
+         patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
+        mock_log_dir.return_value = tmp_path / "logs"
+        mock_log_file.return_value = tmp_path / "logs/calculator.log"
+        mock_history_dir.return_value = tmp_path / "history"
+        mock_history_file.return_value = tmp_path / "history/calculator_history.csv"
+        calculator = Calculator(config=config)
+
+    batch = calculator.perform_bulk(ROWS, workers=2, chunk_size=3)
+    assert batch.results == [Decimal('3'), None, Decimal('1024'), None, Decimal('6.0'), None, Decimal('3')]
+    assert batch.error_mask == [False, True, False, True, False, True, False]
+    assert batch.errors[1] == "Division by zero is not allowed"
+    assert [calc.operation for calc in calculator.history] == [
+        'Addition', 'Power', 'Multiplication', 'Root'
+    ]
+    assert len(calculator.undo_stack) == 1
+    calculator.undo()
+    assert len(calculator.history) == 0
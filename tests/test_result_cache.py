@@ -0,0 +1,80 @@
+from decimal import Decimal, ROUND_DOWN, localcontext
+import threading
+
+from app.calculation import Calculation
+from app.result_cache import CacheStats, ResultCache
+
+
+def test_get_and_put():
+    cache = ResultCache(maxsize=2)
+    assert cache.get('Power', Decimal('2'), Decimal('3')) is None
+    cache.put('Power', Decimal('2'), Decimal('3'), Decimal('8'))
+    assert cache.get('Power', Decimal('2'), Decimal('3')) == Decimal('8')
+    assert cache.get('Root', Decimal('2'), Decimal('3')) is None
+    assert cache.stats() == CacheStats(hits=1, misses=2, evictions=0, size=1, maxsize=2)
+
+def test_operands_are_normalized():
+    cache = ResultCache(maxsize=2)
+    cache.put('Addition', Decimal('2.0'), Decimal('1'), Decimal('3.0'))
+    assert cache.get('Addition', Decimal('2'), Decimal('1.00')) == Decimal('3')
+
+def test_results_are_keyed_on_the_decimal_context():
+    cache = ResultCache(maxsize=4)
+    cache.put('Division', Decimal('1'), Decimal('3'), Decimal(1) / Decimal(3))
+    with localcontext() as context:
+        context.prec = 10
+        assert cache.get('Division', Decimal('1'), Decimal('3')) is None
+        cache.put('Division', Decimal('1'), Decimal('3'), Decimal(1) / Decimal(3))
+        assert cache.get('Division', Decimal('1'), Decimal('3')) == Decimal('0.3333333333')
+        context.rounding = ROUND_DOWN
+        assert cache.get('Division', Decimal('1'), Decimal('3')) is None
+    assert len(cache) == 2
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResultCache(maxsize=2)
+    cache.put('Addition', Decimal('1'), Decimal('1'), Decimal('2'))
+    cache.put('Addition', Decimal('2'), Decimal('2'), Decimal('4'))
+    # Using the first entry makes the second the least recently used
+    cache.get('Addition', Decimal('1'), Decimal('1'))
+    cache.put('Addition', Decimal('3'), Decimal('3'), Decimal('6'))
+    assert cache.get('Addition', Decimal('2'), Decimal('2')) is None
+    assert cache.get('Addition', Decimal('1'), Decimal('1')) == Decimal('2')
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+def test_warm_keeps_newest_calculations():
+    cache = ResultCache(maxsize=2)
+    size = cache.warm([
+        Calculation('Addition', Decimal(i), Decimal(i)) for i in range(3)
+    ])
+    assert size == 2
+    assert cache.get('Addition', Decimal('0'), Decimal('0')) is None
+    assert cache.get('Addition', Decimal('2'), Decimal('2')) == Decimal('4')
+    assert cache.stats().hit_rate == 0.5
+
+def test_clear_resets_counters():
+    cache = ResultCache(maxsize=1)
+    cache.put('Addition', Decimal('1'), Decimal('1'), Decimal('2'))
+    cache.get('Addition', Decimal('1'), Decimal('1'))
+    cache.clear()
+    assert cache.stats() == CacheStats(hits=0, misses=0, evictions=0, size=0, maxsize=1)
+    assert cache.stats().hit_rate == 0.0
+
+def test_thread_safe_cache_shared_by_threads():
+    cache = ResultCache(maxsize=50, thread_safe=True)
+
+    def worker():
+        for i in range(1000):
+            a = Decimal(i % 100)
+            if cache.get('Addition', a, a) is None:
+                cache.put('Addition', a, a, a + a)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats.hits + stats.misses == 4000
+    assert stats.size == 50
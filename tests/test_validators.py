@@ -1,8 +1,9 @@
 import pytest
 from decimal import Decimal
+from fractions import Fraction
 from app.calculator_config import CalculatorConfig
 from app.exception import ValidationError
-from app.input_validators import InputValidator  # adjust as per your file structure
+from app.input_validators import InputValidator, ValidatedColumn  # adjust as per your file structure
 
 # Sample configuration with a max input value of 1 million for testing purposes
 config = CalculatorConfig(max_input_value=Decimal('1000000'))
@@ -71,3 +72,66 @@ def test_validate_number_none_value():
 def test_validate_number_non_numeric_type():
     with pytest.raises(ValidationError, match="Invalid number format: "):
         InputValidator.validate_number([], config)
+
+def test_validate_number_float_backend():
+    float_config = CalculatorConfig(max_input_value=Decimal('1000000'), numeric_backend='float')
+    assert InputValidator.validate_number(" 0.1 ", float_config) == 0.1
+    with pytest.raises(ValidationError, match="Invalid number format: inf"):
+        InputValidator.validate_number("inf", float_config)
+    with pytest.raises(ValidationError, match="Value exceeds maximum allowed"):
+        InputValidator.validate_number("2e6", float_config)
+
+def test_validate_number_fraction_backend():
+    fraction_config = CalculatorConfig(max_input_value=Decimal('1000000'), numeric_backend='fraction')
+    assert InputValidator.validate_number("0.1", fraction_config) == Fraction(1, 10)
+    assert InputValidator.validate_number("1/3", fraction_config) == Fraction(1, 3)
+    with pytest.raises(ValidationError, match="Invalid number format: abc"):
+        InputValidator.validate_number("abc", fraction_config)
+
+def test_validate_number_type_dispatch():
+    assert InputValidator.validate_number(Decimal("2.50"), config) == Decimal("2.5")
+    assert str(InputValidator.validate_number(Decimal("2.50"), config)) == "2.5"
+    assert InputValidator.validate_number(0.1, config) == Decimal("0.1")
+    assert type(InputValidator.validate_number(42, config)) is int
+    assert InputValidator.validate_number("+1.5e2", config) == Decimal("150")
+    with pytest.raises(ValidationError, match="Invalid number format: True"):
+        InputValidator.validate_number(True, config)
+    with pytest.raises(ValidationError, match="Invalid number format: NaN"):
+        InputValidator.validate_number(Decimal("NaN"), config)
+
+def test_validate_number_integer_bound():
+    bounded = CalculatorConfig(max_input_value=Decimal('999.9'))
+    assert InputValidator.validate_number("999", bounded) == 999
+    assert InputValidator.validate_number("-999", bounded) == -999
+    with pytest.raises(ValidationError, match="Value exceeds maximum allowed: 999.9"):
+        InputValidator.validate_number("1000", bounded)
+
+def test_validate_many():
+    column = InputValidator.validate_many(["1", " 2.50 ", "abc", "2e6", 3, None], config)
+    assert isinstance(column, ValidatedColumn)
+    assert column.values == [1, Decimal("2.5"), None, None, 3, None]
+    assert column.error_mask == [False, False, True, True, False, True]
+    assert column.errors == [
+        None,
+        None,
+        "Invalid number format: abc",
+        "Value exceeds maximum allowed: 1000000",
+        None,
+        "Invalid number format: None",
+    ]
+
+def test_validate_many_matches_validate_number():
+    values = ["7", "-0.5", "1e3", "x", "", 2.25, Decimal("-3.10"), "1/3"]
+    column = InputValidator.validate_many(values, config)
+    for value, number, error in zip(values, column.values, column.errors):
+        try:
+            assert InputValidator.validate_number(value, config) == number
+            assert error is None
+        except ValidationError as e:
+            assert str(e) == error
+
+def test_validate_many_fraction_backend():
+    fraction_config = CalculatorConfig(max_input_value=Decimal('1000000'), numeric_backend='fraction')
+    column = InputValidator.validate_many(["1/3", "abc"], fraction_config)
+    assert column.values == [Fraction(1, 3), None]
+    assert column.error_mask == [False, True]